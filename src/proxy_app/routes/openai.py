@@ -24,6 +24,7 @@ from fastapi.responses import StreamingResponse, JSONResponse
 
 import litellm
 from rotator_library import RotatingClient
+from rotator_library.client.rotating_client import TOKEN_COUNT_MODES
 
 from proxy_app.dependencies import (
     get_rotating_client,
@@ -262,13 +263,20 @@ async def token_count(
         data = await request.json()
         model = data.get("model")
         messages = data.get("messages")
+        mode = data.get("mode", "exact")
 
         if not model or not messages:
             raise HTTPException(
                 status_code=400, detail="'model' and 'messages' are required."
             )
+        if mode not in TOKEN_COUNT_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"'mode' must be one of: {', '.join(TOKEN_COUNT_MODES)}.",
+            )
 
-        count = client.token_count(**data)
+        # Forward only the fields token_count understands, not the raw body
+        count = client.token_count(model=model, messages=messages, mode=mode)
         return {"token_count": count}
 
     except HTTPException:
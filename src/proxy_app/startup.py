@@ -13,20 +13,50 @@ import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
+import aiofiles
 from fastapi import FastAPI
 
-from rotator_library import RotatingClient, PROVIDER_PLUGINS
-from rotator_library.credential_manager import CredentialManager
-from rotator_library.background_refresher import BackgroundRefresher
-from rotator_library.model_info_service import init_model_info_service
-from proxy_app.batch_manager import EmbeddingBatcher
-
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent credential file reads during the startup pre-scan
+METADATA_READ_CONCURRENCY = 32
+
+# Default bound on concurrent OAuth credential initializations at startup
+# (override with OAUTH_INIT_CONCURRENCY)
+OAUTH_INIT_CONCURRENCY = 8
+
+# Seconds before a credential metadata read/write is abandoned (e.g. stalled
+# network or cloud-sync mount)
+METADATA_IO_TIMEOUT = 10
+
+# LRU of credential emails keyed by (resolved path, mtime_ns, size)
+METADATA_CACHE_SIZE = 64
+_METADATA_CACHE: "OrderedDict[Tuple[str, int, int], Optional[str]]" = OrderedDict()
+
+_IGNORE_MODELS_PREFIX = "IGNORE_MODELS_"
+_IGNORE_MODELS_PREFIX_LEN = len(_IGNORE_MODELS_PREFIX)
+_WHITELIST_MODELS_PREFIX = "WHITELIST_MODELS_"
+_WHITELIST_MODELS_PREFIX_LEN = len(_WHITELIST_MODELS_PREFIX)
+_MAX_CONCURRENT_PREFIX = "MAX_CONCURRENT_REQUESTS_PER_KEY_"
+_MAX_CONCURRENT_PREFIX_LEN = len(_MAX_CONCURRENT_PREFIX)
+
+_NO_CREDENTIALS_BANNER = "\n".join(
+    [
+        "=" * 70,
+        "⚠️  NO PROVIDER CREDENTIALS CONFIGURED",
+        "The proxy is running but cannot serve any LLM requests.",
+        "Launch the credential tool to add API keys or OAuth credentials.",
+        "  • Executable: Run with --add-credential flag",
+        "  • Source: python src/proxy_app/main.py --add-credential",
+        "=" * 70,
+    ]
+)
+
 
 def _mask_api_key(key: str) -> str:
     """Mask API key for safe display in logs. Shows first 4 and last 4 chars."""
@@ -44,79 +74,93 @@ async def lifespan(app: FastAPI, data_dir: Optional[Path] = None):
         app: The FastAPI application instance
         data_dir: Optional data directory path
     """
-    from rotator_library.utils.paths import get_default_root
+    # Heavy imports are deferred so CLI entry points that only need the
+    # helpers in this module do not pay the rotator_library/litellm import cost.
+    from rotator_library import RotatingClient
+    from rotator_library.credential_manager import CredentialManager
+    from rotator_library.model_info_service import init_model_info_service
+    from rotator_library.utils.paths import get_cache_dir, get_default_root
+    from proxy_app.batch_manager import EmbeddingBatcher
 
     root_dir = data_dir or get_default_root()
 
-    # Perform skippable OAuth initialization at startup
-    skip_oauth_init = os.getenv("SKIP_OAUTH_INIT_CHECK", "false").lower() == "true"
-
-    # Credential discovery
-    cred_manager = CredentialManager(os.environ)
-    oauth_credentials = cred_manager.discover_and_prepare()
-
-    if not skip_oauth_init and oauth_credentials:
-        oauth_credentials = await _process_oauth_credentials(oauth_credentials)
-
-    # Load provider-specific params
-    litellm_provider_params = {
-        "gemini_cli": {"project_id": os.getenv("GEMINI_CLI_PROJECT_ID")}
-    }
-
-    # Load global timeout
-    global_timeout = int(os.getenv("GLOBAL_TIMEOUT", "30"))
-
-    # Build API keys dict
-    api_keys = _discover_api_keys()
-
-    # Load model filters
-    ignore_models = _load_model_filters("IGNORE_MODELS_")
-    whitelist_models = _load_model_filters("WHITELIST_MODELS_")
-
-    # Load max concurrent per key
-    max_concurrent = _load_max_concurrent()
-
-    # Initialize client
-    client = RotatingClient(
-        api_keys=api_keys,
-        oauth_credentials=oauth_credentials,
-        configure_logging=True,
-        global_timeout=global_timeout,
-        litellm_provider_params=litellm_provider_params,
-        ignore_models=ignore_models,
-        whitelist_models=whitelist_models,
-        enable_request_logging=os.getenv("ENABLE_REQUEST_LOGGING", "false").lower() == "true",
-        max_concurrent_requests_per_key=max_concurrent,
+    # Start model info service early; it has no dependency on credentials and
+    # its pricing fetch overlaps with the rest of startup. The last pricing
+    # snapshot on disk is served until the background refresh lands.
+    model_info_task = asyncio.create_task(
+        init_model_info_service(
+            cache_file=get_cache_dir(root_dir) / "model_info.json"
+        )
     )
 
-    await client.initialize_usage_managers()
-
-    # Start background refresher
-    client.background_refresher.start()
-    app.state.rotating_client = client
-
-    # Warn if no credentials
-    if not client.all_credentials:
-        logging.warning("=" * 70)
-        logging.warning("⚠️  NO PROVIDER CREDENTIALS CONFIGURED")
-        logging.warning("The proxy is running but cannot serve any LLM requests.")
-        logging.warning("Launch the credential tool to add API keys or OAuth credentials.")
-        logging.warning("  • Executable: Run with --add-credential flag")
-        logging.warning("  • Source: python src/proxy_app/main.py --add-credential")
-        logging.warning("=" * 70)
-
-    # Initialize embedding batcher
-    USE_EMBEDDING_BATCHER = os.getenv("USE_EMBEDDING_BATCHER", "false").lower() == "true"
-    if USE_EMBEDDING_BATCHER:
-        batcher = EmbeddingBatcher(client=client)
-        app.state.embedding_batcher = batcher
-        logging.info("RotatingClient and EmbeddingBatcher initialized.")
-    else:
-        app.state.embedding_batcher = None
-        logging.info("RotatingClient initialized (EmbeddingBatcher disabled).")
+    # Everything up to the await below can raise; don't leave the model info
+    # task (and its refresh worker) running unowned if it does.
+    try:
+        # Perform skippable OAuth initialization at startup
+        skip_oauth_init = os.getenv("SKIP_OAUTH_INIT_CHECK", "false").lower() == "true"
+
+        # Credential discovery
+        cred_manager = CredentialManager(os.environ)
+        oauth_credentials = await cred_manager.adiscover_and_prepare()
+
+        if not skip_oauth_init and oauth_credentials:
+            oauth_credentials = await _process_oauth_credentials(oauth_credentials)
+
+        # Load provider-specific params
+        litellm_provider_params = {
+            "gemini_cli": {"project_id": os.getenv("GEMINI_CLI_PROJECT_ID")}
+        }
+
+        # Load global timeout
+        global_timeout = int(os.getenv("GLOBAL_TIMEOUT", "30"))
+
+        # Build API keys, model filters and max concurrent per key in one env pass
+        api_keys, ignore_models, whitelist_models, max_concurrent = _scan_env()
+
+        # Initialize client
+        client = RotatingClient(
+            api_keys=api_keys,
+            oauth_credentials=oauth_credentials,
+            configure_logging=True,
+            global_timeout=global_timeout,
+            litellm_provider_params=litellm_provider_params,
+            ignore_models=ignore_models,
+            whitelist_models=whitelist_models,
+            enable_request_logging=os.getenv("ENABLE_REQUEST_LOGGING", "false").lower() == "true",
+            max_concurrent_requests_per_key=max_concurrent,
+        )
+
+        await client.initialize_usage_managers()
+
+        # Start background refresher
+        client.background_refresher.start()
+        app.state.rotating_client = client
+
+        # Warn if no credentials
+        if not client.all_credentials:
+            logging.warning(_NO_CREDENTIALS_BANNER)
+
+        # Initialize embedding batcher
+        USE_EMBEDDING_BATCHER = os.getenv("USE_EMBEDDING_BATCHER", "false").lower() == "true"
+        if USE_EMBEDDING_BATCHER:
+            batcher = EmbeddingBatcher(client=client)
+            app.state.embedding_batcher = batcher
+            logging.info("RotatingClient and EmbeddingBatcher initialized.")
+        else:
+            app.state.embedding_batcher = None
+            logging.info("RotatingClient initialized (EmbeddingBatcher disabled).")
+    except BaseException:
+        model_info_task.cancel()
+        try:
+            model_info_service = await model_info_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        else:
+            await model_info_service.stop()
+        raise
 
-    # Start model info service
-    model_info_service = await init_model_info_service()
+    # Wait for the model info service started at the top of lifespan
+    model_info_service = await model_info_task
     app.state.model_info_service = model_info_service
     logging.info("Model info service started (fetching pricing data in background).")
 
@@ -142,13 +186,38 @@ async def _process_oauth_credentials(
     oauth_credentials: Dict[str, List[str]],
 ) -> Dict[str, List[str]]:
     """Process OAuth credentials with deduplication."""
-    processed_emails: Dict[str, Dict[str, str]] = {}
+    from rotator_library import PROVIDER_PLUGINS
+    from rotator_library.utils.shared_http import shared_http_client
+
+    # (email, provider) -> path of the first credential seen for that pair
+    seen_accounts: Dict[Tuple[str, str], str] = {}
     credentials_to_initialize: Dict[str, List[str]] = {}
     final_oauth_credentials: Dict[str, List[str]] = {}
 
     logging.info("Starting OAuth credential validation and deduplication...")
 
     # Pass 1: Pre-scan for duplicates
+    # Read all file-based metadata concurrently, then dedupe sequentially.
+    read_semaphore = asyncio.Semaphore(METADATA_READ_CONCURRENCY)
+
+    async def read_email(path: str) -> Optional[str]:
+        async with read_semaphore:
+            return await _read_credential_email(path)
+
+    scan_jobs = [
+        (provider, path)
+        for provider, paths in oauth_credentials.items()
+        for path in paths
+        if not path.startswith("env://")
+    ]
+    scanned_emails = await asyncio.gather(
+        *(read_email(path) for _, path in scan_jobs)
+    )
+    email_by_path = {
+        (provider, path): result
+        for (provider, path), result in zip(scan_jobs, scanned_emails)
+    }
+
     for provider, paths in oauth_credentials.items():
         if provider not in credentials_to_initialize:
             credentials_to_initialize[provider] = []
@@ -157,21 +226,18 @@ async def _process_oauth_credentials(
                 credentials_to_initialize[provider].append(path)
                 continue
 
-            email, _ = await _read_credential_metadata(path)
+            email = email_by_path[(provider, path)]
 
             if email:
-                if email not in processed_emails:
-                    processed_emails[email] = {}
-
-                if provider in processed_emails[email]:
-                    original_path = processed_emails[email][provider]
+                account = (email, provider)
+                original_path = seen_accounts.get(account)
+                if original_path is not None:
                     logging.warning(
                         f"Duplicate for '{email}' on '{provider}' found in pre-scan: "
                         f"'{Path(path).name}'. Original: '{Path(original_path).name}'. Skipping."
                     )
                     continue
-                else:
-                    processed_emails[email][provider] = path
+                seen_accounts[account] = path
                 credentials_to_initialize[provider].append(path)
             elif email is None:
                 logging.warning(
@@ -180,21 +246,26 @@ async def _process_oauth_credentials(
                 credentials_to_initialize[provider].append(path)
 
     # Pass 2: Parallel initialization
+    # Bound concurrent initializations so large credential sets don't stampede
+    # upstream OAuth endpoints with simultaneous refreshes.
+    init_semaphore = asyncio.Semaphore(_oauth_init_concurrency())
+
     async def process_credential(provider: str, path: str, provider_instance):
         """Process a single credential: initialize and fetch user info."""
-        try:
-            await provider_instance.initialize_token(path)
+        async with init_semaphore:
+            try:
+                await provider_instance.initialize_token(path)
 
-            if not hasattr(provider_instance, "get_user_info"):
-                return (provider, path, None, None)
+                if not hasattr(provider_instance, "get_user_info"):
+                    return (provider, path, None, None)
 
-            user_info = await provider_instance.get_user_info(path)
-            email = user_info.get("email")
-            return (provider, path, email, None)
+                user_info = await provider_instance.get_user_info(path)
+                email = user_info.get("email")
+                return (provider, path, email, None)
 
-        except Exception as e:
-            logging.error(f"Failed to process OAuth token for {provider} at '{path}': {e}")
-            return (provider, path, None, e)
+            except Exception as e:
+                logging.error(f"Failed to process OAuth token for {provider} at '{path}': {e}")
+                return (provider, path, None, e)
 
     tasks = []
     for provider, paths in credentials_to_initialize.items():
@@ -210,7 +281,9 @@ async def _process_oauth_credentials(
         for path in paths:
             tasks.append(process_credential(provider, path, provider_instance))
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # One HTTP connection pool for all token refresh / user-info calls
+    async with shared_http_client():
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Pass 3: Sequential deduplication and final assembly
     for result in results:
@@ -237,18 +310,16 @@ async def _process_oauth_credentials(
             continue
 
         # Deduplication check
-        if email not in processed_emails:
-            processed_emails[email] = {}
-
-        if provider in processed_emails[email] and processed_emails[email][provider] != path:
-            original_path = processed_emails[email][provider]
+        account = (email, provider)
+        original_path = seen_accounts.get(account)
+        if original_path is not None and original_path != path:
             logging.warning(
                 f"Duplicate for '{email}' on '{provider}' found post-init: "
                 f"'{Path(path).name}'. Original: '{Path(original_path).name}'. Skipping."
             )
             continue
         else:
-            processed_emails[email][provider] = path
+            seen_accounts[account] = path
             if provider not in final_oauth_credentials:
                 final_oauth_credentials[provider] = []
             final_oauth_credentials[provider].append(path)
@@ -261,68 +332,136 @@ async def _process_oauth_credentials(
     return final_oauth_credentials
 
 
-async def _read_credential_metadata(path: str) -> tuple:
-    """Read credential file and extract email from metadata."""
+async def _read_json_file(path: str) -> dict:
+    """Read and parse a JSON file without blocking the event loop."""
+    async with aiofiles.open(path, "r") as f:
+        return json.loads(await f.read())
+
+
+async def _read_credential_email(path: str) -> Optional[str]:
+    """
+    Read a credential file and return the email from its metadata.
+
+    Results are cached by (resolved path, mtime, size), so unchanged files
+    are not re-read or re-parsed on repeated scans. Only the email is kept,
+    so the cache never holds (or hands out) the credential data itself.
+    """
+
+    async def _load() -> Optional[str]:
+        resolved = os.path.realpath(path)
+        stat = await asyncio.to_thread(os.stat, resolved)
+        # Size catches rewrites that land within one mtime tick
+        cache_key = (resolved, stat.st_mtime_ns, stat.st_size)
+        if cache_key in _METADATA_CACHE:
+            _METADATA_CACHE.move_to_end(cache_key)
+            return _METADATA_CACHE[cache_key]
+
+        data = await _read_json_file(resolved)
+        email = data.get("_proxy_metadata", {}).get("email")
+
+        _METADATA_CACHE[cache_key] = email
+        if len(_METADATA_CACHE) > METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+        return email
+
     try:
-        def _read_file():
-            with open(path, "r") as f:
-                return json.load(f)
-        data = await asyncio.to_thread(_read_file)
-        metadata = data.get("_proxy_metadata", {})
-        return metadata.get("email"), data
+        return await asyncio.wait_for(_load(), timeout=METADATA_IO_TIMEOUT)
+    except asyncio.TimeoutError:
+        logging.warning(
+            f"Timed out reading metadata from '{path}' after {METADATA_IO_TIMEOUT}s."
+        )
+        return None
     except (FileNotFoundError, json.JSONDecodeError):
-        return None, None
+        return None
 
 
 async def _update_metadata_file(path: str, email: str):
     """Update credential metadata file with email and timestamp."""
+    from rotator_library.utils.resilient_io import safe_write_json
+
+    async def _do_update():
+        # Resolve symlinks so the atomic rename replaces the real file
+        resolved = os.path.realpath(path)
+        data = await _read_json_file(resolved)
+        metadata = data.get("_proxy_metadata", {})
+        metadata["email"] = email
+        metadata["last_check_timestamp"] = time.time()
+        data["_proxy_metadata"] = metadata
+        # Temp file + rename, so a crash mid-write never leaves a truncated
+        # credential file behind
+        if not await asyncio.to_thread(
+            safe_write_json, resolved, data, logger, secure_permissions=True
+        ):
+            logging.error(f"Failed to write metadata for '{path}'.")
+
     try:
-        def _do_update():
-            with open(path, "r+") as f:
-                data = json.load(f)
-                metadata = data.get("_proxy_metadata", {})
-                metadata["email"] = email
-                metadata["last_check_timestamp"] = time.time()
-                data["_proxy_metadata"] = metadata
-                f.seek(0)
-                json.dump(data, f, indent=2)
-                f.truncate()
-        await asyncio.to_thread(_do_update)
+        await asyncio.wait_for(_do_update(), timeout=METADATA_IO_TIMEOUT)
+    except asyncio.TimeoutError:
+        logging.error(
+            f"Timed out updating metadata for '{path}' after {METADATA_IO_TIMEOUT}s."
+        )
     except Exception as e:
         logging.error(f"Failed to update metadata for '{path}': {e}")
 
 
-def _discover_api_keys() -> Dict[str, List[str]]:
-    """Discover API keys from environment variables."""
-    api_keys = {}
+def _scan_env() -> Tuple[
+    Dict[str, List[str]],
+    Dict[str, FrozenSet[str]],
+    Dict[str, FrozenSet[str]],
+    Dict[str, int],
+]:
+    """
+    Scan the environment once for all proxy startup settings.
+
+    Returns:
+        Tuple of (api_keys, ignore_models, whitelist_models, max_concurrent)
+    """
+    api_keys: Dict[str, List[str]] = {}
+    ignore_models: Dict[str, FrozenSet[str]] = {}
+    whitelist_models: Dict[str, FrozenSet[str]] = {}
+    max_concurrent: Dict[str, int] = {}
+
     for key, value in os.environ.items():
-        if "_API_KEY" in key and key != "PROXY_API_KEY":
+        if key.startswith(_IGNORE_MODELS_PREFIX):
+            provider = key[_IGNORE_MODELS_PREFIX_LEN:].lower()
+            ignore_models[provider] = _parse_model_list(value)
+        elif key.startswith(_WHITELIST_MODELS_PREFIX):
+            provider = key[_WHITELIST_MODELS_PREFIX_LEN:].lower()
+            whitelist_models[provider] = _parse_model_list(value)
+        elif key.startswith(_MAX_CONCURRENT_PREFIX):
+            provider = key[_MAX_CONCURRENT_PREFIX_LEN:].lower()
+            try:
+                max_concurrent[provider] = max(1, int(value))
+            except ValueError:
+                logging.warning(f"Invalid max_concurrent for '{provider}': {value}")
+        elif "_API_KEY" in key and key != "PROXY_API_KEY":
             provider = key.split("_API_KEY")[0].lower()
             if provider not in api_keys:
                 api_keys[provider] = []
             api_keys[provider].append(value)
-    return api_keys
 
+    return api_keys, ignore_models, whitelist_models, max_concurrent
 
-def _load_model_filters(prefix: str) -> Dict[str, List[str]]:
-    """Load model filters from environment variables."""
-    filters = {}
-    for key, value in os.environ.items():
-        if key.startswith(prefix):
-            provider = key.replace(prefix, "").lower()
-            models = [model.strip() for model in value.split(",") if model.strip()]
-            filters[provider] = models
-    return filters
 
+def _oauth_init_concurrency() -> int:
+    """Read OAUTH_INIT_CONCURRENCY, falling back to the default if invalid."""
+    value = os.getenv("OAUTH_INIT_CONCURRENCY")
+    if value is None:
+        return OAUTH_INIT_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.warning(
+            f"Invalid OAUTH_INIT_CONCURRENCY: {value}; using {OAUTH_INIT_CONCURRENCY}"
+        )
+        return OAUTH_INIT_CONCURRENCY
 
-def _load_max_concurrent() -> Dict[str, int]:
-    """Load max concurrent requests per key from environment."""
-    max_concurrent = {}
-    for key, value in os.environ.items():
-        if key.startswith("MAX_CONCURRENT_REQUESTS_PER_KEY_"):
-            provider = key.replace("MAX_CONCURRENT_REQUESTS_PER_KEY_", "").lower()
-            try:
-                max_concurrent[provider] = max(1, int(value))
-            except ValueError:
-                logging.warning(f"Invalid max_concurrent for '{provider}': {value}")
-    return max_concurrent
+
+def _parse_model_list(value: str) -> FrozenSet[str]:
+    """Split a comma-separated model list, dropping empty entries."""
+    return frozenset(model.strip() for model in value.split(",") if model.strip())
+
+
+def _discover_api_keys() -> Dict[str, List[str]]:
+    """Discover API keys from environment variables."""
+    return _scan_env()[0]
@@ -10,7 +10,7 @@ for handling SSE streams from LiteLLM.
 
 import json
 import logging
-from typing import AsyncGenerator, Optional, Any, Dict
+from typing import AsyncGenerator, Optional, Any, Dict, List
 
 from fastapi import Request
 
@@ -18,6 +18,53 @@ from proxy_app.detailed_logger import RawIOLogger
 
 logger = logging.getLogger(__name__)
 
+# Terminal SSE event as emitted by the rotator client
+SSE_DONE_EVENT = "data: [DONE]\n\n"
+
+
+class SSEParser:
+    """
+    Incremental SSE parser for the logging path.
+
+    Stream chunks are not guaranteed to align with event boundaries (providers
+    may coalesce several events or split one across chunks), so text is
+    buffered until a blank line terminates an event. `feed` returns the
+    `data:` payloads of every event completed by the new text.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add stream text and return payloads of all completed events."""
+        if not self._buffer:
+            # Fast path: the [DONE] sentinel is never logged, skip parsing it
+            if chunk == SSE_DONE_EVENT:
+                return []
+            buffer = chunk
+        else:
+            buffer = self._buffer + chunk
+        if "\r" in buffer:
+            buffer = buffer.replace("\r\n", "\n")
+
+        payloads = []
+        start = 0
+        while True:
+            end = buffer.find("\n\n", start)
+            if end == -1:
+                break
+            data_lines = [
+                line[5:].lstrip(" ")
+                for line in buffer[start:end].split("\n")
+                if line.startswith("data:")
+            ]
+            if data_lines:
+                payloads.append("\n".join(data_lines))
+            start = end + 2
+
+        self._buffer = buffer[start:]
+        return payloads
+
 
 async def streaming_response_wrapper(
     request: Request,
@@ -51,12 +98,12 @@ async def streaming_response_wrapper(
                 }
             }
             yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
+            yield SSE_DONE_EVENT
         return
 
     # Full aggregation mode when logging is enabled
-    response_chunks = []
-    full_response = {}
+    aggregator = StreamAggregator()
+    sse_parser = SSEParser()
 
     try:
         async for chunk_str in response_stream:
@@ -64,12 +111,11 @@ async def streaming_response_wrapper(
                 logger.warning("Client disconnected, stopping stream.")
                 break
             yield chunk_str
-            if chunk_str.strip() and chunk_str.startswith("data:"):
-                content = chunk_str[len("data:") :].strip()
+            for content in sse_parser.feed(chunk_str):
                 if content != "[DONE]":
                     try:
                         chunk_data = json.loads(content)
-                        response_chunks.append(chunk_data)
+                        aggregator.update(chunk_data)
                         logger_instance.log_stream_chunk(chunk_data)
                     except json.JSONDecodeError:
                         pass
@@ -84,133 +130,156 @@ async def streaming_response_wrapper(
             }
         }
         yield f"data: {json.dumps(error_payload)}\n\n"
-        yield "data: [DONE]\n\n"
+        yield SSE_DONE_EVENT
         # Also log this as a failed request
         logger_instance.log_final_response(
             status_code=500, headers=None, body={"error": str(e)}
         )
         return
     finally:
-        if response_chunks:
-            full_response = _aggregate_streaming_chunks(response_chunks)
-
+        if aggregator.chunk_count:
             logger_instance.log_final_response(
                 status_code=200,
                 headers=None,
-                body=full_response,
+                body=aggregator.finalize(),
             )
 
 
-def _aggregate_streaming_chunks(chunks: list) -> dict:
+class StreamAggregator:
     """
-    Aggregate streaming chunks into a final response structure.
+    Incrementally aggregate streaming chunks into a final response structure.
 
-    Args:
-        chunks: List of parsed chunk data
-
-    Returns:
-        Aggregated response dict
+    Chunks are folded in as they arrive, so only the running totals are kept
+    in memory rather than every parsed chunk of the stream.
     """
-    final_message = {"role": "assistant"}
-    aggregated_tool_calls: Dict[int, dict] = {}
-    usage_data = None
-    finish_reason = None
 
-    for chunk in chunks:
-        if "choices" in chunk and chunk["choices"]:
-            choice = chunk["choices"][0]
-            delta = choice.get("delta", {})
+    # Delta keys handled by the explicit fast paths in update()
+    _KNOWN_DELTA_KEYS = ("content", "tool_calls", "function_call", "role")
+
+    def __init__(self):
+        self.chunk_count = 0
+        self._header: Dict[str, Any] = {}
+        self._final_message: Dict[str, Any] = {"role": "assistant"}
+        self._content_parts: List[str] = []
+        self._tool_calls: Dict[int, dict] = {}
+        self._usage = None
+        self._finish_reason = None
+
+    def update(self, chunk: dict) -> None:
+        """Fold one parsed chunk into the aggregate."""
+        if not self.chunk_count:
+            self._header = {
+                "id": chunk.get("id"),
+                "created": chunk.get("created"),
+                "model": chunk.get("model"),
+            }
+        self.chunk_count += 1
 
-            # Dynamically aggregate all fields from the delta
+        final_message = self._final_message
+        choices = chunk.get("choices")
+        if choices:
+            choice = choices[0]
+            delta = choice.get("delta") or {}
+
+            content = delta.get("content")
+            if content is not None:
+                self._content_parts.append(content)
+
+            tool_calls = delta.get("tool_calls")
+            if tool_calls:
+                aggregated_tool_calls = self._tool_calls
+                for tc_chunk in tool_calls:
+                    index = tc_chunk["index"]
+                    tool_call = aggregated_tool_calls.get(index)
+                    if tool_call is None:
+                        tool_call = aggregated_tool_calls[index] = {
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        }
+                    tc_id = tc_chunk.get("id")
+                    if tc_id:
+                        tool_call["id"] = tc_id
+                    fn = tc_chunk.get("function")
+                    if fn:
+                        agg_fn = tool_call["function"]
+                        name = fn.get("name")
+                        if name is not None:
+                            agg_fn["name"] += name
+                        arguments = fn.get("arguments")
+                        if arguments is not None:
+                            agg_fn["arguments"] += arguments
+
+            function_call = delta.get("function_call")
+            if function_call is not None:
+                agg_fc = final_message.get("function_call")
+                if agg_fc is None:
+                    agg_fc = final_message["function_call"] = {
+                        "name": "",
+                        "arguments": "",
+                    }
+                name = function_call.get("name")
+                if name is not None:
+                    agg_fc["name"] += name
+                arguments = function_call.get("arguments")
+                if arguments is not None:
+                    agg_fc["arguments"] += arguments
+
+            role = delta.get("role")
+            if role is not None:
+                final_message["role"] = role
+
+            # Generic merge for any remaining (provider-specific) delta keys
+            known_keys = self._KNOWN_DELTA_KEYS
             for key, value in delta.items():
-                if value is None:
+                if value is None or key in known_keys:
                     continue
+                existing = final_message.get(key)
+                if isinstance(existing, str):
+                    final_message[key] = existing + value
+                else:
+                    final_message[key] = value
+
+            if choice.get("finish_reason"):
+                self._finish_reason = choice["finish_reason"]
+
+        usage = chunk.get("usage")
+        if usage:
+            self._usage = usage
+
+    def finalize(self) -> dict:
+        """
+        Build the aggregated response.
 
-                if key == "content":
-                    if "content" not in final_message:
-                        final_message["content"] = ""
-                    if value:
-                        final_message["content"] += value
-
-                elif key == "tool_calls":
-                    for tc_chunk in value:
-                        index = tc_chunk["index"]
-                        if index not in aggregated_tool_calls:
-                            aggregated_tool_calls[index] = {
-                                "type": "function",
-                                "function": {"name": "", "arguments": ""},
-                            }
-                        # Ensure 'function' key exists
-                        if "function" not in aggregated_tool_calls[index]:
-                            aggregated_tool_calls[index]["function"] = {
-                                "name": "",
-                                "arguments": "",
-                            }
-                        if tc_chunk.get("id"):
-                            aggregated_tool_calls[index]["id"] = tc_chunk["id"]
-                        if "function" in tc_chunk:
-                            if "name" in tc_chunk["function"]:
-                                if tc_chunk["function"]["name"] is not None:
-                                    aggregated_tool_calls[index]["function"][
-                                        "name"
-                                    ] += tc_chunk["function"]["name"]
-                            if "arguments" in tc_chunk["function"]:
-                                if tc_chunk["function"]["arguments"] is not None:
-                                    aggregated_tool_calls[index]["function"][
-                                        "arguments"
-                                    ] += tc_chunk["function"]["arguments"]
-
-                elif key == "function_call":
-                    if "function_call" not in final_message:
-                        final_message["function_call"] = {"name": "", "arguments": ""}
-                    if "name" in value:
-                        if value["name"] is not None:
-                            final_message["function_call"]["name"] += value["name"]
-                    if "arguments" in value:
-                        if value["arguments"] is not None:
-                            final_message["function_call"]["arguments"] += value[
-                                "arguments"
-                            ]
-
-                else:  # Generic key handling
-                    if key == "role":
-                        final_message[key] = value
-                    elif key not in final_message:
-                        final_message[key] = value
-                    elif isinstance(final_message.get(key), str):
-                        final_message[key] += value
-                    else:
-                        final_message[key] = value
-
-            if "finish_reason" in choice and choice["finish_reason"]:
-                finish_reason = choice["finish_reason"]
-
-        if "usage" in chunk and chunk["usage"]:
-            usage_data = chunk["usage"]
-
-    # Final Response Construction
-    if aggregated_tool_calls:
-        final_message["tool_calls"] = list(aggregated_tool_calls.values())
-        # Override finish_reason when tool_calls exist
-        finish_reason = "tool_calls"
-
-    # Ensure standard fields are present
-    for field in ["content", "tool_calls", "function_call"]:
-        if field not in final_message:
-            final_message[field] = None
-
-    first_chunk = chunks[0]
-    final_choice = {
-        "index": 0,
-        "message": final_message,
-        "finish_reason": finish_reason,
-    }
-
-    return {
-        "id": first_chunk.get("id"),
-        "object": "chat.completion",
-        "created": first_chunk.get("created"),
-        "model": first_chunk.get("model"),
-        "choices": [final_choice],
-        "usage": usage_data,
-    }
+        Returns:
+            Aggregated response dict
+        """
+        final_message = dict(self._final_message)
+        finish_reason = self._finish_reason
+
+        if self._content_parts:
+            final_message["content"] = "".join(self._content_parts)
+
+        if self._tool_calls:
+            final_message["tool_calls"] = list(self._tool_calls.values())
+            # Override finish_reason when tool_calls exist
+            finish_reason = "tool_calls"
+
+        # Ensure standard fields are present
+        for field in ["content", "tool_calls", "function_call"]:
+            if field not in final_message:
+                final_message[field] = None
+
+        final_choice = {
+            "index": 0,
+            "message": final_message,
+            "finish_reason": finish_reason,
+        }
+
+        return {
+            "id": self._header.get("id"),
+            "object": "chat.completion",
+            "created": self._header.get("created"),
+            "model": self._header.get("model"),
+            "choices": [final_choice],
+            "usage": self._usage,
+        }
@@ -19,6 +19,8 @@ Components (for advanced usage):
     StreamingHandler: Streaming response processing
 """
 
+from typing import TYPE_CHECKING
+
 from .rotating_client import RotatingClient
 from ..core.errors import StreamedAPIError
 
@@ -28,9 +30,12 @@ from .filters import CredentialFilter
 from .models import ModelResolver
 from .transforms import ProviderTransforms
 from .streaming import StreamingHandler
-from .anthropic import AnthropicHandler
 from .types import AvailabilityStats, RetryState, ExecutionResult
 
+# AnthropicHandler pulls in anthropic_compat; lazy-loaded via __getattr__
+if TYPE_CHECKING:
+    from .anthropic import AnthropicHandler
+
 __all__ = [
     # Main public API
     "RotatingClient",
@@ -47,3 +52,12 @@ __all__ = [
     "RetryState",
     "ExecutionResult",
 ]
+
+
+def __getattr__(name):
+    """Lazy-load AnthropicHandler so importing the client skips anthropic_compat."""
+    if name == "AnthropicHandler":
+        from .anthropic import AnthropicHandler
+
+        return AnthropicHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -367,7 +367,9 @@ class RequestExecutor:
         selection_mode = availability.get("rotation_mode")
 
         # Extract provider from model (e.g., "nvidia_nim" from "nvidia_nim/deepseek-ai/...")
-        provider = model.split("/")[0] if "/" in model else None
+        provider, sep, _ = model.partition("/")
+        if not sep:
+            provider = None
 
         if provider and self._has_tier_support(provider):
             # Full format with tier/priority/quota for providers with tier configuration
@@ -12,10 +12,47 @@ Extracts model-related logic from client.py including:
 
 import fnmatch
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import re
+from typing import Any, Collection, Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 lib_logger = logging.getLogger("rotator_library")
 
+# Characters that make a filter entry a glob pattern rather than an exact name
+_GLOB_CHARS = frozenset("*?[")
+
+# Per-provider compiled filter: (exact names, glob patterns, combined glob regex)
+CompiledFilter = Tuple[FrozenSet[str], Tuple[str, ...], Optional[Pattern[str]]]
+
+
+def _compile_filter(entries: Collection[str]) -> CompiledFilter:
+    """
+    Split filter entries into exact names and glob patterns.
+
+    Exact names become a frozenset for O(1) membership; genuine glob patterns
+    are translated once and joined into a single regex, so each model is
+    scanned once instead of once per pattern. Names are normcased the same
+    way fnmatch does, so matching semantics are unchanged.
+    """
+    exact = set()
+    patterns = []
+    for entry in entries:
+        if _GLOB_CHARS.isdisjoint(entry):
+            exact.add(os.path.normcase(entry))
+        else:
+            patterns.append(entry)
+
+    # Each translated pattern is anchored on its own (fnmatch.translate ends
+    # with \Z), so plain alternation keeps per-pattern semantics.
+    regex = (
+        re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+        )
+        if patterns
+        else None
+    )
+    return frozenset(exact), tuple(patterns), regex
+
 
 class ModelResolver:
     """
@@ -31,8 +68,8 @@ class ModelResolver:
         self,
         provider_plugins: Dict[str, Any],
         model_definitions: Optional[Any] = None,
-        ignore_models: Optional[Dict[str, List[str]]] = None,
-        whitelist_models: Optional[Dict[str, List[str]]] = None,
+        ignore_models: Optional[Dict[str, Collection[str]]] = None,
+        whitelist_models: Optional[Dict[str, Collection[str]]] = None,
         provider_instances: Optional[Dict[str, Any]] = None,
     ):
         """
@@ -51,8 +88,14 @@ class ModelResolver:
             provider_instances if provider_instances is not None else {}
         )
         self._definitions = model_definitions
-        self._ignore = ignore_models or {}
-        self._whitelist = whitelist_models or {}
+        self._ignore: Dict[str, CompiledFilter] = {
+            provider: _compile_filter(entries)
+            for provider, entries in (ignore_models or {}).items()
+        }
+        self._whitelist: Dict[str, CompiledFilter] = {
+            provider: _compile_filter(entries)
+            for provider, entries in (whitelist_models or {}).items()
+        }
 
     def _get_plugin_instance(self, provider: str) -> Optional[Any]:
         """
@@ -142,24 +185,11 @@ class ModelResolver:
         """
         model_provider = model.split("/")[0] if "/" in model else provider
 
-        if model_provider not in self._ignore:
+        compiled = self._ignore.get(model_provider)
+        if compiled is None:
             return False
 
-        ignore_list = self._ignore[model_provider]
-        if ignore_list == ["*"]:
-            return True
-
-        # Extract model name without provider prefix
-        model_name = model.split("/", 1)[1] if "/" in model else model
-
-        for pattern in ignore_list:
-            # Use fnmatch for glob pattern support
-            if fnmatch.fnmatch(model_name, pattern):
-                return True
-            if fnmatch.fnmatch(model, pattern):
-                return True
-
-        return False
+        return self._matches(compiled, model)
 
     def _is_whitelisted(self, model: str, provider: str) -> bool:
         """
@@ -176,17 +206,35 @@ class ModelResolver:
         """
         model_provider = model.split("/")[0] if "/" in model else provider
 
-        if model_provider not in self._whitelist:
+        compiled = self._whitelist.get(model_provider)
+        if compiled is None:
             return False
 
-        whitelist = self._whitelist[model_provider]
-        model_name = model.split("/", 1)[1] if "/" in model else model
+        return self._matches(compiled, model)
+
+    @staticmethod
+    def _matches(compiled: CompiledFilter, model: str) -> bool:
+        """
+        Check a model against a compiled filter.
+
+        Matches either the bare model name or the full provider-prefixed string.
+        """
+        exact, patterns, regex = compiled
+        if "*" in patterns:
+            return True
 
-        for pattern in whitelist:
-            if fnmatch.fnmatch(model_name, pattern):
-                return True
-            if fnmatch.fnmatch(model, pattern):
-                return True
+        # Extract model name without provider prefix
+        model_name = os.path.normcase(
+            model.split("/", 1)[1] if "/" in model else model
+        )
+        model = os.path.normcase(model)
+
+        if exact and (model_name in exact or model in exact):
+            return True
+
+        # Glob patterns, all checked in a single regex scan per string
+        if regex is not None and (regex.match(model_name) or regex.match(model)):
+            return True
 
         return False
 
@@ -16,17 +16,28 @@ with all complexity moved to specialized modules.
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import random
+import sys
 import time
+from itertools import chain
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncGenerator,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 import httpx
 import litellm
-from litellm.litellm_core_utils.token_counter import token_counter
 
 from ..core.types import RequestContext
 from ..core.errors import NoAvailableKeysError, mask_credential
@@ -41,7 +52,6 @@ from .filters import CredentialFilter
 from .models import ModelResolver
 from .transforms import ProviderTransforms
 from .executor import RequestExecutor
-from .anthropic import AnthropicHandler
 
 # Import providers and other dependencies
 from ..providers import PROVIDER_PLUGINS
@@ -64,6 +74,121 @@ if TYPE_CHECKING:
 
 lib_logger = logging.getLogger("rotator_library")
 
+# HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Debug-log serializer: orjson when installed (much faster on large events),
+# stdlib json otherwise. default=str covers non-JSON values either way.
+try:
+    import orjson
+
+    def _dump_log(obj: Any) -> str:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. ints wider than 64 bits - fall back to repr
+            return str(obj)
+
+except ImportError:
+    import json
+
+    def _dump_log(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+
+# Large/sensitive fields dropped from LiteLLM log events before debug logging
+_LITELLM_LOG_KEYS_TO_POP = frozenset(
+    [
+        "messages",
+        "input",
+        "response",
+        "data",
+        "api_key",
+        "api_base",
+        "original_response",
+        "additional_args",
+    ]
+)
+
+# Number of credentials raced concurrently when fetching a provider's model list
+MODEL_FETCH_RACE_WIDTH = 3
+
+# Upper bound on memoized (provider, model) -> resolved model entries
+RESOLVE_CACHE_MAX_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=64)
+def _antigravity_preprompt_tokens(model: str) -> int:
+    """
+    Token count of the Antigravity preprompt for a model.
+
+    The preprompt is fixed for the process (it only depends on module-level
+    settings), so the tokenizer pass runs once per model.
+    """
+    try:
+        from ..providers.antigravity_provider import get_antigravity_preprompt_text
+    except ImportError:
+        # Provider not available, skip preprompt token counting
+        return 0
+
+    preprompt_text = get_antigravity_preprompt_text()
+    if not preprompt_text:
+        return 0
+
+    from litellm.litellm_core_utils.token_counter import token_counter
+
+    return token_counter(model=model, text=preprompt_text)
+
+
+# Accepted values for RotatingClient.token_count(mode=...)
+TOKEN_COUNT_MODES = ("exact", "estimate")
+
+
+def _estimate_tokens(text: Optional[str], messages: Optional[List[Any]]) -> int:
+    """Rough token estimate (~4 characters per token) without a tokenizer."""
+    if not messages:
+        return len(text or "") // 4
+
+    chars = 0
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            # Multimodal content: count the text parts only
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    chars += len(part["text"])
+    return chars // 4
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """
+    Build the shared provider HTTP client with an explicit connection pool.
+
+    The httpx defaults (100 connections, 20 keep-alive) throttle fan-out across
+    many providers/keys and force fresh TLS handshakes once keep-alive slots
+    run out. Pool size is configurable via ROTATOR_MAX_CONN and
+    ROTATOR_MAX_KEEPALIVE; HTTP/2 is used when available unless ROTATOR_HTTP2
+    is set to "false". Timeouts are left to each request (see TimeoutConfig).
+    """
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("ROTATOR_MAX_CONN", "1000")),
+        max_keepalive_connections=int(os.getenv("ROTATOR_MAX_KEEPALIVE", "100")),
+        keepalive_expiry=30.0,
+    )
+    http2 = (
+        _HTTP2_AVAILABLE and os.getenv("ROTATOR_HTTP2", "true").lower() != "false"
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2)
+
 
 class RotatingClient:
     """
@@ -77,6 +202,9 @@ class RotatingClient:
     - ProviderTransforms: Applies provider-specific transforms
     """
 
+    # LiteLLM settings are process-global; apply them only once
+    _litellm_configured = False
+
     def __init__(
         self,
         api_keys: Optional[Dict[str, List[str]]] = None,
@@ -87,8 +215,8 @@ class RotatingClient:
         global_timeout: int = DEFAULT_GLOBAL_TIMEOUT,
         abort_on_callback_error: bool = True,
         litellm_provider_params: Optional[Dict[str, Any]] = None,
-        ignore_models: Optional[Dict[str, List[str]]] = None,
-        whitelist_models: Optional[Dict[str, List[str]]] = None,
+        ignore_models: Optional[Dict[str, Collection[str]]] = None,
+        whitelist_models: Optional[Dict[str, Collection[str]]] = None,
         enable_request_logging: bool = False,
         max_concurrent_requests_per_key: Optional[Dict[str, int]] = None,
         rotation_tolerance: float = DEFAULT_ROTATION_TOLERANCE,
@@ -104,10 +232,12 @@ class RotatingClient:
 
         # Configure logging
         configure_failure_logger(get_logs_dir(self.data_dir))
-        os.environ["LITELLM_LOG"] = "ERROR"
-        litellm.set_verbose = False
-        litellm.drop_params = True
-        suppress_litellm_serialization_warnings()
+        if not RotatingClient._litellm_configured:
+            os.environ["LITELLM_LOG"] = "ERROR"
+            litellm.set_verbose = False
+            litellm.drop_params = True
+            suppress_litellm_serialization_warnings()
+            RotatingClient._litellm_configured = True
 
         if configure_logging:
             lib_logger.propagate = True
@@ -138,11 +268,21 @@ class RotatingClient:
             self.oauth_credentials = cred_manager.discover_and_prepare()
 
         # Build combined credentials
-        self.all_credentials: Dict[str, List[str]] = {}
-        for provider, keys in api_keys.items():
-            self.all_credentials.setdefault(provider, []).extend(keys)
-        for provider, paths in self.oauth_credentials.items():
-            self.all_credentials.setdefault(provider, []).extend(paths)
+        # API keys first, then OAuth paths; duplicates are dropped in order
+        self.all_credentials: Dict[str, List[str]] = {
+            sys.intern(provider): list(
+                dict.fromkeys(
+                    chain(
+                        api_keys.get(provider, ()),
+                        self.oauth_credentials.get(provider, ()),
+                    )
+                )
+            )
+            for provider in dict.fromkeys(chain(api_keys, self.oauth_credentials))
+            if api_keys.get(provider) or self.oauth_credentials.get(provider)
+        }
+        # Provider set is fixed after init; snapshot it for per-request fan-outs
+        self._providers: Tuple[str, ...] = tuple(self.all_credentials)
 
         self.api_keys = api_keys
         self.oauth_providers = set(self.oauth_credentials.keys())
@@ -176,7 +316,7 @@ class RotatingClient:
         self.background_refresher = BackgroundRefresher(self)
         self.model_definitions = ModelDefinitions()
         self.provider_config = LiteLLMProviderConfig()
-        self.http_client = httpx.AsyncClient()
+        self.http_client = _build_http_client()
 
         # Initialize extracted components
         self._credential_filter = CredentialFilter(
@@ -196,6 +336,13 @@ class RotatingClient:
             provider_instances=self._provider_instances,
         )
 
+        # Memoized model resolution: {(provider, model): resolved_model}
+        self._resolve_cache: Dict[tuple[str, str], str] = {}
+        # Filters are fixed for the client's lifetime, so allow/deny results are too
+        self._is_model_allowed = functools.lru_cache(maxsize=8192)(
+            self._model_resolver.is_model_allowed
+        )
+
         # Initialize UsageManagers (one per provider) using new usage package
         self._usage_managers: Dict[str, NewUsageManager] = {}
 
@@ -207,17 +354,19 @@ class RotatingClient:
             self._usage_base_path = base_path / "usage"
         else:
             self._usage_base_path = self.data_dir / "usage"
-        self._usage_base_path.mkdir(parents=True, exist_ok=True)
+        # Nothing will be written without credentials, so don't create the dir
+        if self.all_credentials:
+            self._usage_base_path.mkdir(parents=True, exist_ok=True)
 
-        # Build provider configs using ConfigLoader
+        # Single pass over providers: load configs and create one UsageManager
+        # each. Plugin instances are cached by _get_provider_instance, so the
+        # reset-config lookup below reuses them.
         provider_configs = {}
-        for provider in self.all_credentials.keys():
+        for provider, credentials in self.all_credentials.items():
             provider_configs[provider] = self._config_loader.load_provider_config(
                 provider
             )
 
-        # Create UsageManager for each provider
-        for provider, credentials in self.all_credentials.items():
             config = load_provider_usage_config(provider, PROVIDER_PLUGINS)
             # Override tolerance from constructor param
             config.rotation_tolerance = rotation_tolerance
@@ -229,14 +378,13 @@ class RotatingClient:
             # Get max concurrent for this provider (default to 1 if not set)
             max_concurrent = self.max_concurrent_requests_per_key.get(provider, 1)
 
-            manager = NewUsageManager(
+            self._usage_managers[provider] = NewUsageManager(
                 provider=provider,
                 file_path=usage_file,
                 provider_plugins=PROVIDER_PLUGINS,
                 config=config,
                 max_concurrent_per_key=max_concurrent,
             )
-            self._usage_managers[provider] = manager
 
         # Initialize executor with new usage managers
         self._executor = RequestExecutor(
@@ -257,12 +405,24 @@ class RotatingClient:
         # Model list cache with TTL: {provider: (models_list, timestamp)}
         self._model_list_cache: Dict[str, tuple[List[str], float]] = {}
         self._model_list_ttl_seconds = int(os.getenv("MODEL_LIST_CACHE_TTL", "300"))  # 5 min default
-        self._model_list_cache_lock = asyncio.Lock()
+        self._inflight_model_fetches: Dict[str, asyncio.Task] = {}
         self._usage_initialized = False
         self._usage_init_lock = asyncio.Lock()
 
-        # Initialize Anthropic compatibility handler
-        self._anthropic_handler = AnthropicHandler(self)
+        # Global admission gate for in-flight requests. A Condition-guarded
+        # counter (rather than a Semaphore) so the limit can be resized live.
+        # ROTATOR_MAX_INFLIGHT unset or <= 0 means no limit (None).
+        self._admit_counter = 0
+        max_inflight = int(os.getenv("ROTATOR_MAX_INFLIGHT", "0"))
+        self._admit_max: Optional[int] = max_inflight if max_inflight > 0 else None
+        self._admit_cond = asyncio.Condition()
+
+    @functools.cached_property
+    def _anthropic_handler(self):
+        """Anthropic compatibility handler, built on first Anthropic-format call."""
+        from .anthropic import AnthropicHandler
+
+        return AnthropicHandler(self)
 
     async def __aenter__(self):
         await self.initialize_usage_managers()
@@ -278,12 +438,21 @@ class RotatingClient:
         async with self._usage_init_lock:
             if self._usage_initialized:
                 return
-            for provider, manager in self._usage_managers.items():
+
+            async def _init_one(provider: str, manager: NewUsageManager) -> None:
                 credentials = self.all_credentials.get(provider, [])
                 priorities, tiers = self._get_credential_metadata(provider, credentials)
                 await manager.initialize(
                     credentials, priorities=priorities, tiers=tiers
                 )
+
+            # Providers are independent, so load their usage files concurrently
+            await asyncio.gather(
+                *(
+                    _init_one(provider, manager)
+                    for provider, manager in self._usage_managers.items()
+                )
+            )
             summaries = []
             for provider, manager in self._usage_managers.items():
                 credentials = self.all_credentials.get(provider, [])
@@ -301,13 +470,95 @@ class RotatingClient:
 
     async def close(self):
         """Close the HTTP client and save usage data."""
-        # Save and shutdown new usage managers
-        for manager in self._usage_managers.values():
-            await manager.shutdown()
+        # Save and shutdown new usage managers (independent, so flush in parallel)
+        await asyncio.gather(
+            *(manager.shutdown() for manager in self._usage_managers.values())
+        )
 
         if hasattr(self, "http_client") and self.http_client:
             await self.http_client.aclose()
 
+    def _has_free_slot(self) -> bool:
+        """True when the in-flight gate can admit another request."""
+        return self._admit_max is None or self._admit_counter < self._admit_max
+
+    async def _admit(
+        self, deadline: float, model: str = "", provider: str = ""
+    ) -> None:
+        """
+        Wait for a free in-flight slot and take it.
+
+        The wait is bounded by the request's deadline, so time spent queued
+        counts against the same global timeout as the request itself.
+
+        Raises:
+            litellm.Timeout: No slot freed up before the deadline.
+        """
+        # Unlimited (the default): count the request but skip the lock. No
+        # await between check and increment, so this is atomic on the loop.
+        if self._admit_max is None:
+            self._admit_counter += 1
+            return
+
+        async with self._admit_cond:
+            if not self._has_free_slot():
+                try:
+                    await asyncio.wait_for(
+                        self._admit_cond.wait_for(self._has_free_slot),
+                        timeout=max(0.0, deadline - time.time()),
+                    )
+                except asyncio.TimeoutError:
+                    # A notify may have landed as the wait timed out; pass it on
+                    if self._has_free_slot():
+                        self._admit_cond.notify()
+                    raise litellm.Timeout(
+                        message=(
+                            "Timed out waiting for a free in-flight request slot "
+                            f"(ROTATOR_MAX_INFLIGHT={self._admit_max})"
+                        ),
+                        model=model,
+                        llm_provider=provider,
+                    ) from None
+            self._admit_counter += 1
+
+    async def _release(self) -> None:
+        """Return an in-flight slot and wake one waiter."""
+        self._admit_counter -= 1
+        # Nobody can be waiting without a limit (removing one wakes them all)
+        if self._admit_max is None:
+            return
+        async with self._admit_cond:
+            self._admit_cond.notify()
+
+    async def set_max_inflight(self, limit: Optional[int]) -> None:
+        """
+        Resize the global in-flight request limit at runtime.
+
+        A limit of None or <= 0 removes the limit. Requests already admitted
+        are unaffected (they are counted even while unlimited, so a new limit
+        sees them); when the limit grows, all waiters are woken so the
+        extra slots are taken immediately.
+        """
+        async with self._admit_cond:
+            self._admit_max = limit if limit is not None and limit > 0 else None
+            self._admit_cond.notify_all()
+
+    async def _admitted_stream(
+        self, stream: AsyncGenerator[str, None], context: RequestContext
+    ) -> AsyncGenerator[str, None]:
+        """
+        Hold an in-flight slot for the lifetime of a stream.
+
+        The slot is taken on first iteration, so a stream that is never
+        consumed never holds one.
+        """
+        await self._admit(context.deadline, context.model, context.provider)
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await self._release()
+
     async def acompletion(
         self,
         request: Optional[Any] = None,
@@ -321,9 +572,9 @@ class RotatingClient:
             Response object or async generator for streaming
         """
         model = kwargs.get("model", "")
-        provider = model.split("/")[0] if "/" in model else ""
+        provider, sep, _ = model.partition("/")
 
-        if not provider or provider not in self.all_credentials:
+        if not sep or not provider or provider not in self.all_credentials:
             raise ValueError(
                 f"Invalid model format or no credentials for provider: {model}"
             )
@@ -331,8 +582,12 @@ class RotatingClient:
         # Extract internal logging parameters (not passed to API)
         parent_log_dir = kwargs.pop("_parent_log_dir", None)
 
+        # Provider and model names come from a small closed set; interning
+        # them makes the per-request dict lookups downstream pointer compares
+        provider = sys.intern(provider)
+
         # Resolve model ID
-        resolved_model = self._model_resolver.resolve_model_id(model, provider)
+        resolved_model = sys.intern(self._resolve_model_id(model, provider))
         kwargs["model"] = resolved_model
 
         # Create transaction logger if enabled
@@ -359,9 +614,18 @@ class RotatingClient:
             transaction_logger=transaction_logger,
         )
 
-        return await self._executor.execute(context)
+        if context.streaming:
+            return self._admitted_stream(
+                await self._executor.execute(context), context
+            )
 
-    def aembedding(
+        await self._admit(context.deadline, context.model, context.provider)
+        try:
+            return await self._executor.execute(context)
+        finally:
+            await self._release()
+
+    async def aembedding(
         self,
         request: Optional[Any] = None,
         pre_request_callback: Optional[callable] = None,
@@ -371,17 +635,17 @@ class RotatingClient:
         Execute an embedding request with retry logic.
         """
         model = kwargs.get("model", "")
-        provider = model.split("/")[0] if "/" in model else ""
+        provider, sep, _ = model.partition("/")
 
-        if not provider or provider not in self.all_credentials:
+        if not sep or not provider or provider not in self.all_credentials:
             raise ValueError(
                 f"Invalid model format or no credentials for provider: {model}"
             )
 
         # Build request context (embeddings are never streaming)
         context = RequestContext(
-            model=model,
-            provider=provider,
+            model=sys.intern(model),
+            provider=sys.intern(provider),
             kwargs=kwargs,
             streaming=False,
             credentials=self.all_credentials.get(provider, []),
@@ -390,14 +654,23 @@ class RotatingClient:
             pre_request_callback=pre_request_callback,
         )
 
-        return self._executor.execute(context)
+        await self._admit(context.deadline, context.model, context.provider)
+        try:
+            return await self._executor.execute(context)
+        finally:
+            await self._release()
 
-    def token_count(self, **kwargs) -> int:
+    def token_count(self, mode: str = "exact", **kwargs) -> int:
         """Calculate token count for text or messages.
 
         For Antigravity provider models, this also includes the preprompt tokens
         that get injected during actual API calls (agent instruction + identity override).
         This ensures token counts match actual usage.
+
+        Args:
+            mode: "exact" runs the model's tokenizer; "estimate" uses a
+                ~4 chars/token heuristic for callers that only need a bound
+                (admission control, budgeting) and want to skip the tokenizer.
         """
         model = kwargs.get("model")
         text = kwargs.get("text")
@@ -405,53 +678,64 @@ class RotatingClient:
 
         if not model:
             raise ValueError("'model' is required")
+        if mode not in TOKEN_COUNT_MODES:
+            raise ValueError(f"Unknown token count mode: {mode!r}")
+        if not messages and not text:
+            raise ValueError("Either 'text' or 'messages' must be provided")
 
         # Calculate base token count
-        if messages:
-            base_count = token_counter(model=model, messages=messages)
-        elif text:
-            base_count = token_counter(model=model, text=text)
+        if mode == "estimate":
+            base_count = _estimate_tokens(text, messages)
         else:
-            raise ValueError("Either 'text' or 'messages' must be provided")
+            # Deferred: the tokenizer module is only needed by this rarely-hot path
+            from litellm.litellm_core_utils.token_counter import token_counter
+
+            if messages:
+                base_count = token_counter(model=model, messages=messages)
+            else:
+                base_count = token_counter(model=model, text=text)
 
         # Add preprompt tokens for Antigravity provider
         # The Antigravity provider injects system instructions during actual API calls,
         # so we need to account for those tokens in the count
-        provider = model.split("/")[0] if "/" in model else ""
-        if provider == "antigravity":
-            try:
-                from ..providers.antigravity_provider import (
-                    get_antigravity_preprompt_text,
-                )
-
-                preprompt_text = get_antigravity_preprompt_text()
-                if preprompt_text:
-                    preprompt_tokens = token_counter(model=model, text=preprompt_text)
-                    base_count += preprompt_tokens
-            except ImportError:
-                # Provider not available, skip preprompt token counting
-                pass
+        provider, sep, _ = model.partition("/")
+        if sep and provider == "antigravity":
+            base_count += _antigravity_preprompt_tokens(model)
 
         return base_count
 
     async def get_available_models(self, provider: str) -> List[str]:
         """Get available models for a provider with TTL-based caching."""
-        async with self._model_list_cache_lock:
-            if provider in self._model_list_cache:
-                models, timestamp = self._model_list_cache[provider]
-                if time.time() - timestamp < self._model_list_ttl_seconds:
-                    return models
-                # Expired, will refresh below
-        # Not in cache or expired - fetch fresh
-        return await self._fetch_available_models(provider)
+        # Lock-free fast path: a single dict read is atomic on the event loop
+        entry = self._model_list_cache.get(provider)
+        if entry is not None:
+            models, timestamp = entry
+            if time.time() - timestamp < self._model_list_ttl_seconds:
+                return models
+
+        # Not in cache or expired - join an in-flight fetch or start one, so
+        # concurrent misses result in a single upstream call
+        task = self._inflight_model_fetches.get(provider)
+        if task is None:
+            task = asyncio.create_task(self._fetch_available_models(provider))
+            self._inflight_model_fetches[provider] = task
+            task.add_done_callback(
+                lambda _t: self._inflight_model_fetches.pop(provider, None)
+            )
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
 
     async def _fetch_available_models(self, provider: str) -> List[str]:
-        """Fetch available models from provider and update cache."""
+        """
+        Fetch available models from provider and update cache.
+
+        Background discovery, so it bypasses the in-flight request gate.
+        """
         credentials = self.all_credentials.get(provider, [])
         if not credentials:
             return []
 
-        # Shuffle and try each credential
+        # Shuffle so load spreads across credentials
         shuffled = list(credentials)
         random.shuffle(shuffled)
 
@@ -459,28 +743,63 @@ class RotatingClient:
         if not plugin:
             return []
 
-        for cred in shuffled:
-            try:
-                models = await plugin.get_models(cred, self.http_client)
+        # Race the first few credentials; only one success is needed, so a
+        # dead or slow key doesn't delay the list by a full timeout
+        racers = shuffled[:MODEL_FETCH_RACE_WIDTH]
+        models = await self._race_get_models(provider, plugin, racers)
 
-                # Apply whitelist/blacklist
-                final = [
-                    m
-                    for m in models
-                    if self._model_resolver.is_model_allowed(m, provider)
-                ]
+        # All racers failed - try the remaining credentials one by one
+        if models is None:
+            for cred in shuffled[MODEL_FETCH_RACE_WIDTH:]:
+                try:
+                    models = await plugin.get_models(cred, self.http_client)
+                    break
+                except Exception as e:
+                    lib_logger.debug(
+                        f"Failed to get models for {provider} with {mask_credential(cred)}: {e}"
+                    )
 
-                async with self._model_list_cache_lock:
-                    self._model_list_cache[provider] = (final, time.time())
-                return final
+        if models is None:
+            return []
 
-            except Exception as e:
-                lib_logger.debug(
-                    f"Failed to get models for {provider} with {mask_credential(cred)}: {e}"
-                )
-                continue
+        # Apply whitelist/blacklist
+        final = [m for m in models if self._is_model_allowed(m, provider)]
 
-        return []
+        self._model_list_cache[provider] = (final, time.time())
+        return final
+
+    async def _race_get_models(
+        self, provider: str, plugin: Any, credentials: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Fetch models with several credentials concurrently.
+
+        Returns the first successful result (cancelling the rest), or None if
+        every credential failed.
+        """
+        tasks = {
+            asyncio.create_task(plugin.get_models(cred, self.http_client)): cred
+            for cred in credentials
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    lib_logger.debug(
+                        f"Failed to get models for {provider} with {mask_credential(tasks[task])}: {error}"
+                    )
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     def invalidate_model_list_cache(self, provider: Optional[str] = None) -> None:
         """Invalidate model list cache for a provider or all providers.
@@ -490,19 +809,36 @@ class RotatingClient:
         """
         if provider:
             self._model_list_cache.pop(provider, None)
+            for key in [k for k in self._resolve_cache if k[0] == provider]:
+                del self._resolve_cache[key]
             lib_logger.debug(f"Invalidated model list cache for {provider}")
         else:
             self._model_list_cache.clear()
+            self._resolve_cache.clear()
             lib_logger.debug("Invalidated all model list caches")
 
+    def _resolve_model_id(self, model: str, provider: str) -> str:
+        """Resolve a model ID via ModelResolver, memoized per (provider, model)."""
+        key = (provider, model)
+        resolved = self._resolve_cache.get(key)
+        if resolved is None:
+            resolved = self._model_resolver.resolve_model_id(model, provider)
+            if len(self._resolve_cache) >= RESOLVE_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._resolve_cache[next(iter(self._resolve_cache))]
+            self._resolve_cache[key] = resolved
+        return resolved
+
     async def get_all_available_models(
         self,
         grouped: bool = True,
     ) -> Union[Dict[str, List[str]], List[str]]:
         """Get all available models across all providers."""
-        providers = list(self.all_credentials.keys())
-        tasks = [self.get_available_models(p) for p in providers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        providers = self._providers
+        results = await asyncio.gather(
+            *(self.get_available_models(p) for p in providers),
+            return_exceptions=True,
+        )
 
         all_models: Dict[str, List[str]] = {}
         for provider, result in zip(providers, results):
@@ -514,11 +850,7 @@ class RotatingClient:
 
         if grouped:
             return all_models
-        else:
-            flat = []
-            for models in all_models.values():
-                flat.extend(models)
-            return flat
+        return list(chain.from_iterable(all_models.values()))
 
     async def get_quota_stats(
         self,
@@ -532,63 +864,62 @@ class RotatingClient:
         Returns:
             Dict with stats per provider
         """
-        providers = {}
-
-        for provider, manager in self._usage_managers.items():
-            if provider_filter and provider != provider_filter:
-                continue
+        selected = [
+            (provider, manager)
+            for provider, manager in self._usage_managers.items()
+            if not provider_filter or provider == provider_filter
+        ]
+        all_stats = await asyncio.gather(
+            *(manager.get_stats_for_endpoint() for _, manager in selected)
+        )
 
-            stats = await manager.get_stats_for_endpoint()
+        providers = {}
+        total_credentials = active_credentials = exhausted_credentials = 0
+        total_requests = input_cached = input_uncached = output = 0
+        approx_total_cost = 0.0
+        has_cost = False
 
+        # Single pass: keep active providers and accumulate totals
+        for (provider, _), stats in zip(selected, all_stats):
+            requests = stats.get("total_requests", 0)
             # Skip providers with no activity (filters out invalid/unused providers)
-            if stats.get("total_requests", 0) == 0:
+            if requests == 0:
                 continue
 
             providers[provider] = stats
+            total_requests += requests
+            total_credentials += stats.get("credential_count", 0)
+            active_credentials += stats.get("active_count", 0)
+            exhausted_credentials += stats.get("exhausted_count", 0)
+            tokens = stats.get("tokens", {})
+            input_cached += tokens.get("input_cached", 0)
+            input_uncached += tokens.get("input_uncached", 0)
+            output += tokens.get("output", 0)
+            cost = stats.get("approx_cost")
+            if cost:
+                approx_total_cost += cost
+                has_cost = True
 
+        total_input = input_cached + input_uncached
         summary = {
             "total_providers": len(providers),
-            "total_credentials": 0,
-            "active_credentials": 0,
-            "exhausted_credentials": 0,
-            "total_requests": 0,
+            "total_credentials": total_credentials,
+            "active_credentials": active_credentials,
+            "exhausted_credentials": exhausted_credentials,
+            "total_requests": total_requests,
             "tokens": {
-                "input_cached": 0,
-                "input_uncached": 0,
-                "input_cache_pct": 0,
-                "output": 0,
+                "input_cached": input_cached,
+                "input_uncached": input_uncached,
+                "input_cache_pct": (
+                    round(input_cached / total_input * 100, 1)
+                    if total_input > 0
+                    else 0
+                ),
+                "output": output,
             },
-            "approx_total_cost": None,
+            "approx_total_cost": approx_total_cost if has_cost else None,
         }
 
-        for prov in providers.values():
-            summary["total_credentials"] += prov.get("credential_count", 0)
-            summary["active_credentials"] += prov.get("active_count", 0)
-            summary["exhausted_credentials"] += prov.get("exhausted_count", 0)
-            summary["total_requests"] += prov.get("total_requests", 0)
-            tokens = prov.get("tokens", {})
-            summary["tokens"]["input_cached"] += tokens.get("input_cached", 0)
-            summary["tokens"]["input_uncached"] += tokens.get("input_uncached", 0)
-            summary["tokens"]["output"] += tokens.get("output", 0)
-
-        total_input = (
-            summary["tokens"]["input_cached"] + summary["tokens"]["input_uncached"]
-        )
-        summary["tokens"]["input_cache_pct"] = (
-            round(summary["tokens"]["input_cached"] / total_input * 100, 1)
-            if total_input > 0
-            else 0
-        )
-
-        approx_total_cost = 0.0
-        has_cost = False
-        for prov in providers.values():
-            cost = prov.get("approx_cost")
-            if cost:
-                approx_total_cost += cost
-                has_cost = True
-        summary["approx_total_cost"] = approx_total_cost if has_cost else None
-
         return {
             "providers": providers,
             "summary": summary,
@@ -627,13 +958,19 @@ class RotatingClient:
         if not plugin:
             return priorities, tiers
 
+        # Resolve the hooks once rather than per credential
+        get_priority = getattr(plugin, "get_credential_priority", None)
+        get_tier_name = getattr(plugin, "get_credential_tier_name", None)
+        if get_priority is None and get_tier_name is None:
+            return priorities, tiers
+
         for credential in credentials:
-            if hasattr(plugin, "get_credential_priority"):
-                priority = plugin.get_credential_priority(credential)
+            if get_priority is not None:
+                priority = get_priority(credential)
                 if priority is not None:
                     priorities[credential] = priority
-            if hasattr(plugin, "get_credential_tier_name"):
-                tier_name = plugin.get_credential_tier_name(credential)
+            if get_tier_name is not None:
+                tier_name = get_tier_name(credential)
                 if tier_name:
                     tiers[credential] = tier_name
 
@@ -703,46 +1040,43 @@ class RotatingClient:
         ]
 
     def _sanitize_litellm_log(self, log_data: dict) -> dict:
-        """Remove large/sensitive fields from LiteLLM logs."""
+        """
+        Remove large/sensitive fields from LiteLLM logs.
+
+        Builds a pruned copy while recursing, so dropped fields (messages,
+        responses, ...) are never copied or serialized.
+        """
         if not isinstance(log_data, dict):
             return log_data
 
-        keys_to_pop = [
-            "messages",
-            "input",
-            "response",
-            "data",
-            "api_key",
-            "api_base",
-            "original_response",
-            "additional_args",
-        ]
-        nested_keys = ["kwargs", "litellm_params", "model_info", "proxy_server_request"]
-
-        clean_data = json.loads(json.dumps(log_data, default=str))
-
-        def clean_recursively(data_dict: dict) -> None:
-            for key in keys_to_pop:
-                data_dict.pop(key, None)
-            for key in nested_keys:
-                if key in data_dict and isinstance(data_dict[key], dict):
-                    clean_recursively(data_dict[key])
-            for value in list(data_dict.values()):
-                if isinstance(value, dict):
-                    clean_recursively(value)
-
-        clean_recursively(clean_data)
+        clean_data = {}
+        for key, value in log_data.items():
+            if key in _LITELLM_LOG_KEYS_TO_POP:
+                continue
+            if isinstance(value, dict):
+                clean_data[key] = self._sanitize_litellm_log(value)
+            elif isinstance(value, list):
+                clean_data[key] = [
+                    self._sanitize_litellm_log(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            else:
+                clean_data[key] = value
         return clean_data
 
     def _litellm_logger_callback(self, log_data: dict) -> None:
         """Redirect LiteLLM logs into rotator library logger."""
         log_event_type = log_data.get("log_event_type")
-        if log_event_type in ["pre_api_call", "post_api_call"]:
+        if log_event_type in ("pre_api_call", "post_api_call"):
+            return
+
+        # Both branches below only emit debug logs
+        if not lib_logger.isEnabledFor(logging.DEBUG):
             return
 
         if not log_data.get("exception"):
             sanitized_log = self._sanitize_litellm_log(log_data)
-            lib_logger.debug(f"LiteLLM Log: {sanitized_log}")
+            lib_logger.debug("LiteLLM Log: %s", _dump_log(sanitized_log))
             return
 
         model = log_data.get("model", "N/A")
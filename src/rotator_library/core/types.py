@@ -48,13 +48,14 @@ class CredentialInfo:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RequestContext:
     """
     Context for a request being processed.
 
     Contains all information needed to execute a request with
-    retry/rotation logic.
+    retry/rotation logic. Created once per request and never reassigned,
+    so it is frozen and slotted to keep per-request allocations small.
     """
 
     model: str
@@ -2,15 +2,17 @@
 # Copyright (c) 2026 Mirrowel
 
 import os
-import re
 import json
+import asyncio
 import time
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union, Any, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Union, Any, Tuple
 
 from .utils.openai_codex_jwt import (
+    decode_jwt_payloads_batch,
     decode_jwt_unverified,
     extract_account_id_from_payload,
     extract_email_from_payload,
@@ -20,16 +22,39 @@ from .utils.paths import get_oauth_dir
 
 lib_logger = logging.getLogger("rotator_library")
 
+# Credential JSON (de)serialization: orjson when installed, stdlib otherwise.
+# Both produce/accept the same 2-space-indented documents.
+try:
+    import orjson
+
+    def _json_dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Resolved once at import; every default path below hangs off it.
+_HOME = Path.home()
+
 # Standard directories where tools like `gemini login` store credentials.
 DEFAULT_OAUTH_DIRS = {
-    "gemini_cli": Path.home() / ".gemini",
-    "qwen_code": Path.home() / ".qwen",
-    "iflow": Path.home() / ".iflow",
-    "antigravity": Path.home() / ".antigravity",
-    "openai_codex": Path.home() / ".codex",  # import source context only
+    "gemini_cli": _HOME / ".gemini",
+    "qwen_code": _HOME / ".qwen",
+    "iflow": _HOME / ".iflow",
+    "antigravity": _HOME / ".antigravity",
+    "openai_codex": _HOME / ".codex",  # import source context only
     # Add other providers like 'claude' here if they have a standard CLI path
 }
 
+# Codex CLI credential stores used for the first-run import
+_DEFAULT_CODEX_AUTH_JSON = _HOME / ".codex" / "auth.json"
+_DEFAULT_CODEX_ACCOUNTS_JSON = _HOME / ".codex-accounts.json"
+
 # OAuth providers that support environment variable-based credentials
 # Maps provider name to the ENV_PREFIX used by the provider
 ENV_OAUTH_PROVIDERS = {
@@ -40,6 +65,129 @@ ENV_OAUTH_PROVIDERS = {
     "openai_codex": "OPENAI_CODEX",
 }
 
+# Reverse lookup: ENV_PREFIX -> provider name
+_ENV_PREFIX_TO_PROVIDER = {prefix: provider for provider, prefix in ENV_OAUTH_PROVIDERS.items()}
+
+_ACCESS_TOKEN_SUFFIX = "_ACCESS_TOKEN"
+
+# Env var prefixes that can hold OAuth tokens (e.g. "IFLOW_", "GEMINI_CLI_")
+_ENV_OAUTH_KEY_PREFIXES = tuple(f"{prefix}_" for prefix in ENV_OAUTH_PROVIDERS.values())
+
+# Upper bound on providers prepared concurrently during file discovery
+DISCOVERY_MAX_WORKERS = 8
+
+# Result of the last discover_and_prepare() call, keyed by its inputs (see
+# _discovery_cache_key). Module level because each caller (proxy startup,
+# RotatingClient) builds its own CredentialManager.
+# Stored as one (key, result) tuple so a reader never pairs one call's key
+# with another's result.
+_DISCOVERY_CACHE: Dict[str, Optional[Tuple[Any, Dict[str, List[str]]]]] = {"entry": None}
+
+
+# Decoded JWT payloads by token, scoped to one import batch. The same account
+# commonly appears in both ~/.codex/auth.json and ~/.codex-accounts.json (and
+# again under explicit paths), so each importer decodes a token once and
+# drops the dict (and the tokens it is keyed by) when it returns.
+JwtPayloads = Dict[str, Optional[Dict[str, Any]]]
+
+
+def _decode_jwt_memo(token: str, payloads: JwtPayloads) -> Optional[Dict[str, Any]]:
+    """decode_jwt_unverified, memoized in the caller's batch dict."""
+    try:
+        return payloads[token]
+    except KeyError:
+        payload = payloads[token] = decode_jwt_unverified(token)
+        return payload
+
+
+def _prime_jwt_payloads(tokens: List[Any], payloads: JwtPayloads) -> None:
+    """Decode all tokens not yet in `payloads` in one batch."""
+    missing = [
+        token
+        for token in dict.fromkeys(tokens)
+        if isinstance(token, str) and token and token not in payloads
+    ]
+    payloads.update(zip(missing, decode_jwt_payloads_batch(missing)))
+
+
+def _copy_credential_file(source_path: Path, local_path: Path) -> None:
+    """
+    Copy a credential file's contents and restrict it to the owner.
+
+    copyfile skips the permission-bit copy that shutil.copy does (and can
+    use the kernel's in-place copy path); the secrets get 0o600 instead of
+    whatever mode the source had.
+    """
+    shutil.copyfile(source_path, local_path)
+    try:
+        os.chmod(local_path, 0o600)
+    except (OSError, AttributeError):
+        # Windows may not support chmod, ignore
+        pass
+
+
+# Refuse to write through a symlink planted at a credential path (POSIX only)
+_CREDENTIAL_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_NOFOLLOW", 0)
+)
+
+
+def _write_credential_file(local_path: Path, data: bytes) -> None:
+    """
+    Write a credential file in one call, owner-only.
+
+    New files are created 0o600 directly; existing files are tightened
+    afterwards, since the creation mode only applies to new files.
+    """
+    fd = os.open(local_path, _CREDENTIAL_OPEN_FLAGS, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    try:
+        os.chmod(local_path, 0o600)
+    except (OSError, AttributeError):
+        # Windows may not support chmod, ignore
+        pass
+
+
+def _read_json_file(path: Path) -> Tuple[Any, Optional[Exception]]:
+    """Read and parse one JSON file, returning (payload, error)."""
+    try:
+        return _json_loads(path.read_bytes()), None
+    except Exception as e:
+        return None, e
+
+
+def _read_json_files(paths: List[Path]) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Read and parse several JSON files as one batch, preserving order.
+
+    Each file is read with a single read_bytes() call; multiple files are
+    read concurrently so their disk latency overlaps.
+    """
+    if len(paths) <= 1:
+        return [_read_json_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(DISCOVERY_MAX_WORKERS, len(paths))) as pool:
+        return list(pool.map(_read_json_file, paths))
+
+
+def _codex_accounts_list(accounts_data: Any) -> List[Any]:
+    """Return the entries of a parsed .codex-accounts.json ({"accounts": [...]} or a bare list)."""
+    if isinstance(accounts_data, dict):
+        raw_accounts = accounts_data.get("accounts")
+        if isinstance(raw_accounts, list):
+            return raw_accounts
+    elif isinstance(accounts_data, list):
+        return accounts_data
+    return []
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return a file's mtime in nanoseconds, or None if it cannot be stat'ed."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class CredentialManager:
     """
@@ -72,7 +220,9 @@ class CredentialManager:
         self.oauth_base_dir = Path(oauth_dir) if oauth_dir else get_oauth_dir()
         self.oauth_base_dir.mkdir(parents=True, exist_ok=True)
 
-    def _discover_env_oauth_credentials(self) -> Dict[str, List[str]]:
+    def _discover_env_oauth_credentials(
+        self,
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
         """
         Discover OAuth credentials defined via environment variables.
 
@@ -80,37 +230,49 @@ class CredentialManager:
         1. Single credential: ANTIGRAVITY_ACCESS_TOKEN + ANTIGRAVITY_REFRESH_TOKEN
         2. Multiple credentials: ANTIGRAVITY_1_ACCESS_TOKEN + ANTIGRAVITY_1_REFRESH_TOKEN, etc.
 
+        The same pass over the environment also collects PROVIDER_OAUTH_* file
+        path overrides, so discovery only walks the env vars once.
+
         Returns:
-            Dict mapping provider name to list of virtual paths (e.g., "env://antigravity/1")
+            Tuple of:
+            - Dict mapping provider name to list of virtual paths (e.g., "env://antigravity/1")
+            - Dict mapping lowercased provider name to OAuth file path overrides
         """
         env_credentials: Dict[str, Set[str]] = {}
+        env_oauth_paths: Dict[str, List[str]] = {}
 
-        for provider, env_prefix in ENV_OAUTH_PROVIDERS.items():
-            found_indices: Set[str] = set()
+        # Check for numbered credentials (PROVIDER_N_ACCESS_TOKEN pattern)
+        # Pattern: ANTIGRAVITY_1_ACCESS_TOKEN, ANTIGRAVITY_2_ACCESS_TOKEN, etc.
+        numbered_indices: Dict[str, Set[str]] = {}
+        # Plain string checks instead of a regex: one pass over the env keys,
+        # with a cheap suffix test rejecting nearly all of them up front
+        for key, value in self.env_vars.items():
+            # OAuth file path overrides (e.g. GEMINI_CLI_OAUTH_1=/path/creds.json)
+            if "_OAUTH_" in key:
+                paths = env_oauth_paths.setdefault(
+                    key.partition("_OAUTH_")[0].lower(), []
+                )
+                if value:  # Only consider non-empty values
+                    paths.append(value)
 
-            # Check for numbered credentials (PROVIDER_N_ACCESS_TOKEN pattern)
-            # Pattern: ANTIGRAVITY_1_ACCESS_TOKEN, ANTIGRAVITY_2_ACCESS_TOKEN, etc.
-            numbered_pattern = re.compile(rf"^{env_prefix}_(\d+)_ACCESS_TOKEN$")
+            if not key.endswith(_ACCESS_TOKEN_SUFFIX):
+                continue
+            env_prefix, _, index = key[: -len(_ACCESS_TOKEN_SUFFIX)].rpartition("_")
+            provider = _ENV_PREFIX_TO_PROVIDER.get(env_prefix)
+            if provider is None or not index.isdecimal():
+                continue
+            # Verify refresh token also exists
+            if self.env_vars.get(f"{env_prefix}_{index}_REFRESH_TOKEN"):
+                numbered_indices.setdefault(provider, set()).add(index)
 
-            for key in self.env_vars.keys():
-                match = numbered_pattern.match(key)
-                if match:
-                    index = match.group(1)
-                    # Verify refresh token also exists
-                    refresh_key = f"{env_prefix}_{index}_REFRESH_TOKEN"
-                    if refresh_key in self.env_vars and self.env_vars[refresh_key]:
-                        found_indices.add(index)
+        for provider, env_prefix in ENV_OAUTH_PROVIDERS.items():
+            found_indices = numbered_indices.get(provider, set())
 
             # Check for legacy single credential (PROVIDER_ACCESS_TOKEN pattern)
             # Only use this if no numbered credentials exist
             if not found_indices:
-                access_key = f"{env_prefix}_ACCESS_TOKEN"
-                refresh_key = f"{env_prefix}_REFRESH_TOKEN"
-                if (
-                    access_key in self.env_vars
-                    and self.env_vars[access_key]
-                    and refresh_key in self.env_vars
-                    and self.env_vars[refresh_key]
+                if self.env_vars.get(f"{env_prefix}_ACCESS_TOKEN") and self.env_vars.get(
+                    f"{env_prefix}_REFRESH_TOKEN"
                 ):
                     # Use "0" as the index for legacy single credential
                     found_indices.add("0")
@@ -128,7 +290,7 @@ class CredentialManager:
             sorted_indices = sorted(indices, key=lambda x: int(x))
             result[provider] = [f"env://{provider}/{idx}" for idx in sorted_indices]
 
-        return result
+        return result, env_oauth_paths
 
     # -------------------------------------------------------------------------
     # OpenAI Codex first-run import helpers
@@ -138,6 +300,7 @@ class CredentialManager:
         self,
         access_token: str,
         id_token: Optional[str],
+        payloads: Optional[JwtPayloads] = None,
     ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
         """
         Extract (account_id, email, exp_ms) from Codex JWTs.
@@ -146,9 +309,15 @@ class CredentialManager:
         - account_id: access_token -> id_token
         - email: id_token -> access_token
         - exp: access_token -> id_token
+
+        `payloads` is the import batch's decoded-token dict, if any.
         """
-        access_payload = decode_jwt_unverified(access_token)
-        id_payload = decode_jwt_unverified(id_token) if id_token else None
+        if payloads is None:
+            payloads = {}
+        # Both payloads are needed: email prefers the id_token, so the id_token
+        # can't be skipped even when the access token carries every claim.
+        access_payload = _decode_jwt_memo(access_token, payloads)
+        id_payload = _decode_jwt_memo(id_token, payloads) if id_token else None
 
         account_id = extract_account_id_from_payload(access_payload) or extract_account_id_from_payload(
             id_payload
@@ -160,7 +329,12 @@ class CredentialManager:
 
         return account_id, email, exp_ms
 
-    def _normalize_openai_codex_auth_json_record(self, auth_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _normalize_openai_codex_auth_json_record(
+        self,
+        auth_data: Dict[str, Any],
+        now: float,
+        payloads: Optional[JwtPayloads] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Normalize ~/.codex/auth.json format to proxy schema."""
         tokens = auth_data.get("tokens")
         if not isinstance(tokens, dict):
@@ -173,7 +347,9 @@ class CredentialManager:
         if not isinstance(access_token, str) or not isinstance(refresh_token, str):
             return None
 
-        account_id, email, exp_ms = self._extract_codex_identity(access_token, id_token)
+        account_id, email, exp_ms = self._extract_codex_identity(
+            access_token, id_token, payloads
+        )
 
         # Respect explicit account_id from source tokens if present
         explicit_account = tokens.get("account_id")
@@ -182,7 +358,7 @@ class CredentialManager:
 
         if exp_ms is None:
             # conservative fallback to 5 minutes from now
-            exp_ms = int((time.time() + 300) * 1000)
+            exp_ms = int((now + 300) * 1000)
 
         return {
             "access_token": access_token,
@@ -193,13 +369,18 @@ class CredentialManager:
             "_proxy_metadata": {
                 "email": email,
                 "account_id": account_id,
-                "last_check_timestamp": time.time(),
+                "last_check_timestamp": now,
                 "loaded_from_env": False,
                 "env_credential_index": None,
             },
         }
 
-    def _normalize_openai_codex_accounts_record(self, account: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _normalize_openai_codex_accounts_record(
+        self,
+        account: Dict[str, Any],
+        now: float,
+        payloads: Optional[JwtPayloads] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Normalize one ~/.codex-accounts.json account entry to proxy schema."""
         access_token = account.get("access")
         refresh_token = account.get("refresh")
@@ -208,7 +389,9 @@ class CredentialManager:
         if not isinstance(access_token, str) or not isinstance(refresh_token, str):
             return None
 
-        account_id, email, exp_ms = self._extract_codex_identity(access_token, id_token)
+        account_id, email, exp_ms = self._extract_codex_identity(
+            access_token, id_token, payloads
+        )
 
         explicit_account = account.get("accountId")
         if isinstance(explicit_account, str) and explicit_account.strip():
@@ -223,7 +406,7 @@ class CredentialManager:
             exp_ms = int(expires)
 
         if exp_ms is None:
-            exp_ms = int((time.time() + 300) * 1000)
+            exp_ms = int((now + 300) * 1000)
 
         return {
             "access_token": access_token,
@@ -234,39 +417,78 @@ class CredentialManager:
             "_proxy_metadata": {
                 "email": email,
                 "account_id": account_id,
-                "last_check_timestamp": time.time(),
+                "last_check_timestamp": now,
                 "loaded_from_env": False,
                 "env_credential_index": None,
             },
         }
 
-    def _dedupe_openai_codex_records(
+    def _normalize_openai_codex_accounts(
         self,
-        records: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        """Deduplicate normalized Codex credential records by account/email identity."""
-        unique: List[Dict[str, Any]] = []
-        seen_account_ids: Set[str] = set()
-        seen_emails: Set[str] = set()
+        accounts: List[Any],
+        now: float,
+        payloads: Optional[JwtPayloads] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Normalize ~/.codex-accounts.json entries, preserving order.
 
-        for record in records:
-            metadata = record.get("_proxy_metadata", {})
-            account_id = metadata.get("account_id")
-            email = metadata.get("email")
+        `now` is the batch timestamp shared by every record; `payloads` is the
+        batch's decoded-token dict (a fresh one is used when omitted).
 
-            if isinstance(account_id, str) and account_id:
-                if account_id in seen_account_ids:
-                    continue
-                seen_account_ids.add(account_id)
+        Returns one item per entry: the normalized record, or None when the
+        entry is not an object or is missing tokens.
+        """
 
-            if isinstance(email, str) and email:
-                if email in seen_emails:
-                    continue
-                seen_emails.add(email)
+        if payloads is None:
+            payloads = {}
+        # Decode every JWT in the batch up front; the per-account normalizers
+        # below then find them in `payloads`
+        _prime_jwt_payloads(
+            [
+                token
+                for account in accounts
+                if isinstance(account, dict)
+                for token in (account.get("access"), account.get("idToken"))
+            ],
+            payloads,
+        )
 
-            unique.append(record)
+        return [
+            self._normalize_openai_codex_accounts_record(account, now, payloads)
+            if isinstance(account, dict)
+            else None
+            for account in accounts
+        ]
+
+    @staticmethod
+    def _claim_codex_identity(
+        record: Dict[str, Any],
+        seen: Set[Tuple[str, str]],
+    ) -> bool:
+        """
+        Record a normalized Codex record's identity; False if already seen.
+
+        Identities are tagged ("account_id", ...) / ("email", ...) entries in
+        one set, checked in that order, so callers can dedupe while they
+        normalize instead of in a second pass.
+        """
+        metadata = record.get("_proxy_metadata", {})
+        for field in ("account_id", "email"):
+            value = metadata.get(field)
+            if isinstance(value, str) and value:
+                identity = (field, value)
+                if identity in seen:
+                    return False
+                seen.add(identity)
+        return True
 
-        return unique
+    def _dedupe_openai_codex_records(
+        self,
+        records: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Deduplicate normalized Codex credential records by account/email identity."""
+        seen: Set[Tuple[str, str]] = set()
+        return [record for record in records if self._claim_codex_identity(record, seen)]
 
     def _import_openai_codex_cli_credentials(
         self,
@@ -280,21 +502,28 @@ class CredentialManager:
         - ~/.codex/auth.json (single account)
         - ~/.codex-accounts.json (multi-account)
         """
-        auth_json_path = auth_json_path or (Path.home() / ".codex" / "auth.json")
-        accounts_json_path = accounts_json_path or (Path.home() / ".codex-accounts.json")
+        auth_json_path = auth_json_path or _DEFAULT_CODEX_AUTH_JSON
+        accounts_json_path = accounts_json_path or _DEFAULT_CODEX_ACCOUNTS_JSON
 
+        # Unique records only: duplicates are dropped as they are normalized
         normalized_records: List[Dict[str, Any]] = []
+        # One timestamp and one decoded-JWT dict for the whole import batch
+        now = time.time()
+        payloads: JwtPayloads = {}
+        seen_identities: Set[Tuple[str, str]] = set()
 
         # Source 1: ~/.codex/auth.json
         if auth_json_path.exists():
             try:
-                with open(auth_json_path, "r") as f:
-                    auth_data = json.load(f)
+                auth_data = _json_loads(auth_json_path.read_bytes())
 
                 if isinstance(auth_data, dict):
-                    record = self._normalize_openai_codex_auth_json_record(auth_data)
+                    record = self._normalize_openai_codex_auth_json_record(
+                        auth_data, now, payloads
+                    )
                     if record:
-                        normalized_records.append(record)
+                        if self._claim_codex_identity(record, seen_identities):
+                            normalized_records.append(record)
                     else:
                         lib_logger.warning(
                             "OpenAI Codex import: skipping malformed ~/.codex/auth.json record"
@@ -311,32 +540,21 @@ class CredentialManager:
         # Source 2: ~/.codex-accounts.json
         if accounts_json_path.exists():
             try:
-                with open(accounts_json_path, "r") as f:
-                    accounts_data = json.load(f)
-
-                accounts = []
-                if isinstance(accounts_data, dict):
-                    raw_accounts = accounts_data.get("accounts")
-                    if isinstance(raw_accounts, list):
-                        accounts = raw_accounts
-                elif isinstance(accounts_data, list):
-                    accounts = accounts_data
-
-                if not accounts:
+                records = self._normalize_openai_codex_accounts(
+                    _codex_accounts_list(_json_loads(accounts_json_path.read_bytes())),
+                    now,
+                    payloads,
+                )
+
+                if not records:
                     lib_logger.warning(
                         "OpenAI Codex import: ~/.codex-accounts.json has no accounts list"
                     )
 
-                for idx, account in enumerate(accounts):
-                    if not isinstance(account, dict):
-                        lib_logger.warning(
-                            f"OpenAI Codex import: skipping malformed account entry #{idx + 1}"
-                        )
-                        continue
-
-                    record = self._normalize_openai_codex_accounts_record(account)
+                for idx, record in enumerate(records):
                     if record:
-                        normalized_records.append(record)
+                        if self._claim_codex_identity(record, seen_identities):
+                            normalized_records.append(record)
                     else:
                         lib_logger.warning(
                             f"OpenAI Codex import: skipping malformed account entry #{idx + 1}"
@@ -350,33 +568,26 @@ class CredentialManager:
         if not normalized_records:
             return []
 
-        deduped_records = self._dedupe_openai_codex_records(normalized_records)
-
         imported_paths: List[str] = []
-        for i, record in enumerate(deduped_records, 1):
+        # Identifiers for the summary log, taken from the in-memory records
+        identifiers: List[str] = []
+        for i, record in enumerate(normalized_records, 1):
             local_path = self.oauth_base_dir / f"openai_codex_oauth_{i}.json"
             try:
-                with open(local_path, "w") as f:
-                    json.dump(record, f, indent=2)
+                _write_credential_file(local_path, _json_dumps_indent(record))
                 imported_paths.append(str(local_path.resolve()))
             except Exception as e:
                 lib_logger.error(
                     f"OpenAI Codex import: failed writing '{local_path.name}': {e}"
                 )
+                continue
 
-        if imported_paths:
-            identifiers = []
-            for p in imported_paths:
-                try:
-                    with open(p, "r") as f:
-                        payload = json.load(f)
-                    meta = payload.get("_proxy_metadata", {})
-                    identifiers.append(
-                        meta.get("email") or meta.get("account_id") or Path(p).name
-                    )
-                except Exception:
-                    identifiers.append(Path(p).name)
+            meta = record.get("_proxy_metadata", {})
+            identifiers.append(
+                meta.get("email") or meta.get("account_id") or local_path.name
+            )
 
+        if imported_paths:
             lib_logger.info(
                 "OpenAI Codex first-run import complete: "
                 f"{len(imported_paths)} credential(s) imported ({', '.join(str(x) for x in identifiers)})"
@@ -397,25 +608,33 @@ class CredentialManager:
         if not source_paths:
             return []
 
+        # Unique records only: duplicates are dropped as they are normalized
         normalized_records: List[Dict[str, Any]] = []
+        # One timestamp and one decoded-JWT dict for the whole import batch
+        now = time.time()
+        payloads: JwtPayloads = {}
+        seen_identities: Set[Tuple[str, str]] = set()
         passthrough_paths: List[Path] = []
 
-        for source_path in sorted(source_paths):
-            try:
-                with open(source_path, "r") as f:
-                    payload = json.load(f)
-            except Exception as e:
+        source_paths = sorted(source_paths)
+        for source_path, (payload, error) in zip(
+            source_paths, _read_json_files(source_paths)
+        ):
+            if error is not None:
                 lib_logger.warning(
-                    f"OpenAI Codex explicit import: failed to parse '{source_path}': {e}. Falling back to direct copy."
+                    f"OpenAI Codex explicit import: failed to parse '{source_path}': {error}. Falling back to direct copy."
                 )
                 passthrough_paths.append(source_path)
                 continue
 
             # Raw ~/.codex/auth.json shape
             if isinstance(payload, dict) and isinstance(payload.get("tokens"), dict):
-                record = self._normalize_openai_codex_auth_json_record(payload)
+                record = self._normalize_openai_codex_auth_json_record(
+                    payload, now, payloads
+                )
                 if record:
-                    normalized_records.append(record)
+                    if self._claim_codex_identity(record, seen_identities):
+                        normalized_records.append(record)
                     continue
 
             # Raw ~/.codex-accounts.json shape (object or root list)
@@ -427,16 +646,19 @@ class CredentialManager:
 
             if accounts:
                 converted = 0
-                for idx, account in enumerate(accounts):
+                records = self._normalize_openai_codex_accounts(
+                    accounts, now, payloads
+                )
+                for idx, (account, record) in enumerate(zip(accounts, records)):
                     if not isinstance(account, dict):
                         lib_logger.warning(
                             f"OpenAI Codex explicit import: skipping malformed account entry #{idx + 1} from '{source_path.name}'"
                         )
                         continue
 
-                    record = self._normalize_openai_codex_accounts_record(account)
                     if record:
-                        normalized_records.append(record)
+                        if self._claim_codex_identity(record, seen_identities):
+                            normalized_records.append(record)
                         converted += 1
 
                 if converted > 0:
@@ -454,17 +676,14 @@ class CredentialManager:
             # Unknown shape: preserve existing behavior (copy as-is)
             passthrough_paths.append(source_path)
 
-        deduped_records = self._dedupe_openai_codex_records(normalized_records)
-
         imported_paths: List[str] = []
         next_index = 1
 
         # Write normalized records first
-        for record in deduped_records:
+        for record in normalized_records:
             local_path = self.oauth_base_dir / f"openai_codex_oauth_{next_index}.json"
             try:
-                with open(local_path, "w") as f:
-                    json.dump(record, f, indent=2)
+                _write_credential_file(local_path, _json_dumps_indent(record))
                 imported_paths.append(str(local_path.resolve()))
                 next_index += 1
             except Exception as e:
@@ -476,7 +695,7 @@ class CredentialManager:
         for source_path in passthrough_paths:
             local_path = self.oauth_base_dir / f"openai_codex_oauth_{next_index}.json"
             try:
-                shutil.copy(source_path, local_path)
+                _copy_credential_file(source_path, local_path)
                 imported_paths.append(str(local_path.resolve()))
                 next_index += 1
             except Exception as e:
@@ -492,116 +711,251 @@ class CredentialManager:
 
         return imported_paths
 
+    def _discovery_cache_key(
+        self,
+    ) -> Tuple[
+        str, FrozenSet[Tuple[str, str]], Optional[int], Tuple[Optional[int], ...]
+    ]:
+        """
+        Snapshot the inputs discovery depends on.
+
+        That is the local credential directory, the OAuth-related env vars (token vars and *_OAUTH_* path
+        overrides), the local credential directory's mtime, which changes
+        whenever a credential file is added, removed or renamed, and the
+        mtimes of the import sources (Codex CLI stores and override files),
+        so a login after the first discovery is picked up.
+        """
+        env_items = frozenset(
+            (key, value)
+            for key, value in self.env_vars.items()
+            if "_OAUTH_" in key or key.startswith(_ENV_OAUTH_KEY_PREFIXES)
+        )
+        try:
+            dir_mtime = self.oauth_base_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        sources = [_DEFAULT_CODEX_AUTH_JSON, _DEFAULT_CODEX_ACCOUNTS_JSON]
+        sources.extend(
+            Path(value).expanduser()
+            for key, value in sorted(env_items)
+            if "_OAUTH_" in key and value
+        )
+        return (
+            str(self.oauth_base_dir.resolve()),
+            env_items,
+            dir_mtime,
+            tuple(_mtime_ns(path) for path in sources),
+        )
+
     def discover_and_prepare(self) -> Dict[str, List[str]]:
+        """
+        Discover OAuth credentials and prepare local copies.
+
+        Results are cached across instances and reused while the credential
+        directory, the OAuth-related env vars and the import sources are
+        unchanged.
+        """
+        entry = _DISCOVERY_CACHE["entry"]
+        if entry is not None:
+            cached_key, cached_config = entry
+            if cached_key == self._discovery_cache_key():
+                lib_logger.debug("OAuth credential discovery inputs unchanged; using cached result.")
+                return {p: list(paths) for p, paths in cached_config.items()}
+
         lib_logger.info("Starting automated OAuth credential discovery...")
         final_config = {}
 
+        # One directory scan serves both the fast path and PHASE 2
+        local_creds = self._scan_local_credentials(list(DEFAULT_OAUTH_DIRS))
+
+        # Fast path (every restart after first run): each provider already has
+        # local files and no env var could hold OAuth tokens, so there is
+        # nothing to import - skip the env token scan and the worker pool.
+        if all(local_creds.values()) and not any(
+            key.startswith(_ENV_OAUTH_KEY_PREFIXES) for key in self.env_vars
+        ):
+            for provider, paths in local_creds.items():
+                lib_logger.info(
+                    f"Found {len(paths)} existing local credential(s) for {provider}. Skipping discovery."
+                )
+                final_config[provider] = [str(p.resolve()) for p in paths]
+            return self._finish_discovery(final_config)
+
         # PHASE 1: Discover environment variable-based OAuth credentials
         # These take priority for stateless deployments
-        env_oauth_creds = self._discover_env_oauth_credentials()
+        env_oauth_creds, env_oauth_paths = self._discover_env_oauth_credentials()
         for provider, virtual_paths in env_oauth_creds.items():
             lib_logger.info(
                 f"Using {len(virtual_paths)} env-based credential(s) for {provider}"
             )
             final_config[provider] = virtual_paths
 
-        # Extract OAuth file paths from environment variables
-        env_oauth_paths = {}
-        for key, value in self.env_vars.items():
-            if "_OAUTH_" in key:
-                provider = key.split("_OAUTH_")[0].lower()
-                if provider not in env_oauth_paths:
-                    env_oauth_paths[provider] = []
-                if value:  # Only consider non-empty values
-                    env_oauth_paths[provider].append(value)
-
         # PHASE 2: Discover file-based OAuth credentials
-        for provider, default_dir in DEFAULT_OAUTH_DIRS.items():
+        # Providers are independent (separate files, separate local names), so
+        # their disk work - glob, copy, Codex import - runs concurrently. The
+        # results are merged back in DEFAULT_OAUTH_DIRS order.
+        pending: List[str] = []
+        for provider in DEFAULT_OAUTH_DIRS:
             # Skip if already discovered from environment variables
             if provider in final_config:
                 lib_logger.debug(
                     f"Skipping file discovery for {provider} - using env-based credentials"
                 )
                 continue
+            pending.append(provider)
+
+        if pending:
+            workers = min(DISCOVERY_MAX_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                prepared = list(
+                    pool.map(
+                        lambda provider: self._prepare_provider_credentials(
+                            provider,
+                            env_oauth_paths.get(provider, []),
+                            local_creds[provider],
+                        ),
+                        pending,
+                    )
+                )
+            for provider, paths in zip(pending, prepared):
+                if paths:
+                    final_config[provider] = paths
+
+        return self._finish_discovery(final_config)
 
-            # Check for existing local credentials first. If found, use them and skip discovery.
-            local_provider_creds = sorted(
-                list(self.oauth_base_dir.glob(f"{provider}_oauth_*.json"))
+    async def adiscover_and_prepare(self) -> Dict[str, List[str]]:
+        """
+        Async form of discover_and_prepare() for use inside an event loop.
+
+        Discovery (env scan, directory scan, Codex import, copies) runs on a
+        worker thread, so other startup coroutines keep running while it does
+        its disk I/O.
+        """
+        return await asyncio.to_thread(self.discover_and_prepare)
+
+    def _finish_discovery(
+        self, final_config: Dict[str, List[str]]
+    ) -> Dict[str, List[str]]:
+        """Log completion and cache the discovery result."""
+        lib_logger.info("OAuth credential discovery complete.")
+        # Key on the post-discovery state, since first-run copies touch the dir
+        _DISCOVERY_CACHE["entry"] = (
+            self._discovery_cache_key(),
+            {p: list(paths) for p, paths in final_config.items()},
+        )
+        return final_config
+
+    def _scan_local_credentials(self, providers: List[str]) -> Dict[str, List[Path]]:
+        """
+        List existing local credential files for several providers at once.
+
+        One directory scan replaces a glob per provider; entries are bucketed
+        by their "<provider>_oauth_*.json" prefix and sorted like the glob was.
+        """
+        buckets: Dict[str, List[Path]] = {provider: [] for provider in providers}
+        prefixes = [(f"{provider}_oauth_", provider) for provider in providers]
+        try:
+            with os.scandir(self.oauth_base_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".json") or not entry.is_file():
+                        continue
+                    for prefix, provider in prefixes:
+                        if name.startswith(prefix):
+                            buckets[provider].append(Path(entry.path))
+                            break
+        except OSError as e:
+            lib_logger.warning(
+                f"Failed to scan local credential directory '{self.oauth_base_dir}': {e}"
             )
-            if local_provider_creds:
-                lib_logger.info(
-                    f"Found {len(local_provider_creds)} existing local credential(s) for {provider}. Skipping discovery."
-                )
-                final_config[provider] = [
-                    str(p.resolve()) for p in local_provider_creds
-                ]
-                continue
+        for paths in buckets.values():
+            paths.sort()
+        return buckets
 
-            # If no local credentials exist, proceed with one-time import/copy.
-            discovered_paths = set()
-
-            # 1. Add paths from environment variables first, as they are overrides
-            for path_str in env_oauth_paths.get(provider, []):
-                path = Path(path_str).expanduser()
-                if path.exists():
-                    discovered_paths.add(path)
-
-            # 2. Provider-specific first-run import for OpenAI Codex
-            # Trigger only when:
-            # - provider == openai_codex
-            # - no local openai_codex_oauth_*.json already exist (checked above)
-            # - no env-based OPENAI_CODEX credentials were selected (provider not in final_config)
-            # - no explicit OPENAI_CODEX_OAUTH_* file paths were provided
-            if provider == "openai_codex" and not discovered_paths:
-                imported = self._import_openai_codex_cli_credentials()
-                if imported:
-                    final_config[provider] = imported
-                    continue
+    def _prepare_provider_credentials(
+        self,
+        provider: str,
+        override_paths: List[str],
+        local_provider_creds: List[Path],
+    ) -> List[str]:
+        """
+        Prepare local file-based credentials for one provider.
 
-            # 3. Provider-specific explicit-path import handling for OpenAI Codex
-            # This normalizes raw ~/.codex/auth.json / ~/.codex-accounts.json when
-            # supplied via OPENAI_CODEX_OAUTH_* env vars.
-            if provider == "openai_codex" and discovered_paths:
-                imported = self._import_openai_codex_explicit_paths(
-                    sorted(list(discovered_paths))
-                )
-                if imported:
-                    final_config[provider] = imported
-                    continue
+        Args:
+            provider: Provider name (key of DEFAULT_OAUTH_DIRS)
+            override_paths: Source paths from PROVIDER_OAUTH_* env vars
+            local_provider_creds: Existing local credential files (sorted)
 
-            # 4. Default directory scan remains disabled (local-first policy)
-            # if not discovered_paths and default_dir.exists():
-            #     for json_file in default_dir.glob('*.json'):
-            #         discovered_paths.add(json_file)
+        Returns:
+            Local credential paths, or an empty list if none were found.
+        """
+        # Check for existing local credentials first. If found, use them and skip discovery.
+        if local_provider_creds:
+            lib_logger.info(
+                f"Found {len(local_provider_creds)} existing local credential(s) for {provider}. Skipping discovery."
+            )
+            return [str(p.resolve()) for p in local_provider_creds]
+
+        # If no local credentials exist, proceed with one-time import/copy.
+        discovered_paths = set()
+
+        # 1. Add paths from environment variables first, as they are overrides
+        for path_str in override_paths:
+            path = Path(path_str).expanduser()
+            if path.exists():
+                discovered_paths.add(path)
+
+        # 2. Provider-specific first-run import for OpenAI Codex
+        # Trigger only when:
+        # - provider == openai_codex
+        # - no local openai_codex_oauth_*.json already exist (checked above)
+        # - no env-based OPENAI_CODEX credentials were selected (caller skips those)
+        # - no explicit OPENAI_CODEX_OAUTH_* file paths were provided
+        if provider == "openai_codex" and not discovered_paths:
+            imported = self._import_openai_codex_cli_credentials()
+            if imported:
+                return imported
+
+        # 3. Provider-specific explicit-path import handling for OpenAI Codex
+        # This normalizes raw ~/.codex/auth.json / ~/.codex-accounts.json when
+        # supplied via OPENAI_CODEX_OAUTH_* env vars.
+        if provider == "openai_codex" and discovered_paths:
+            imported = self._import_openai_codex_explicit_paths(
+                sorted(list(discovered_paths))
+            )
+            if imported:
+                return imported
 
-            if not discovered_paths:
-                lib_logger.debug(f"No credential files found for provider: {provider}")
-                continue
+        # 4. Default directory scan remains disabled (local-first policy)
+        # if not discovered_paths and default_dir.exists():
+        #     for json_file in default_dir.glob('*.json'):
+        #         discovered_paths.add(json_file)
 
-            prepared_paths = []
-            # Sort paths to ensure consistent numbering for the initial copy
-            for i, source_path in enumerate(sorted(list(discovered_paths))):
-                account_id = i + 1
-                local_filename = f"{provider}_oauth_{account_id}.json"
-                local_path = self.oauth_base_dir / local_filename
-
-                try:
-                    # Since we've established no local files exist, we can copy directly.
-                    shutil.copy(source_path, local_path)
-                    lib_logger.info(
-                        f"Copied '{source_path.name}' to local pool at '{local_path}'."
-                    )
-                    prepared_paths.append(str(local_path.resolve()))
-                except Exception as e:
-                    lib_logger.error(
-                        f"Failed to process OAuth file from '{source_path}': {e}"
-                    )
+        if not discovered_paths:
+            lib_logger.debug(f"No credential files found for provider: {provider}")
+            return []
+
+        prepared_paths = []
+        # Sort paths to ensure consistent numbering for the initial copy
+        for i, source_path in enumerate(sorted(list(discovered_paths))):
+            account_id = i + 1
+            local_filename = f"{provider}_oauth_{account_id}.json"
+            local_path = self.oauth_base_dir / local_filename
 
-            if prepared_paths:
+            try:
+                # Since we've established no local files exist, we can copy directly.
+                _copy_credential_file(source_path, local_path)
                 lib_logger.info(
-                    f"Discovered and prepared {len(prepared_paths)} credential(s) for provider: {provider}"
+                    f"Copied '{source_path.name}' to local pool at '{local_path}'."
+                )
+                prepared_paths.append(str(local_path.resolve()))
+            except Exception as e:
+                lib_logger.error(
+                    f"Failed to process OAuth file from '{source_path}': {e}"
                 )
-                final_config[provider] = prepared_paths
 
-        lib_logger.info("OAuth credential discovery complete.")
-        return final_config
+        if prepared_paths:
+            lib_logger.info(
+                f"Discovered and prepared {len(prepared_paths)} credential(s) for provider: {provider}"
+            )
+        return prepared_paths
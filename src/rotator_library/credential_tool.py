@@ -4,20 +4,23 @@
 # src/rotator_library/credential_tool.py
 
 import asyncio
+import io
 import json
+import logging
 import os
 import re
+import stat
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dotenv import set_key, get_key
+from typing import Dict, Iterable, List, Optional, Tuple
+from dotenv import dotenv_values, set_key
 
 # NOTE: Heavy imports (provider_factory, PROVIDER_PLUGINS) are deferred
-# to avoid 6-7 second delay before showing loading screen
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.text import Text
+# to avoid 6-7 second delay before showing loading screen. rich is deferred
+# too (see _ensure_rich) so .env/credential helpers don't pull it in.
 
 from .utils.paths import get_oauth_dir, get_data_file
 from .provider_config import LITELLM_PROVIDERS, PROVIDER_CATEGORIES, PROVIDER_BLACKLIST
@@ -28,6 +31,27 @@ from .litellm_providers import (
 )
 from .providers.utilities.gemini_shared_utils import format_tier_for_display
 
+lib_logger = logging.getLogger("rotator_library")
+
+# Tier ids repeat across credentials and redraws; normalize each one once
+format_tier_for_display = lru_cache(maxsize=64)(format_tier_for_display)
+
+# Credential JSON (de)serialization: orjson when installed, stdlib otherwise.
+# Both produce/accept the same 2-space-indented documents.
+try:
+    import orjson
+
+    def _json_dumps_indent(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps_indent(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
 
 def _get_oauth_base_dir() -> Path:
     """Get the OAuth base directory (lazy, respects EXE vs script mode)."""
@@ -36,12 +60,61 @@ def _get_oauth_base_dir() -> Path:
     return oauth_dir
 
 
+@lru_cache(maxsize=1)
 def _get_env_file() -> Path:
-    """Get the .env file path (lazy, respects EXE vs script mode)."""
+    """
+    Get the .env file path (lazy, respects EXE vs script mode).
+
+    Resolved once per process; call _get_env_file.cache_clear() if the
+    working directory changes.
+    """
     return get_data_file(".env")
 
 
-console = Console()
+# rich classes and the shared console, bound by _ensure_rich() on first use
+Console = Panel = Prompt = Confirm = Table = Text = None
+console = None
+
+# Static menu prompt labels, parsed from markup once by _ensure_rich().
+# Prompt copies its label before appending to it, so sharing them is safe.
+_PROMPT_SELECT_PROVIDER = None
+_PROMPT_SELECT_DELETE = None
+_PROMPT_SELECT_CRED_DELETE = None
+_PROMPT_SELECT_CRED_EDIT = None
+
+
+def _ensure_rich():
+    """
+    Lazy load rich and create the shared console.
+
+    Public entry points (menus, setup/export flows, clear_screen,
+    ensure_env_defaults) call this first; private helpers run under them.
+    """
+    global Console, Panel, Prompt, Confirm, Table, Text, console
+    global _PROMPT_SELECT_PROVIDER, _PROMPT_SELECT_DELETE
+    global _PROMPT_SELECT_CRED_DELETE, _PROMPT_SELECT_CRED_EDIT
+    if console is None:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.prompt import Prompt, Confirm
+        from rich.table import Table
+        from rich.text import Text
+
+        _PROMPT_SELECT_PROVIDER = Text.from_markup(
+            "\n[bold]Select provider or type [red]'b'[/red] to go back[/bold]"
+        )
+        _PROMPT_SELECT_DELETE = Text.from_markup(
+            "\n[bold]Select API key to delete or type [red]'b'[/red] to go back[/bold]"
+        )
+        _PROMPT_SELECT_CRED_DELETE = Text.from_markup(
+            "[bold]Select credential to delete or type [red]'b'[/red] to go back[/bold]"
+        )
+        _PROMPT_SELECT_CRED_EDIT = Text.from_markup(
+            "[bold]Select credential to edit or type [red]'b'[/red] to go back[/bold]"
+        )
+
+        console = Console()
+    return console
 
 # Global variables for lazily loaded modules
 _provider_factory = None
@@ -69,6 +142,31 @@ OAUTH_FRIENDLY_NAMES = {
     "openai_codex": "OpenAI Codex",
 }
 
+# Providers that support OAuth credentials
+OAUTH_PROVIDERS = ("gemini_cli", "qwen_code", "iflow", "antigravity", "openai_codex")
+
+# Google OAuth providers (shown with tier/project columns)
+_GOOGLE_OAUTH = frozenset({"gemini_cli", "antigravity"})
+
+# Resolved display name for every OAuth provider
+_FRIENDLY = {p: OAUTH_FRIENDLY_NAMES.get(p, p.title()) for p in OAUTH_PROVIDERS}
+
+# Suffixes shown next to providers in the edit-credential menu
+_RECOMMENDED_FOR_EDIT = {"qwen_code": " [green](recommended)[/green]"}
+
+# Auth class instances, created on first use and shared across menus
+_AUTH_INSTANCES: Dict[str, object] = {}
+
+
+def _get_auth(provider_name: str):
+    """Return the shared auth instance for a provider, creating it if needed."""
+    auth_instance = _AUTH_INSTANCES.get(provider_name)
+    if auth_instance is None:
+        provider_factory, _ = _ensure_providers_loaded()
+        auth_class = provider_factory.get_provider_auth_class(provider_name)
+        auth_instance = _AUTH_INSTANCES[provider_name] = auth_class()
+    return auth_instance
+
 
 def _extract_key_number(key_name: str) -> int:
     """Extract the numeric suffix from a key name for proper sorting.
@@ -78,8 +176,42 @@ def _extract_key_number(key_name: str) -> int:
         GEMINI_API_KEY_10 -> 10
         GEMINI_API_KEY -> 0
     """
-    match = re.search(r"_(\d+)$", key_name)
-    return int(match.group(1)) if match else 0
+    _, sep, tail = key_name.rpartition("_")
+    return int(tail) if sep and tail.isdecimal() else 0
+
+
+class _RangeChoices:
+    """
+    Prompt choices "1".."n" plus extra keywords, without building the list.
+
+    Rich's Prompt validates answers with `in` and only renders the list when
+    show_choices is set, so __contains__ parses the number instead of
+    scanning n strings. Accepts exactly what the equivalent list would.
+    """
+
+    __slots__ = ("_n", "_extra")
+
+    def __init__(self, n: int, extra: Tuple[str, ...] = ("b",)):
+        self._n = n
+        self._extra = extra
+
+    def __contains__(self, value: object) -> bool:
+        if value in self._extra:
+            return True
+        return (
+            isinstance(value, str)
+            and value.isascii()
+            and value.isdecimal()
+            and value[0] != "0"
+            and int(value) <= self._n
+        )
+
+    def __iter__(self):
+        yield from map(str, range(1, self._n + 1))
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return self._n + len(self._extra)
 
 
 # Note: _normalize_tier_name was replaced with format_tier_for_display
@@ -121,10 +253,90 @@ def _format_tier_counts(tier_counts: dict) -> str:
     return f"({', '.join(parts)})"
 
 
+@lru_cache(maxsize=64)
+def _tier_summary(tiers: Tuple[Optional[str], ...]) -> str:
+    """Formatted tier counts for a provider's credential tiers, memoized.
+
+    Summaries are redrawn with the same credentials over and over, so the
+    count/format work runs once per distinct tier tuple.
+    """
+    return _format_tier_counts(_count_tiers([{"tier": tier} for tier in tiers]))
+
+
+def _read_env_bytes(env_file: Path) -> bytes:
+    """
+    Read the whole .env file with a single os.read() in the common case.
+
+    Skips the buffered text-IO layer; the file is small and always read whole.
+    """
+    fd = os.open(env_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        # Only loop if the file grew after fstat
+        while len(data) > size:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _decode_env(raw: bytes) -> str:
+    """Decode .env bytes with newlines normalized the way text-mode open() does."""
+    return raw.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _parse_env_file(env_file: Path, raw: Optional[bytes] = None):
+    """
+    Walk the .env file once, yielding (kind, key_name, value) for the
+    entries the credential tool cares about.
+
+    kind is "base" for *_API_BASE entries and "key" for *_API_KEY* entries;
+    other lines are skipped. Values have surrounding quotes stripped.
+
+    Args:
+        env_file: Path to the .env file
+        raw: File contents, if the caller has already read them
+    """
+    if raw is None:
+        raw = _read_env_bytes(env_file)
+
+    for line in _decode_env(raw).splitlines():
+        # Cheap substring test before any per-line string work
+        if "_API_KEY" not in line and "_API_BASE" not in line:
+            continue
+
+        line = line.strip()
+        # Skip comments, empty lines and lines without an assignment
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+
+        key_name, _, value = line.partition("=")
+        key_name = key_name.strip()
+
+        if key_name.endswith("_API_BASE"):
+            kind = "base"
+        elif "_API_KEY" in key_name:
+            kind = "key"
+        else:
+            continue
+
+        yield kind, key_name, value.strip().strip('"').strip("'")
+
+
+# Parsed API keys from the last .env read, keyed by (path, mtime_ns, size) so
+# menu redraws skip re-parsing an unchanged file
+_ENV_CACHE = {"stat": None, "data": None}
+
+
 def _get_api_keys_from_env() -> dict:
     """
     Parse the .env file and return a dictionary of API keys grouped by provider.
-    Keys are sorted numerically within each provider.
+    Providers are in sorted order; keys are sorted numerically within each
+    provider.
 
     Returns:
         Dict mapping provider names to lists of (key_name, key_value) tuples.
@@ -137,128 +349,246 @@ def _get_api_keys_from_env() -> dict:
         return api_keys
 
     try:
-        with open(env_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
-
-                # Look for lines with API_KEY pattern
-                if "_API_KEY" in line and "=" in line:
-                    key_name, _, key_value = line.partition("=")
-                    key_name = key_name.strip()
-                    key_value = key_value.strip().strip('"').strip("'")
-
-                    # Skip PROXY_API_KEY and empty values
-                    if key_name == "PROXY_API_KEY" or not key_value:
-                        continue
-
-                    # Skip placeholder values
-                    if key_value.startswith("YOUR_") or key_value == "":
-                        continue
-
-                    # Extract provider name (everything before _API_KEY)
-                    # Handle cases like GEMINI_API_KEY_1 -> GEMINI
-                    parts = key_name.split("_API_KEY")
-                    if parts:
-                        provider_name = parts[0]
-                        if provider_name not in api_keys:
-                            api_keys[provider_name] = []
-                        api_keys[provider_name].append((key_name, key_value))
-
-        # Sort keys numerically within each provider
+        st = env_file.stat()
+        stat_key = (str(env_file), st.st_mtime_ns, st.st_size)
+        if _ENV_CACHE["stat"] == stat_key:
+            # Copy the lists so callers can't mutate the cached entry
+            return {name: list(keys) for name, keys in _ENV_CACHE["data"].items()}
+
+        raw = _read_env_bytes(env_file)
+        # A file with no API keys at all needs no line-by-line parse
+        entries = _parse_env_file(env_file, raw) if b"_API_KEY" in raw else ()
+
+        for kind, key_name, key_value in entries:
+            if kind != "key":
+                continue
+
+            # Skip PROXY_API_KEY and empty values
+            if key_name == "PROXY_API_KEY" or not key_value:
+                continue
+
+            # Skip placeholder values
+            if key_value.startswith("YOUR_") or key_value == "":
+                continue
+
+            # Extract provider name (everything before _API_KEY)
+            # Handle cases like GEMINI_API_KEY_1 -> GEMINI
+            provider_name = key_name.partition("_API_KEY")[0]
+            if provider_name not in api_keys:
+                api_keys[provider_name] = []
+            api_keys[provider_name].append((key_name, key_value))
+
+        # Sort keys numerically within each provider, and providers by name
+        # once here so menus can iterate the dict as-is
         for provider_name in api_keys:
             api_keys[provider_name].sort(key=lambda x: _extract_key_number(x[0]))
+        api_keys = dict(sorted(api_keys.items()))
+
+        _ENV_CACHE["stat"] = stat_key
+        _ENV_CACHE["data"] = {name: list(keys) for name, keys in api_keys.items()}
 
     except Exception as e:
-        console.print(f"[bold red]Error reading .env file: {e}[/bold red]")
+        _ensure_rich().print(f"[bold red]Error reading .env file: {e}[/bold red]")
 
     return api_keys
 
 
-def _delete_api_key_from_env(key_name: str) -> bool:
+# dotenv_values() of the .env file, keyed by (path, mtime_ns, size); anything
+# that writes the file resets "key"
+_DOTENV_CACHE = {"key": None, "data": None}
+
+
+def _load_env_cached(env_file: Path) -> dict:
+    """
+    Return dotenv_values(env_file), reusing the last parse while the file is
+    unchanged. The returned dict is shared; don't mutate it.
+    """
+    try:
+        st = env_file.stat()
+    except OSError:
+        return {}
+    cache_key = (str(env_file), st.st_mtime_ns, st.st_size)
+    if _DOTENV_CACHE["key"] != cache_key:
+        _DOTENV_CACHE["data"] = dotenv_values(env_file)
+        _DOTENV_CACHE["key"] = cache_key
+    return _DOTENV_CACHE["data"]
+
+
+def _set_env_key(env_path: str, key: str, value: str) -> None:
+    """dotenv set_key() that also drops the cached .env parses."""
+    set_key(env_path, key, value)
+    _ENV_CACHE["stat"] = None
+    _DOTENV_CACHE["key"] = None
+
+
+def _write_env_lines(env_file: Path, lines: List[str]) -> None:
+    """
+    Atomically replace the .env file with the given lines.
+
+    Writes a temp file next to it and swaps it in with os.replace, so readers
+    never see a partially written file. The original permissions are kept.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=env_file.parent, prefix=f"{env_file.name}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            f.writelines(lines)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(env_file.stat().st_mode))
+        except OSError:
+            pass
+        os.replace(tmp_path, env_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        _ENV_CACHE["stat"] = None
+        _DOTENV_CACHE["key"] = None
+
+
+def _format_env_assignment(name: str, value: str, newline: str = "\n") -> str:
+    """Format NAME='value' exactly as dotenv's set_key() writes it."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{name}='{escaped}'{newline}"
+
+
+def _bulk_edit_env(
+    deletes: Iterable[str] = (), sets: Optional[Dict[str, str]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Apply several .env edits with a single read and a single write.
+
+    Lines assigning a name in `deletes` are dropped. Each name in `sets` is
+    rewritten in place (keeping that line's ending) or appended if absent,
+    in the NAME='value' form set_key() uses. Every other line is written back
+    byte for byte. The file is decoded strictly as UTF-8, so a file that is
+    not valid UTF-8 raises UnicodeDecodeError and is left alone instead of
+    being rewritten with replacement characters. A missing file is created,
+    as set_key() would.
+
+    Returns:
+        (original_lines, new_lines), both with line endings kept
+    """
+    env_file = _get_env_file()
+    deletes = frozenset(deletes)
+    sets = dict(sets or {})
+
+    # newline="" splits on any line ending but keeps it untranslated
+    original_lines = (
+        io.StringIO(_read_env_bytes(env_file).decode("utf-8"), newline="").readlines()
+        if env_file.exists()
+        else []
+    )
+
+    new_lines = []
+    written = set()
+    for line in original_lines:
+        name, sep, _ = line.strip().partition("=")
+        if sep and name in deletes:
+            continue
+        if sep and name in sets:
+            newline = line[len(line.rstrip("\r\n")):] or "\n"
+            new_lines.append(_format_env_assignment(name, sets[name], newline))
+            written.add(name)
+            continue
+        new_lines.append(line)
+
+    missing = [name for name in sets if name not in written]
+    if missing:
+        # Appended lines follow the file's own line-ending style
+        newline = "\r\n" if original_lines and original_lines[0].endswith("\r\n") else "\n"
+        if new_lines and not new_lines[-1].endswith(("\n", "\r")):
+            new_lines[-1] += newline
+        new_lines.extend(
+            _format_env_assignment(name, sets[name], newline) for name in missing
+        )
+
+    if new_lines != original_lines:
+        _write_env_lines(env_file, new_lines)
+
+    return original_lines, new_lines
+
+
+def _delete_api_keys_from_env(key_names: Iterable[str]) -> bool:
     """
-    Delete an API key from the .env file with safety backup and comparison.
+    Delete API keys from the .env file with a single read and a single write.
 
-    This function creates a backup of all API keys before deletion,
-    performs the deletion, and then verifies no unintended keys were lost.
+    The file is rewritten through an atomic temp-file swap, so it is either
+    fully updated or left untouched; a failed write never leaves a partial file.
 
     Args:
-        key_name: The exact key name to delete (e.g., "GEMINI_API_KEY_2")
+        key_names: The exact key names to delete (e.g., "GEMINI_API_KEY_2")
 
     Returns:
-        True if deletion was successful and verified, False otherwise
+        True if every key was found and deleted, False otherwise
     """
     env_file = _get_env_file()
+    key_names = frozenset(key_names)
 
     if not env_file.is_file():
-        console.print("[bold red]Error: .env file not found[/bold red]")
+        _ensure_rich().print("[bold red]Error: .env file not found[/bold red]")
         return False
 
     try:
-        # Step 1: Read all lines and backup all API keys
-        with open(env_file, "r") as f:
-            original_lines = f.readlines()
-
-        # Create backup of all API keys before modification
-        api_keys_before = _get_api_keys_from_env()
-        all_keys_before = set()
-        for provider_keys in api_keys_before.values():
-            for kn, kv in provider_keys:
-                all_keys_before.add((kn, kv))
-
-        # Step 2: Find and remove the target key
-        new_lines = []
-        key_found = False
-        deleted_key_value = None
-
-        for line in original_lines:
-            stripped = line.strip()
-            # Check if this line contains our target key
-            if stripped.startswith(f"{key_name}="):
-                key_found = True
-                # Store the value being deleted for verification
-                _, _, deleted_key_value = stripped.partition("=")
-                deleted_key_value = deleted_key_value.strip().strip('"').strip("'")
-                continue  # Skip this line (delete it)
-            new_lines.append(line)
-
-        if not key_found:
-            console.print(
+        original_lines, _ = _bulk_edit_env(deletes=key_names)
+
+        present = {
+            line.strip().partition("=")[0] for line in original_lines if "=" in line
+        }
+        missing = sorted(key_names - present)
+        for key_name in missing:
+            _ensure_rich().print(
                 f"[bold red]Error: Key '{key_name}' not found in .env file[/bold red]"
             )
-            return False
+        return not missing
 
-        # Step 3: Write the modified content
-        with open(env_file, "w") as f:
-            f.writelines(new_lines)
+    except Exception as e:
+        _ensure_rich().print(
+            f"[bold red]Error during API key deletion: {e}[/bold red]"
+        )
+        return False
 
-        # Step 4: Verify the deletion - compare before and after
-        api_keys_after = _get_api_keys_from_env()
-        all_keys_after = set()
-        for provider_keys in api_keys_after.values():
-            for kn, kv in provider_keys:
-                all_keys_after.add((kn, kv))
 
-        # Check that only the intended key was removed
-        expected_remaining = all_keys_before - {(key_name, deleted_key_value)}
+def _delete_api_key_from_env(key_name: str) -> bool:
+    """
+    Delete an API key from the .env file.
 
-        if all_keys_after != expected_remaining:
-            # Something went wrong - restore from backup
-            console.print(
-                "[bold red]Error: Unexpected keys were affected during deletion![/bold red]"
+    Args:
+        key_name: The exact key name to delete (e.g., "GEMINI_API_KEY_2")
+
+    Returns:
+        True if the key was found and deleted, False otherwise
+    """
+    return _delete_api_keys_from_env((key_name,))
+
+
+# OAuth summary from the last directory scan, keyed by the credential files'
+# names and mtimes so menu redraws skip re-reading unchanged files
+_OAUTH_CACHE = {"key": None, "data": None}
+
+
+def _oauth_dir_cache_key(oauth_dir: Path) -> tuple:
+    """Snapshot (name, mtime_ns) of every JSON file in the OAuth directory."""
+    with os.scandir(oauth_dir) as entries:
+        return (str(oauth_dir),) + tuple(
+            sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(".json")
             )
-            console.print("[bold yellow]Restoring original file...[/bold yellow]")
-            with open(env_file, "w") as f:
-                f.writelines(original_lines)
-            return False
+        )
 
-        return True
 
-    except Exception as e:
-        console.print(f"[bold red]Error during API key deletion: {e}[/bold red]")
-        return False
+def _with_file_names(credentials: list) -> list:
+    """Add a "file_name" (basename of "file_path") to each credential dict, once."""
+    for cred in credentials:
+        if "file_name" not in cred:
+            cred["file_name"] = os.path.basename(cred["file_path"])
+    return credentials
 
 
 def _get_oauth_credentials_summary() -> dict:
@@ -269,28 +599,76 @@ def _get_oauth_credentials_summary() -> dict:
         Dict mapping provider names to lists of credential info dicts.
         Example: {"gemini_cli": [{"email": "user@example.com", "tier": "free-tier", ...}, ...]}
     """
-    provider_factory, _ = _ensure_providers_loaded()
-    oauth_providers = [
-        "gemini_cli",
-        "qwen_code",
-        "iflow",
-        "antigravity",
-        "openai_codex",
-    ]
-    oauth_summary = {}
+    oauth_dir = _get_oauth_base_dir()
+    try:
+        cache_key = _oauth_dir_cache_key(oauth_dir)
+    except OSError:
+        cache_key = None
+    if cache_key is not None and _OAUTH_CACHE["key"] == cache_key:
+        return {name: list(creds) for name, creds in _OAUTH_CACHE["data"].items()}
+
+    # Resolve auth instances here, not in the workers: the first call runs
+    # the lazy provider imports and fills _AUTH_INSTANCES, neither of which
+    # should race across threads
+    auth_instances = {}
+    failed = False
+    for provider_name in OAUTH_PROVIDERS:
+        try:
+            auth_instances[provider_name] = _get_auth(provider_name)
+        except Exception as e:
+            failed = True
+            lib_logger.warning(f"Could not load OAuth provider '{provider_name}': {e}")
 
-    for provider_name in oauth_providers:
+    def _list_one(provider_name: str) -> Optional[list]:
         try:
-            auth_class = provider_factory.get_provider_auth_class(provider_name)
-            auth_instance = auth_class()
-            credentials = auth_instance.list_credentials(_get_oauth_base_dir())
-            oauth_summary[provider_name] = credentials
-        except Exception:
-            oauth_summary[provider_name] = []
+            return _with_file_names(
+                auth_instances[provider_name].list_credentials(oauth_dir)
+            )
+        except Exception as e:
+            lib_logger.warning(
+                f"Failed to list OAuth credentials for '{provider_name}': {e}"
+            )
+            return None
+
+    # Each listing is a blocking directory glob plus JSON reads; run them
+    # side by side so the scan costs the slowest provider, not the sum
+    with ThreadPoolExecutor(max_workers=len(OAUTH_PROVIDERS)) as executor:
+        listed = dict(zip(auth_instances, executor.map(_list_one, auth_instances)))
+
+    oauth_summary = {}
+    for provider_name in OAUTH_PROVIDERS:
+        creds = listed.get(provider_name)
+        if creds is None:
+            failed = True
+            creds = []
+        oauth_summary[provider_name] = creds
+
+    # Don't cache a partial scan; the next redraw retries the failed providers
+    if failed:
+        return oauth_summary
+
+    _OAUTH_CACHE["key"] = cache_key
+    _OAUTH_CACHE["data"] = {
+        name: list(creds) for name, creds in oauth_summary.items()
+    }
 
     return oauth_summary
 
 
+def _get_oauth_providers_with_creds() -> List[Tuple[str, list, str]]:
+    """
+    List the OAuth providers that have at least one credential.
+
+    Returns:
+        (provider, credentials, display name) tuples in provider order.
+    """
+    return [
+        (provider, creds, _FRIENDLY[provider])
+        for provider, creds in _get_oauth_credentials_summary().items()
+        if creds
+    ]
+
+
 def _get_all_credentials_summary() -> dict:
     """
     Get a complete summary of all credentials (API keys and OAuth).
@@ -315,8 +693,6 @@ def _get_existing_custom_providers() -> list:
         List of dicts with provider info:
         [{"name": "myserver", "api_base": "http://...", "has_key": True}, ...]
     """
-    from .provider_config import KNOWN_PROVIDERS
-
     custom_providers = []
     env_file = _get_env_file()
 
@@ -324,32 +700,30 @@ def _get_existing_custom_providers() -> list:
         return custom_providers
 
     try:
-        # First pass: collect all _API_BASE entries
+        raw = _read_env_bytes(env_file)
+        # Common case: no *_API_BASE entries at all, so nothing to scan
+        if b"_API_BASE" not in raw:
+            return custom_providers
+
+        from .provider_config import KNOWN_PROVIDERS
+
+        # Single pass: collect _API_BASE entries and providers with API keys
         api_bases = {}
         api_keys = set()
 
-        with open(env_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                if "=" not in line:
-                    continue
-
-                key_name, _, value = line.partition("=")
-                key_name = key_name.strip()
-                value = value.strip().strip('"').strip("'")
-
-                if key_name.endswith("_API_BASE") and value:
-                    provider_name = key_name[:-9].lower()  # Remove _API_BASE
-                    # Only include if NOT a known provider
-                    if provider_name not in KNOWN_PROVIDERS:
-                        api_bases[provider_name] = value
-                elif "_API_KEY" in key_name and value:
-                    # Extract provider name from API key
-                    provider_prefix = key_name.split("_API_KEY")[0].lower()
-                    api_keys.add(provider_prefix)
+        for kind, key_name, value in _parse_env_file(env_file, raw):
+            if not value:
+                continue
+
+            if kind == "base":
+                provider_name = key_name.removesuffix("_API_BASE").lower()
+                # Only include if NOT a known provider
+                if provider_name not in KNOWN_PROVIDERS:
+                    api_bases[provider_name] = value
+            else:
+                # Extract provider name from API key
+                provider_prefix = key_name.partition("_API_KEY")[0].lower()
+                api_keys.add(provider_prefix)
 
         # Build result list
         for provider_name, api_base in sorted(api_bases.items()):
@@ -362,7 +736,7 @@ def _get_existing_custom_providers() -> list:
             )
 
     except Exception as e:
-        console.print(f"[bold red]Error reading .env file: {e}[/bold red]")
+        _ensure_rich().print(f"[bold red]Error reading .env file: {e}[/bold red]")
 
     return custom_providers
 
@@ -403,17 +777,32 @@ def _display_custom_providers_summary():
     console.print()
 
 
-def _display_credentials_summary():
+def _display_credentials_summary(
+    summary: Optional[dict] = None,
+    sorted_api: Optional[list] = None,
+    sorted_oauth: Optional[list] = None,
+):
     """
     Display a compact 2-column summary of all configured credentials.
     API Keys on the left, OAuth credentials on the right.
     Handles cases where only one type exists or neither.
+
+    Args:
+        summary: Result of _get_all_credentials_summary(), if the caller
+                 already has it. Fetched here otherwise.
+        sorted_api: sorted(summary["api_keys"].items()), if already built
+        sorted_oauth: sorted(summary["oauth"].items()), if already built
     """
     from rich.columns import Columns
 
-    summary = _get_all_credentials_summary()
+    if summary is None:
+        summary = _get_all_credentials_summary()
     api_keys = summary["api_keys"]
     oauth_creds = summary["oauth"]
+    if sorted_api is None:
+        sorted_api = list(api_keys.items())  # already in provider order
+    if sorted_oauth is None:
+        sorted_oauth = sorted(oauth_creds.items())
 
     # Calculate totals
     total_api_keys = sum(len(keys) for keys in api_keys.values())
@@ -433,7 +822,7 @@ def _display_credentials_summary():
         api_table.add_column("Provider", style="yellow", no_wrap=True)
         api_table.add_column("Count", style="green", justify="right")
 
-        for provider, keys in sorted(api_keys.items()):
+        for provider, keys in sorted_api:
             api_table.add_row(provider, str(len(keys)))
 
         # Add total row
@@ -450,15 +839,14 @@ def _display_credentials_summary():
         oauth_table.add_column("Count", style="green", justify="right")
         oauth_table.add_column("Tiers", style="dim", no_wrap=True)
 
-        for provider, creds in sorted(oauth_creds.items()):
+        for provider, creds in sorted_oauth:
             if not creds:
                 continue
-            display_name = OAUTH_FRIENDLY_NAMES.get(provider, provider.title())
+            display_name = _FRIENDLY[provider]
             count = len(creds)
 
             # Count and format tiers for providers that have tier info
-            tier_counts = _count_tiers(creds)
-            tier_str = _format_tier_counts(tier_counts)
+            tier_str = _tier_summary(tuple(cred.get("tier") for cred in creds))
 
             oauth_table.add_row(display_name, str(count), tier_str)
 
@@ -499,7 +887,7 @@ def _display_oauth_providers_summary():
     table.add_column("Count", style="green", justify="right")
 
     for provider, creds in sorted(oauth_summary.items()):
-        display_name = OAUTH_FRIENDLY_NAMES.get(provider, provider.title())
+        display_name = _FRIENDLY[provider]
         table.add_row(display_name, str(len(creds)))
 
     if total > 0:
@@ -510,21 +898,25 @@ def _display_oauth_providers_summary():
     console.print("")
 
 
-def _display_provider_credentials(provider_name: str):
+def _display_provider_credentials(
+    provider_name: str, credentials: Optional[list] = None
+):
     """
     Display all credentials for a specific OAuth provider.
 
     Args:
         provider_name: The provider key (e.g., "gemini_cli", "qwen_code")
+        credentials: Already-loaded credentials (with "file_name") to render.
+            If None, they are listed from the OAuth directory.
     """
-    provider_factory, _ = _ensure_providers_loaded()
-
-    try:
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
-        credentials = auth_instance.list_credentials(_get_oauth_base_dir())
-    except Exception:
-        credentials = []
+    if credentials is None:
+        try:
+            auth_instance = _get_auth(provider_name)
+            credentials = _with_file_names(
+                auth_instance.list_credentials(_get_oauth_base_dir())
+            )
+        except Exception:
+            credentials = []
 
     display_name = OAUTH_FRIENDLY_NAMES.get(provider_name, provider_name.title())
 
@@ -540,7 +932,7 @@ def _display_provider_credentials(provider_name: str):
     table.add_column("Email/Identifier", style="cyan")
 
     # Add tier/project columns for Google OAuth providers
-    if provider_name in ["gemini_cli", "antigravity"]:
+    if provider_name in _GOOGLE_OAUTH:
         table.add_column("Tier", style="green")
         table.add_column("Project", style="dim")
     # Add type column for iFlow (OAuth vs Cookie)
@@ -548,10 +940,10 @@ def _display_provider_credentials(provider_name: str):
         table.add_column("Type", style="magenta")
 
     for i, cred in enumerate(credentials, 1):
-        file_name = Path(cred["file_path"]).name
+        file_name = cred["file_name"]
         email = cred.get("email", "unknown")
 
-        if provider_name in ["gemini_cli", "antigravity"]:
+        if provider_name in _GOOGLE_OAUTH:
             tier = cred.get("tier", "-")
             project = cred.get("project_id", "-")
             if project and len(project) > 20:
@@ -567,22 +959,25 @@ def _display_provider_credentials(provider_name: str):
     console.print("")
 
 
-async def _edit_oauth_credential_email(provider_name: str):
+async def _edit_oauth_credential_email(
+    provider_name: str, credentials: Optional[list] = None
+):
     """
     Edit the email field of an OAuth credential.
 
     Args:
         provider_name: The provider key (e.g., "qwen_code")
+        credentials: Already-loaded credentials for the provider, if any.
     """
-    provider_factory, _ = _ensure_providers_loaded()
-
-    try:
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
-        credentials = auth_instance.list_credentials(_get_oauth_base_dir())
-    except Exception as e:
-        console.print(f"[bold red]Error loading credentials: {e}[/bold red]")
-        return
+    if credentials is None:
+        try:
+            auth_instance = _get_auth(provider_name)
+            credentials = _with_file_names(
+                auth_instance.list_credentials(_get_oauth_base_dir())
+            )
+        except Exception as e:
+            console.print(f"[bold red]Error loading credentials: {e}[/bold red]")
+            return
 
     display_name = OAUTH_FRIENDLY_NAMES.get(provider_name, provider_name.title())
 
@@ -593,13 +988,11 @@ async def _edit_oauth_credential_email(provider_name: str):
         return
 
     # Display credentials for selection
-    _display_provider_credentials(provider_name)
+    _display_provider_credentials(provider_name, credentials)
 
     choice = Prompt.ask(
-        Text.from_markup(
-            "[bold]Select credential to edit or type [red]'b'[/red] to go back[/bold]"
-        ),
-        choices=[str(i) for i in range(1, len(credentials) + 1)] + ["b"],
+        _PROMPT_SELECT_CRED_EDIT,
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -620,8 +1013,7 @@ async def _edit_oauth_credential_email(provider_name: str):
             return
 
         # Load and update the credential file
-        with open(cred_path, "r") as f:
-            creds = json.load(f)
+        creds = _json_loads(Path(cred_path).read_bytes())
 
         if "_proxy_metadata" not in creds:
             creds["_proxy_metadata"] = {}
@@ -630,8 +1022,8 @@ async def _edit_oauth_credential_email(provider_name: str):
         creds["_proxy_metadata"]["email"] = new_email.strip()
 
         # Save the updated credentials
-        with open(cred_path, "w") as f:
-            json.dump(creds, f, indent=2)
+        Path(cred_path).write_bytes(_json_dumps_indent(creds))
+        _OAUTH_CACHE["key"] = None
 
         console.print(
             Panel(
@@ -651,28 +1043,29 @@ async def view_credentials_menu():
     Menu for viewing credentials. Shows summary first, then allows drilling
     down to view detailed credentials for a specific provider.
     """
+    _ensure_rich()
     while True:
         clear_screen("View Credentials")
 
-        # Display summary
-        _display_credentials_summary()
+        # Display summary, reusing the same data (sorted once) for the
+        # provider list
+        summary = _get_all_credentials_summary()
+        sorted_api = list(summary["api_keys"].items())  # already in provider order
+        sorted_oauth = sorted(summary["oauth"].items())
+        _display_credentials_summary(summary, sorted_api, sorted_oauth)
 
         # Build list of all providers with credentials
-        api_keys = _get_api_keys_from_env()
-        oauth_creds = _get_oauth_credentials_summary()
-
         all_providers = []
 
         # Add API key providers
-        for provider in sorted(api_keys.keys()):
-            count = len(api_keys[provider])
-            all_providers.append(("api", provider, count))
+        for provider, keys in sorted_api:
+            all_providers.append(("api", provider, len(keys)))
 
         # Add OAuth providers with credentials
-        for provider in sorted(oauth_creds.keys()):
-            if oauth_creds[provider]:
-                count = len(oauth_creds[provider])
-                display_name = OAUTH_FRIENDLY_NAMES.get(provider, provider.title())
+        for provider, creds in sorted_oauth:
+            if creds:
+                count = len(creds)
+                display_name = _FRIENDLY[provider]
                 all_providers.append(("oauth", provider, count, display_name))
 
         if not all_providers:
@@ -701,10 +1094,8 @@ async def view_credentials_menu():
                 )
 
         choice = Prompt.ask(
-            Text.from_markup(
-                "\n[bold]Select provider or type [red]'b'[/red] to go back[/bold]"
-            ),
-            choices=[str(i) for i in range(1, len(all_providers) + 1)] + ["b"],
+            _PROMPT_SELECT_PROVIDER,
+            choices=_RangeChoices(len(all_providers)),
             show_choices=False,
         )
 
@@ -763,12 +1154,11 @@ async def _view_oauth_credentials_detail(provider_name: str):
     display_name = OAUTH_FRIENDLY_NAMES.get(provider_name, provider_name.title())
     clear_screen(f"View {display_name} Credentials")
 
-    provider_factory, _ = _ensure_providers_loaded()
-
     try:
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
-        credentials = auth_instance.list_credentials(_get_oauth_base_dir())
+        auth_instance = _get_auth(provider_name)
+        credentials = _with_file_names(
+            auth_instance.list_credentials(_get_oauth_base_dir())
+        )
     except Exception:
         credentials = []
 
@@ -787,7 +1177,7 @@ async def _view_oauth_credentials_detail(provider_name: str):
     table.add_column("Email/Identifier", style="cyan")
 
     # Add tier/project columns for Google OAuth providers
-    if provider_name in ["gemini_cli", "antigravity"]:
+    if provider_name in _GOOGLE_OAUTH:
         table.add_column("Tier", style="green")
         table.add_column("Project", style="dim")
     # Add type column for iFlow (OAuth vs Cookie)
@@ -795,10 +1185,10 @@ async def _view_oauth_credentials_detail(provider_name: str):
         table.add_column("Type", style="magenta")
 
     for i, cred in enumerate(credentials, 1):
-        file_name = Path(cred["file_path"]).name
+        file_name = cred["file_name"]
         email = cred.get("email", "unknown")
 
-        if provider_name in ["gemini_cli", "antigravity"]:
+        if provider_name in _GOOGLE_OAUTH:
             tier = (
                 format_tier_for_display(cred.get("tier")) if cred.get("tier") else "-"
             )
@@ -823,6 +1213,7 @@ async def manage_credentials_submenu():
     Submenu for viewing and managing all credentials (API keys and OAuth).
     Allows deletion of any credential and editing email for OAuth credentials.
     """
+    _ensure_rich()
     while True:
         clear_screen("Manage Credentials")
 
@@ -892,20 +1283,18 @@ async def _delete_api_key_menu():
     table.add_column("Value", style="dim")
 
     idx = 1
-    for provider, keys in sorted(api_keys.items()):
+    for provider, keys in api_keys.items():
         for key_name, key_value in keys:
             masked = f"****{key_value[-4:]}" if len(key_value) > 4 else "****"
             table.add_row(str(idx), key_name, provider, masked)
-            all_keys.append((key_name, key_value, provider))
+            all_keys.append((key_name, key_value, provider, masked))
             idx += 1
 
     console.print(table)
 
     choice = Prompt.ask(
-        Text.from_markup(
-            "\n[bold]Select API key to delete or type [red]'b'[/red] to go back[/bold]"
-        ),
-        choices=[str(i) for i in range(1, len(all_keys) + 1)] + ["b"],
+        _PROMPT_SELECT_DELETE,
+        choices=_RangeChoices(len(all_keys)),
         show_choices=False,
     )
 
@@ -914,12 +1303,13 @@ async def _delete_api_key_menu():
 
     try:
         idx = int(choice) - 1
-        key_name, key_value, provider = all_keys[idx]
+        key_name, key_value, provider, masked = all_keys[idx]
 
         # Confirmation prompt
-        masked = f"****{key_value[-4:]}" if len(key_value) > 4 else "****"
         confirmed = Confirm.ask(
-            f"[bold red]Delete[/bold red] [yellow]{key_name}[/yellow] ({masked})?"
+            Text.assemble(
+                ("Delete", "bold red"), " ", (key_name, "yellow"), f" ({masked})?"
+            )
         )
 
         if not confirmed:
@@ -929,7 +1319,7 @@ async def _delete_api_key_menu():
         if _delete_api_key_from_env(key_name):
             console.print(
                 Panel(
-                    f"Successfully deleted [yellow]{key_name}[/yellow]",
+                    Text.assemble("Successfully deleted ", (key_name, "yellow")),
                     style="bold green",
                     title="Success",
                     expand=False,
@@ -938,7 +1328,7 @@ async def _delete_api_key_menu():
         else:
             console.print(
                 Panel(
-                    f"Failed to delete [yellow]{key_name}[/yellow]",
+                    Text.assemble("Failed to delete ", (key_name, "yellow")),
                     style="bold red",
                     title="Error",
                     expand=False,
@@ -952,27 +1342,22 @@ async def _delete_api_key_menu():
 async def _delete_oauth_credential_menu():
     """Menu for deleting an OAuth credential file."""
     clear_screen("Delete OAuth Credential")
-    oauth_summary = _get_oauth_credentials_summary()
+    providers_with_creds = _get_oauth_providers_with_creds()
 
     # Check if there are any credentials
-    total = sum(len(creds) for creds in oauth_summary.values())
-    if total == 0:
+    if not providers_with_creds:
         console.print("[bold yellow]No OAuth credentials configured.[/bold yellow]")
         return
 
     # First, select provider
     console.print("\n[bold cyan]Select OAuth Provider:[/bold cyan]")
 
-    providers_with_creds = [(p, c) for p, c in oauth_summary.items() if c]
-    for i, (provider, creds) in enumerate(providers_with_creds, 1):
-        display_name = OAUTH_FRIENDLY_NAMES.get(provider, provider.title())
+    for i, (provider, creds, display_name) in enumerate(providers_with_creds, 1):
         console.print(f"  {i}. {display_name} ({len(creds)} credential(s))")
 
     provider_choice = Prompt.ask(
-        Text.from_markup(
-            "\n[bold]Select provider or type [red]'b'[/red] to go back[/bold]"
-        ),
-        choices=[str(i) for i in range(1, len(providers_with_creds) + 1)] + ["b"],
+        _PROMPT_SELECT_PROVIDER,
+        choices=_RangeChoices(len(providers_with_creds)),
         show_choices=False,
     )
 
@@ -981,17 +1366,14 @@ async def _delete_oauth_credential_menu():
 
     try:
         provider_idx = int(provider_choice) - 1
-        provider_name, credentials = providers_with_creds[provider_idx]
-        display_name = OAUTH_FRIENDLY_NAMES.get(provider_name, provider_name.title())
+        provider_name, credentials, display_name = providers_with_creds[provider_idx]
 
         # Now select credential
-        _display_provider_credentials(provider_name)
+        _display_provider_credentials(provider_name, credentials)
 
         cred_choice = Prompt.ask(
-            Text.from_markup(
-                "[bold]Select credential to delete or type [red]'b'[/red] to go back[/bold]"
-            ),
-            choices=[str(i) for i in range(1, len(credentials) + 1)] + ["b"],
+            _PROMPT_SELECT_CRED_DELETE,
+            choices=_RangeChoices(len(credentials)),
             show_choices=False,
         )
 
@@ -1005,7 +1387,12 @@ async def _delete_oauth_credential_menu():
 
         # Confirmation prompt
         confirmed = Confirm.ask(
-            f"[bold red]Delete[/bold red] credential for [cyan]{email}[/cyan] from {display_name}?"
+            Text.assemble(
+                ("Delete", "bold red"),
+                " credential for ",
+                (email, "cyan"),
+                f" from {display_name}?",
+            )
         )
 
         if not confirmed:
@@ -1013,14 +1400,15 @@ async def _delete_oauth_credential_menu():
             return
 
         # Use the auth class's delete method
-        provider_factory, _ = _ensure_providers_loaded()
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
+        auth_instance = _get_auth(provider_name)
 
         if auth_instance.delete_credential(cred_path):
+            _OAUTH_CACHE["key"] = None
             console.print(
                 Panel(
-                    f"Successfully deleted credential for [cyan]{email}[/cyan]",
+                    Text.assemble(
+                        "Successfully deleted credential for ", (email, "cyan")
+                    ),
                     style="bold green",
                     title="Success",
                     expand=False,
@@ -1029,7 +1417,7 @@ async def _delete_oauth_credential_menu():
         else:
             console.print(
                 Panel(
-                    f"Failed to delete credential for [cyan]{email}[/cyan]",
+                    Text.assemble("Failed to delete credential for ", (email, "cyan")),
                     style="bold red",
                     title="Error",
                     expand=False,
@@ -1043,11 +1431,10 @@ async def _delete_oauth_credential_menu():
 async def _edit_oauth_credential_menu():
     """Menu for editing an OAuth credential's email field."""
     clear_screen("Edit OAuth Credential")
-    oauth_summary = _get_oauth_credentials_summary()
+    providers_with_creds = _get_oauth_providers_with_creds()
 
     # Check if there are any credentials
-    total = sum(len(creds) for creds in oauth_summary.values())
-    if total == 0:
+    if not providers_with_creds:
         console.print("[bold yellow]No OAuth credentials configured.[/bold yellow]")
         return
 
@@ -1069,19 +1456,15 @@ async def _edit_oauth_credential_menu():
     # First, select provider
     console.print("\n[bold cyan]Select OAuth Provider:[/bold cyan]")
 
-    providers_with_creds = [(p, c) for p, c in oauth_summary.items() if c]
-    for i, (provider, creds) in enumerate(providers_with_creds, 1):
-        display_name = OAUTH_FRIENDLY_NAMES.get(provider, provider.title())
-        recommended = " [green](recommended)[/green]" if provider == "qwen_code" else ""
+    for i, (provider, creds, display_name) in enumerate(providers_with_creds, 1):
         console.print(
-            f"  {i}. {display_name} ({len(creds)} credential(s)){recommended}"
+            f"  {i}. {display_name} ({len(creds)} credential(s))"
+            f"{_RECOMMENDED_FOR_EDIT.get(provider, '')}"
         )
 
     provider_choice = Prompt.ask(
-        Text.from_markup(
-            "\n[bold]Select provider or type [red]'b'[/red] to go back[/bold]"
-        ),
-        choices=[str(i) for i in range(1, len(providers_with_creds) + 1)] + ["b"],
+        _PROMPT_SELECT_PROVIDER,
+        choices=_RangeChoices(len(providers_with_creds)),
         show_choices=False,
     )
 
@@ -1090,8 +1473,8 @@ async def _edit_oauth_credential_menu():
 
     try:
         provider_idx = int(provider_choice) - 1
-        provider_name, _ = providers_with_creds[provider_idx]
-        await _edit_oauth_credential_email(provider_name)
+        provider_name, credentials, _ = providers_with_creds[provider_idx]
+        await _edit_oauth_credential_email(provider_name, credentials)
 
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
@@ -1107,11 +1490,12 @@ def clear_screen(subtitle: str = "Interactive Credential Setup"):
         subtitle: The subtitle text to display in the header panel.
                   Defaults to "Interactive Credential Setup".
 
-    Uses native OS commands instead of ANSI escape sequences:
-    - Windows (conhost & Windows Terminal): cls
-    - Unix-like systems (Linux, Mac): clear
+    Clears through Rich rather than spawning a shell for cls/clear; Rich emits
+    the ANSI sequence and falls back to the Win32 console API on legacy
+    Windows conhost.
     """
-    os.system("cls" if os.name == "nt" else "clear")
+    _ensure_rich()
+    console.clear()
     console.print(
         Panel(
             f"[bold cyan]{subtitle}[/bold cyan]",
@@ -1124,19 +1508,23 @@ def ensure_env_defaults():
     """
     Ensures the .env file exists and contains essential default values like PROXY_API_KEY.
     """
-    if not _get_env_file().is_file():
-        _get_env_file().touch()
+    _ensure_rich()
+    env_file = _get_env_file()
+    env_path = str(env_file)
+
+    if not env_file.is_file():
+        env_file.touch()
         console.print(
-            f"Creating a new [bold yellow]{_get_env_file().name}[/bold yellow] file..."
+            f"Creating a new [bold yellow]{env_file.name}[/bold yellow] file..."
         )
 
     # Check for PROXY_API_KEY, similar to setup_env.bat
-    if get_key(str(_get_env_file()), "PROXY_API_KEY") is None:
+    if _load_env_cached(env_file).get("PROXY_API_KEY") is None:
         default_key = "VerysecretKey"
         console.print(
-            f"Adding default [bold cyan]PROXY_API_KEY[/bold cyan] to [bold yellow]{_get_env_file().name}[/bold yellow]..."
+            f"Adding default [bold cyan]PROXY_API_KEY[/bold cyan] to [bold yellow]{env_file.name}[/bold yellow]..."
         )
-        set_key(str(_get_env_file()), "PROXY_API_KEY", default_key)
+        _set_env_key(env_path, "PROXY_API_KEY", default_key)
 
 
 # =============================================================================
@@ -1184,6 +1572,7 @@ async def setup_api_key():
     Interactively sets up a new API key for a provider.
     Supports search, categorized display, and additional configuration variables.
     """
+    _ensure_rich()
     clear_screen("Add API Key")
 
     # Show info panel
@@ -1469,20 +1858,13 @@ async def setup_api_key():
             )
 
             if api_key.strip():
-                # Find next available key index
+                # Find next available key index (one parse, not one per index)
+                existing = _load_env_cached(_get_env_file())
                 key_index = 1
-                while True:
-                    key_name = f"{api_key_var}_{key_index}"
-                    if _get_env_file().is_file():
-                        with open(_get_env_file(), "r") as f:
-                            if not any(line.startswith(f"{key_name}=") for line in f):
-                                break
-                    else:
-                        break
+                while f"{api_key_var}_{key_index}" in existing:
                     key_index += 1
 
                 key_name = f"{api_key_var}_{key_index}"
-                set_key(str(_get_env_file()), key_name, api_key.strip())
                 saved_vars.append((key_name, api_key.strip()))
 
         # Prompt for extra variables
@@ -1502,9 +1884,12 @@ async def setup_api_key():
                     )
 
                 if value.strip():
-                    set_key(str(_get_env_file()), env_var_name, value.strip())
                     saved_vars.append((env_var_name, value.strip()))
 
+        # Save everything with one .env rewrite
+        if saved_vars:
+            _bulk_edit_env(sets=dict(saved_vars))
+
         # Show success message
         if saved_vars:
             success_lines = [f"Successfully configured [bold]{display_name}[/bold]:\n"]
@@ -1547,6 +1932,7 @@ async def setup_custom_openai_provider():
     This adds a new provider that uses the standard OpenAI API format but points
     to a custom endpoint (LM Studio, Ollama, vLLM, custom server, etc.).
     """
+    _ensure_rich()
     clear_screen("Add Custom OpenAI-Compatible Provider")
 
     # Show info panel
@@ -1679,11 +2065,10 @@ async def setup_custom_openai_provider():
     # Save to .env file
     env_file = _get_env_file()
 
-    # Save API Base URL
+    # API Base URL
     api_base_var = f"{provider_name}_API_BASE"
-    set_key(str(env_file), api_base_var, api_base)
 
-    # Save API Key (find next available index)
+    # API Key (find next available index)
     api_key_var_base = f"{provider_name}_API_KEY"
     key_index = 1
     if env_file.is_file():
@@ -1693,7 +2078,9 @@ async def setup_custom_openai_provider():
                 key_index += 1
 
     api_key_var = f"{api_key_var_base}_{key_index}"
-    set_key(str(env_file), api_key_var, api_key)
+
+    # Save both with one .env rewrite
+    _bulk_edit_env(sets={api_base_var: api_base, api_key_var: api_key})
 
     # Mask the API key for display
     if len(api_key) > 8:
@@ -1729,10 +2116,9 @@ async def setup_new_credential(provider_name: str):
 
     Delegates all credential management logic to the auth class's setup_credential() method.
     """
+    _ensure_rich()
     try:
-        provider_factory, _ = _ensure_providers_loaded()
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
+        auth_instance = _get_auth(provider_name)
 
         # Build display name for better user experience
         oauth_friendly_names = {
@@ -1838,12 +2224,11 @@ async def export_gemini_cli_to_env():
     Export a Gemini CLI credential JSON file to .env format.
     Uses the auth class's build_env_lines() and list_credentials() methods.
     """
+    _ensure_rich()
     clear_screen("Export Gemini CLI Credential")
 
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
-    auth_class = provider_factory.get_provider_auth_class("gemini_cli")
-    auth_instance = auth_class()
+    auth_instance = _get_auth("gemini_cli")
 
     # List available credentials using auth class
     credentials = auth_instance.list_credentials(_get_oauth_base_dir())
@@ -1877,7 +2262,7 @@ async def export_gemini_cli_to_env():
         Text.from_markup(
             "[bold]Please select a credential to export or type [red]'b'[/red] to go back[/bold]"
         ),
-        choices=[str(i + 1) for i in range(len(credentials))] + ["b"],
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -1933,12 +2318,11 @@ async def export_qwen_code_to_env():
     Export a Qwen Code credential JSON file to .env format.
     Uses the auth class's build_env_lines() and list_credentials() methods.
     """
+    _ensure_rich()
     clear_screen("Export Qwen Code Credential")
 
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
-    auth_class = provider_factory.get_provider_auth_class("qwen_code")
-    auth_instance = auth_class()
+    auth_instance = _get_auth("qwen_code")
 
     # List available credentials using auth class
     credentials = auth_instance.list_credentials(_get_oauth_base_dir())
@@ -1972,7 +2356,7 @@ async def export_qwen_code_to_env():
         Text.from_markup(
             "[bold]Please select a credential to export or type [red]'b'[/red] to go back[/bold]"
         ),
-        choices=[str(i + 1) for i in range(len(credentials))] + ["b"],
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -2027,12 +2411,11 @@ async def export_iflow_to_env():
     Export an iFlow credential JSON file to .env format.
     Uses the auth class's build_env_lines() and list_credentials() methods.
     """
+    _ensure_rich()
     clear_screen("Export iFlow Credential")
 
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
-    auth_class = provider_factory.get_provider_auth_class("iflow")
-    auth_instance = auth_class()
+    auth_instance = _get_auth("iflow")
 
     # List available credentials using auth class
     credentials = auth_instance.list_credentials(_get_oauth_base_dir())
@@ -2066,7 +2449,7 @@ async def export_iflow_to_env():
         Text.from_markup(
             "[bold]Please select a credential to export or type [red]'b'[/red] to go back[/bold]"
         ),
-        choices=[str(i + 1) for i in range(len(credentials))] + ["b"],
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -2121,12 +2504,11 @@ async def export_antigravity_to_env():
     Export an Antigravity credential JSON file to .env format.
     Uses the auth class's build_env_lines() and list_credentials() methods.
     """
+    _ensure_rich()
     clear_screen("Export Antigravity Credential")
 
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
-    auth_class = provider_factory.get_provider_auth_class("antigravity")
-    auth_instance = auth_class()
+    auth_instance = _get_auth("antigravity")
 
     # List available credentials using auth class
     credentials = auth_instance.list_credentials(_get_oauth_base_dir())
@@ -2160,7 +2542,7 @@ async def export_antigravity_to_env():
         Text.from_markup(
             "[bold]Please select a credential to export or type [red]'b'[/red] to go back[/bold]"
         ),
-        choices=[str(i + 1) for i in range(len(credentials))] + ["b"],
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -2216,11 +2598,10 @@ async def export_openai_codex_to_env():
     Export an OpenAI Codex credential JSON file to .env format.
     Uses the auth class's build_env_lines() and list_credentials() methods.
     """
+    _ensure_rich()
     clear_screen("Export OpenAI Codex Credential")
 
-    provider_factory, _ = _ensure_providers_loaded()
-    auth_class = provider_factory.get_provider_auth_class("openai_codex")
-    auth_instance = auth_class()
+    auth_instance = _get_auth("openai_codex")
 
     credentials = auth_instance.list_credentials(_get_oauth_base_dir())
 
@@ -2252,7 +2633,7 @@ async def export_openai_codex_to_env():
         Text.from_markup(
             "[bold]Please select a credential to export or type [red]'b'[/red] to go back[/bold]"
         ),
-        choices=[str(i + 1) for i in range(len(credentials))] + ["b"],
+        choices=_RangeChoices(len(credentials)),
         show_choices=False,
     )
 
@@ -2306,13 +2687,12 @@ async def export_all_provider_credentials(provider_name: str):
     Export all credentials for a specific provider to individual .env files.
     Uses the auth class's list_credentials() and export_credential_to_env() methods.
     """
+    _ensure_rich()
     display_name = provider_name.replace("_", " ").title()
     clear_screen(f"Export All {display_name} Credentials")
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
     try:
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
+        auth_instance = _get_auth(provider_name)
     except Exception:
         console.print(f"[bold red]Unknown provider: {provider_name}[/bold red]")
         return
@@ -2376,13 +2756,12 @@ async def combine_provider_credentials(provider_name: str):
     Combine all credentials for a specific provider into a single .env file.
     Uses the auth class's list_credentials() and build_env_lines() methods.
     """
+    _ensure_rich()
     display_name = provider_name.replace("_", " ").title()
     clear_screen(f"Combine {display_name} Credentials")
     # Get auth instance for this provider
-    provider_factory, _ = _ensure_providers_loaded()
     try:
-        auth_class = provider_factory.get_provider_auth_class(provider_name)
-        auth_instance = auth_class()
+        auth_instance = _get_auth(provider_name)
     except Exception:
         console.print(f"[bold red]Unknown provider: {provider_name}[/bold red]")
         return
@@ -2422,8 +2801,7 @@ async def combine_provider_credentials(provider_name: str):
     for cred_info in credentials:
         try:
             # Load credential file
-            with open(cred_info["file_path"], "r") as f:
-                creds = json.load(f)
+            creds = _json_loads(Path(cred_info["file_path"]).read_bytes())
 
             # Use auth class to build env lines
             env_lines = auth_instance.build_env_lines(creds, cred_info["number"])
@@ -2462,19 +2840,9 @@ async def combine_all_credentials():
     Combine ALL credentials from ALL providers into a single .env file.
     Uses auth class list_credentials() and build_env_lines() methods.
     """
+    _ensure_rich()
     clear_screen("Combine All Credentials")
 
-    # List of providers that support OAuth credentials
-    oauth_providers = [
-        "gemini_cli",
-        "qwen_code",
-        "iflow",
-        "antigravity",
-        "openai_codex",
-    ]
-
-    provider_factory, _ = _ensure_providers_loaded()
-
     combined_lines = [
         "# Combined All Provider Credentials",
         f"# Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}",
@@ -2486,10 +2854,9 @@ async def combine_all_credentials():
     total_count = 0
     provider_counts = {}
 
-    for provider_name in oauth_providers:
+    for provider_name in OAUTH_PROVIDERS:
         try:
-            auth_class = provider_factory.get_provider_auth_class(provider_name)
-            auth_instance = auth_class()
+            auth_instance = _get_auth(provider_name)
         except Exception:
             continue  # Skip providers that don't have auth classes
 
@@ -2506,8 +2873,7 @@ async def combine_all_credentials():
         for cred_info in credentials:
             try:
                 # Load credential file
-                with open(cred_info["file_path"], "r") as f:
-                    creds = json.load(f)
+                creds = _json_loads(Path(cred_info["file_path"]).read_bytes())
 
                 # Use auth class to build env lines
                 env_lines = auth_instance.build_env_lines(creds, cred_info["number"])
@@ -2565,6 +2931,7 @@ async def export_credentials_submenu():
     """
     Submenu for credential export options.
     """
+    _ensure_rich()
     while True:
         clear_screen("Export Credentials")
 
@@ -2705,6 +3072,7 @@ async def main(clear_on_start=True):
         clear_on_start: If False, skip initial screen clear (used when called from launcher
                        to preserve the loading screen)
     """
+    _ensure_rich()
     ensure_env_defaults()
 
     # Only show header if we're clearing (standalone mode)
@@ -2771,7 +3139,7 @@ async def main(clear_on_start=True):
                 Text.from_markup(
                     "[bold]Please select a provider or type [red]'b'[/red] to go back[/bold]"
                 ),
-                choices=[str(i + 1) for i in range(len(available_providers))] + ["b"],
+                choices=_RangeChoices(len(available_providers)),
                 show_choices=False,
             )
 
@@ -2832,10 +3200,11 @@ def run_credential_tool(from_launcher=False):
     Args:
         from_launcher: If True, skip loading screen (launcher already showed it)
     """
+    _ensure_rich()
     # Check if we need to show loading screen
     if not from_launcher:
         # Standalone mode - show full loading UI
-        os.system("cls" if os.name == "nt" else "clear")
+        console.clear()
 
         _start_time = time.time()
 
@@ -16,10 +16,13 @@ import logging
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.request import Request, urlopen
 from urllib.error import URLError
 
+from .utils.resilient_io import safe_read_json, safe_write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -936,11 +939,26 @@ class ModelRegistry:
         self._worker: Optional[asyncio.Task] = None
         self._last_refresh: float = 0
 
+        # Optional on-disk snapshot for stale-while-revalidate startup
+        self._cache_file: Optional[Path] = None
+
     # ---------- Lifecycle ----------
 
-    async def start(self):
-        """Begin background refresh worker."""
+    async def start(self, cache_file: Optional[Union[str, Path]] = None):
+        """
+        Begin background refresh worker.
+
+        Args:
+            cache_file: Optional snapshot file. If it exists, its data is served
+                immediately and the network fetch only runs once it is stale;
+                every successful fetch rewrites it.
+        """
         if self._worker is None:
+            if cache_file is not None:
+                self._cache_file = Path(cache_file)
+                # Only the file read/parse runs off-loop; the stores and the
+                # asyncio.Event are touched back on the event loop
+                self._apply_snapshot(await asyncio.to_thread(self._read_snapshot))
             self._worker = asyncio.create_task(self._refresh_worker())
             logger.info(
                 "ModelRegistry started (refresh every %ds)", self._refresh_interval
@@ -974,12 +992,19 @@ class ModelRegistry:
 
     async def _refresh_worker(self):
         """Periodic refresh loop."""
-        await self._load_all_sources()
-        self._ready.set()
+        # A fresh snapshot defers the first fetch until it goes stale
+        snapshot_age = time.time() - self._last_refresh
+        if self._ready.is_set() and snapshot_age < self._refresh_interval:
+            first_delay = self._refresh_interval - snapshot_age
+        else:
+            await self._load_all_sources()
+            self._ready.set()
+            first_delay = self._refresh_interval
 
         while True:
             try:
-                await asyncio.sleep(self._refresh_interval)
+                await asyncio.sleep(first_delay)
+                first_delay = self._refresh_interval
                 logger.info("Scheduled registry refresh...")
                 await self._load_all_sources()
                 logger.info("Registry refresh complete")
@@ -1014,6 +1039,49 @@ class ModelRegistry:
             self._rebuild_index()
             self._last_refresh = time.time()
 
+        if self._cache_file is not None and (
+            self._openrouter_store or self._modelsdev_store
+        ):
+            await asyncio.to_thread(self._save_snapshot)
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Read and parse the on-disk snapshot. Safe to run in a worker thread."""
+        data = safe_read_json(self._cache_file, logger, parse_json=True)
+        return data if isinstance(data, dict) else None
+
+    def _apply_snapshot(self, data: Optional[Dict[str, Any]]) -> None:
+        """Populate stores from a parsed snapshot. Must run on the event loop."""
+        if data is None:
+            return
+
+        self._openrouter_store = data.get("openrouter") or {}
+        self._modelsdev_store = data.get("modelsdev") or {}
+        if not (self._openrouter_store or self._modelsdev_store):
+            return
+
+        self._rebuild_index()
+        self._last_refresh = float(data.get("saved_at", 0))
+        self._ready.set()
+        logger.info(
+            "ModelRegistry loaded snapshot (%d OpenRouter, %d Models.dev models, %.0fs old)",
+            len(self._openrouter_store),
+            len(self._modelsdev_store),
+            time.time() - self._last_refresh,
+        )
+
+    def _save_snapshot(self) -> None:
+        """Persist current stores so the next startup can serve them immediately."""
+        safe_write_json(
+            self._cache_file,
+            {
+                "saved_at": self._last_refresh,
+                "openrouter": self._openrouter_store,
+                "modelsdev": self._modelsdev_store,
+            },
+            logger,
+            indent=None,
+        )
+
     def _rebuild_index(self):
         """Reconstruct lookup index from current stores."""
         self._index.clear()
@@ -1297,10 +1365,17 @@ def get_model_info_service() -> ModelRegistry:
     return _registry_instance
 
 
-async def init_model_info_service() -> ModelRegistry:
-    """Initialize and start the global registry."""
+async def init_model_info_service(
+    cache_file: Optional[Union[str, Path]] = None,
+) -> ModelRegistry:
+    """
+    Initialize and start the global registry.
+
+    Args:
+        cache_file: Optional snapshot file for stale-while-revalidate startup
+    """
     registry = get_model_info_service()
-    await registry.start()
+    await registry.start(cache_file=cache_file)
     return registry
 
 
@@ -25,6 +25,7 @@ from rich.markup import escape as rich_escape
 from ..utils.headless_detection import is_headless_environment
 from ..utils.reauth_coordinator import get_reauth_coordinator
 from ..utils.resilient_io import safe_write_json
+from ..utils.shared_http import get_http_client
 from ..error_handler import CredentialNeedsReauthError
 
 lib_logger = logging.getLogger("rotator_library")
@@ -452,7 +453,7 @@ class GoogleOAuthBase:
             new_token_data = None
             last_error = None
 
-            async with httpx.AsyncClient() as client:
+            async with get_http_client() as client:
                 for attempt in range(max_retries):
                     try:
                         response = await client.post(
@@ -591,7 +592,7 @@ class GoogleOAuthBase:
 
             # [VALIDATION] Optional: Test that the refreshed token is actually usable
             try:
-                async with httpx.AsyncClient() as client:
+                async with get_http_client() as client:
                     test_response = await client.get(
                         self.USER_INFO_URI,
                         headers={"Authorization": f"Bearer {creds['access_token']}"},
@@ -1341,7 +1342,7 @@ class GoogleOAuthBase:
 
         # Fallback to API call if metadata is missing
         headers = {"Authorization": f"Bearer {creds['access_token']}"}
-        async with httpx.AsyncClient() as client:
+        async with get_http_client() as client:
             response = await client.get(self.USER_INFO_URI, headers=headers)
             response.raise_for_status()
             user_info = response.json()
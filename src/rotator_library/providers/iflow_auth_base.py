@@ -29,6 +29,7 @@ from rich.markup import escape as rich_escape
 from ..utils.headless_detection import is_headless_environment
 from ..utils.reauth_coordinator import get_reauth_coordinator
 from ..utils.resilient_io import safe_write_json
+from ..utils.shared_http import get_http_client
 from ..error_handler import CredentialNeedsReauthError
 
 lib_logger = logging.getLogger("rotator_library")
@@ -614,7 +615,7 @@ class IFlowAuthBase:
         url = f"{IFLOW_USER_INFO_ENDPOINT}?accessToken={access_token}"
         headers = {"Accept": "application/json"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with get_http_client(timeout=30.0) as client:
             response = await client.get(url, headers=headers)
             response.raise_for_status()
             result = response.json()
@@ -999,7 +1000,7 @@ class IFlowAuthBase:
                 "client_secret": IFLOW_CLIENT_SECRET,
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with get_http_client(timeout=30.0) as client:
                 for attempt in range(max_retries):
                     try:
                         response = await client.post(
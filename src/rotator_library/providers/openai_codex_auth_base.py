@@ -40,6 +40,7 @@ from ..utils.openai_codex_jwt import (
 )
 from ..utils.reauth_coordinator import get_reauth_coordinator
 from ..utils.resilient_io import safe_write_json
+from ..utils.shared_http import get_http_client
 
 lib_logger = logging.getLogger("rotator_library")
 
@@ -604,7 +605,7 @@ class OpenAICodexAuthBase:
             token_data = None
             last_error: Optional[Exception] = None
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with get_http_client(timeout=30.0) as client:
                 for attempt in range(max_retries):
                     try:
                         response = await client.post(
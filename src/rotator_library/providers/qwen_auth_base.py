@@ -28,6 +28,7 @@ from rich.markup import escape as rich_escape
 from ..utils.headless_detection import is_headless_environment
 from ..utils.reauth_coordinator import get_reauth_coordinator
 from ..utils.resilient_io import safe_write_json
+from ..utils.shared_http import get_http_client
 from ..error_handler import CredentialNeedsReauthError
 
 lib_logger = logging.getLogger("rotator_library")
@@ -366,7 +367,7 @@ class QwenAuthBase:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             }
 
-            async with httpx.AsyncClient() as client:
+            async with get_http_client() as client:
                 for attempt in range(max_retries):
                     try:
                         response = await client.post(
@@ -24,12 +24,14 @@ from .openai_codex_jwt import (
     AUTH_CLAIM,
     ACCOUNT_ID_CLAIM,
     decode_jwt_unverified,
+    decode_jwt_payloads_batch,
     extract_account_id_from_payload,
     extract_explicit_email_from_payload,
     extract_email_from_payload,
     extract_expiry_ms_from_payload,
 )
 from .suppress_litellm_warnings import suppress_litellm_serialization_warnings
+from .shared_http import get_http_client, shared_http_client
 
 __all__ = [
     "is_headless_environment",
@@ -49,9 +51,12 @@ __all__ = [
     "AUTH_CLAIM",
     "ACCOUNT_ID_CLAIM",
     "decode_jwt_unverified",
+    "decode_jwt_payloads_batch",
     "extract_account_id_from_payload",
     "extract_explicit_email_from_payload",
     "extract_email_from_payload",
     "extract_expiry_ms_from_payload",
     "suppress_litellm_serialization_warnings",
+    "get_http_client",
+    "shared_http_client",
 ]
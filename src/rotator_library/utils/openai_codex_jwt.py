@@ -8,34 +8,61 @@ They are only used for non-authoritative metadata extraction (account/email/exp)
 not for auth decisions.
 """
 
-import base64
+import binascii
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 AUTH_CLAIM = "https://api.openai.com/auth"
 ACCOUNT_ID_CLAIM = "https://api.openai.com/auth.chatgpt_account_id"
 
 
-def decode_jwt_unverified(token: str) -> Optional[Dict[str, Any]]:
-    """Decode JWT payload without signature verification."""
+# base64url -> standard base64 alphabet, for binascii.a2b_base64
+_URL_TO_STD = str.maketrans("-_", "+/")
+
+
+def _payload_segment(token: Any) -> Optional[str]:
+    """Return the padded, standard-alphabet payload segment of a JWT."""
     if not token or not isinstance(token, str):
         return None
 
-    parts = token.split(".")
+    parts = token.split(".", 2)
     if len(parts) < 2:
         return None
 
-    payload_segment = parts[1]
-    padding = "=" * (-len(payload_segment) % 4)
+    segment = parts[1]
+    return segment.translate(_URL_TO_STD) + "=" * (-len(segment) % 4)
 
+
+def _decode_segment(segment: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a prepared payload segment into a dict, or None."""
+    if segment is None:
+        return None
     try:
-        payload_bytes = base64.urlsafe_b64decode(payload_segment + padding)
-        payload = json.loads(payload_bytes.decode("utf-8"))
+        payload = json.loads(binascii.a2b_base64(segment).decode("utf-8"))
         return payload if isinstance(payload, dict) else None
     except Exception:
         return None
 
 
+def decode_jwt_unverified(token: str) -> Optional[Dict[str, Any]]:
+    """Decode JWT payload without signature verification."""
+    return _decode_segment(_payload_segment(token))
+
+
+def decode_jwt_payloads_batch(
+    tokens: Iterable[Optional[str]],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Decode many JWT payloads at once, preserving order.
+
+    Equivalent to mapping decode_jwt_unverified, but segments are prepared in
+    one pass and decoded straight through binascii, skipping the per-call
+    base64 module wrappers. Invalid tokens yield None.
+    """
+    segments = [_payload_segment(token) for token in tokens]
+    return [_decode_segment(segment) for segment in segments]
+
+
 def extract_account_id_from_payload(payload: Optional[Dict[str, Any]]) -> Optional[str]:
     """Extract account ID from known OpenAI Codex JWT claim locations."""
     if not payload:
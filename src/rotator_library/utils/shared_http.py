@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: LGPL-3.0-only
+# Copyright (c) 2026 Mirrowel
+
+# src/rotator_library/utils/shared_http.py
+
+"""
+Shared HTTP client scope for OAuth/auth calls.
+
+Auth providers normally open a short-lived httpx.AsyncClient per token
+refresh or user-info lookup. When many credentials are initialized at once
+(e.g. proxy startup), that means one connection pool and TLS handshake per
+call. Wrapping the fan-out in `shared_http_client()` publishes one client
+through a ContextVar; `get_http_client()` reuses it when present and falls
+back to a private client otherwise, so providers behave the same outside
+the scope.
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional, Union
+
+import httpx
+
+# Defaults for the shared client. The timeout matches the longest per-client
+# timeout used by the auth providers.
+DEFAULT_SHARED_TIMEOUT: float = 30.0
+DEFAULT_SHARED_MAX_CONNECTIONS: int = 100
+
+# Per-call default for get_http_client(): httpx's own default, which is what
+# callers that construct a bare httpx.AsyncClient() get
+DEFAULT_CALL_TIMEOUT: float = 5.0
+
+TimeoutTypes = Union[float, httpx.Timeout, None]
+
+_shared_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "rotator_shared_http_client", default=None
+)
+
+
+@asynccontextmanager
+async def shared_http_client(
+    timeout: float = DEFAULT_SHARED_TIMEOUT,
+    max_connections: int = DEFAULT_SHARED_MAX_CONNECTIONS,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Open one httpx.AsyncClient and share it with all auth calls in this context.
+
+    Tasks created inside the block (e.g. via asyncio.gather) inherit the
+    client. It is closed and unpublished when the block exits.
+    """
+    async with httpx.AsyncClient(
+        timeout=timeout, limits=httpx.Limits(max_connections=max_connections)
+    ) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+class _TimeoutBoundClient:
+    """
+    View of the shared client that applies one call site's timeout.
+
+    Request methods get `timeout` filled in unless the call passes its own;
+    everything else is delegated to the shared client untouched.
+    """
+
+    _REQUEST_METHODS = frozenset(
+        {
+            "request", "stream", "build_request",
+            "get", "post", "put", "patch", "delete", "head", "options",
+        }
+    )
+
+    def __init__(self, client: httpx.AsyncClient, timeout: TimeoutTypes):
+        self._client = client
+        self._timeout = timeout
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name not in self._REQUEST_METHODS:
+            return attr
+        timeout = self._timeout
+
+        def with_timeout(*args, **kwargs):
+            kwargs.setdefault("timeout", timeout)
+            return attr(*args, **kwargs)
+
+        return with_timeout
+
+
+@asynccontextmanager
+async def get_http_client(
+    timeout: TimeoutTypes = DEFAULT_CALL_TIMEOUT, **client_kwargs
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield the shared client if one is active, else a private short-lived one.
+
+    Args:
+        timeout: Applied to every request either way: as the private client's
+            timeout, or per request on the shared client.
+        **client_kwargs: Other httpx.AsyncClient options. A shared client's
+            configuration can't be changed per call, so these only apply to
+            the private client.
+    """
+    client = _shared_client.get()
+    if client is not None and not client.is_closed:
+        yield _TimeoutBoundClient(client, timeout)
+        return
+
+    async with httpx.AsyncClient(timeout=timeout, **client_kwargs) as client:
+        yield client
@@ -0,0 +1,171 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from rotator_library import credential_tool
+
+
+@pytest.fixture
+def env_file(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / ".env"
+    monkeypatch.setattr(credential_tool, "_get_env_file", lambda: path)
+    monkeypatch.setitem(credential_tool._ENV_CACHE, "stat", None)
+    return path
+
+
+def test_delete_keeps_other_lines_byte_for_byte(env_file: Path):
+    env_file.write_bytes(
+        b"# keys\r\n"
+        b"GEMINI_API_KEY_1=a\r\n"
+        b"GEMINI_API_KEY_2=b\r\n"
+        b"NOTE=caf\xc3\xa9\n"
+        b"OPENAI_API_KEY_1=c"
+    )
+
+    assert credential_tool._delete_api_key_from_env("GEMINI_API_KEY_2") is True
+    assert env_file.read_bytes() == (
+        b"# keys\r\n"
+        b"GEMINI_API_KEY_1=a\r\n"
+        b"NOTE=caf\xc3\xa9\n"
+        b"OPENAI_API_KEY_1=c"
+    )
+
+
+def test_delete_leaves_non_utf8_file_untouched(env_file: Path):
+    original = b"GEMINI_API_KEY_1=a\nLEGACY=caf\xe9\n"
+    env_file.write_bytes(original)
+
+    assert credential_tool._delete_api_key_from_env("GEMINI_API_KEY_1") is False
+    assert env_file.read_bytes() == original
+
+
+def test_batched_delete_writes_once_and_reports_missing(env_file: Path, monkeypatch):
+    env_file.write_text("A_API_KEY=1\nB_API_KEY=2\nC=3\n")
+    writes = []
+    real_write = credential_tool._write_env_lines
+    monkeypatch.setattr(
+        credential_tool,
+        "_write_env_lines",
+        lambda path, lines: writes.append(lines) or real_write(path, lines),
+    )
+
+    assert credential_tool._delete_api_keys_from_env(["A_API_KEY", "B_API_KEY"])
+    assert env_file.read_text() == "C=3\n"
+    assert len(writes) == 1
+
+    assert credential_tool._delete_api_keys_from_env(["C", "MISSING"]) is False
+    assert env_file.read_text() == ""
+
+
+def test_api_key_cache_returns_copies(env_file: Path):
+    env_file.write_text("GEMINI_API_KEY_1=a\n")
+
+    keys = credential_tool._get_api_keys_from_env()
+    keys["GEMINI"].append(("GEMINI_API_KEY_2", "injected"))
+
+    assert credential_tool._get_api_keys_from_env() == {
+        "GEMINI": [("GEMINI_API_KEY_1", "a")]
+    }
+
+
+def test_api_key_cache_sees_edits_with_unchanged_mtime(env_file: Path):
+    env_file.write_text("GEMINI_API_KEY_1=a\n")
+    st = env_file.stat()
+    assert credential_tool._get_api_keys_from_env() == {
+        "GEMINI": [("GEMINI_API_KEY_1", "a")]
+    }
+
+    env_file.write_text("GEMINI_API_KEY_1=a\nOPENAI_API_KEY_1=b\n")
+    os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert credential_tool._get_api_keys_from_env() == {
+        "GEMINI": [("GEMINI_API_KEY_1", "a")],
+        "OPENAI": [("OPENAI_API_KEY_1", "b")],
+    }
+
+
+def test_api_key_cache_invalidated_by_delete(env_file: Path):
+    env_file.write_text("GEMINI_API_KEY_1=a\nGEMINI_API_KEY_2=b\n")
+    assert len(credential_tool._get_api_keys_from_env()["GEMINI"]) == 2
+
+    assert credential_tool._delete_api_key_from_env("GEMINI_API_KEY_1")
+    assert credential_tool._ENV_CACHE["stat"] is None
+
+    assert credential_tool._get_api_keys_from_env() == {
+        "GEMINI": [("GEMINI_API_KEY_2", "b")]
+    }
+
+
+def test_bulk_edit_sets_and_deletes_in_one_write(env_file: Path, monkeypatch):
+    env_file.write_bytes(b"A_API_KEY=1\r\nB_API_BASE=old\r\nC=3")
+    writes = []
+    real_write = credential_tool._write_env_lines
+    monkeypatch.setattr(
+        credential_tool,
+        "_write_env_lines",
+        lambda path, lines: writes.append(lines) or real_write(path, lines),
+    )
+
+    credential_tool._bulk_edit_env(
+        deletes=["A_API_KEY"],
+        sets={"B_API_BASE": "https://x", "B_API_KEY_1": "it's a \\ key"},
+    )
+
+    assert len(writes) == 1
+    assert env_file.read_bytes() == (
+        b"B_API_BASE='https://x'\r\n"
+        b"C=3\r\n"
+        b"B_API_KEY_1='it\\'s a \\\\ key'\r\n"
+    )
+    # Values round-trip through dotenv exactly as set_key would write them
+    assert credential_tool.dotenv_values(env_file) == {
+        "B_API_BASE": "https://x",
+        "C": "3",
+        "B_API_KEY_1": "it's a \\ key",
+    }
+
+
+def test_bulk_edit_sets_creates_missing_file(env_file: Path):
+    credential_tool._bulk_edit_env(sets={"A_API_KEY_1": "k"})
+
+    assert env_file.read_text() == "A_API_KEY_1='k'\n"
+
+
+def test_oauth_summary_resolves_auth_on_caller_thread_and_logs_failures(
+    tmp_path: Path, monkeypatch, caplog
+):
+    import threading
+
+    monkeypatch.setattr(credential_tool, "_get_oauth_base_dir", lambda: tmp_path)
+    monkeypatch.setitem(credential_tool._OAUTH_CACHE, "key", None)
+    resolved_on = []
+
+    class _Auth:
+        def __init__(self, name):
+            self.name = name
+
+        def list_credentials(self, oauth_dir):
+            if self.name == "iflow":
+                raise RuntimeError("bad iflow file")
+            return [{"file_path": str(oauth_dir / f"{self.name}_oauth_1.json")}]
+
+    def fake_get_auth(name):
+        resolved_on.append(threading.current_thread())
+        if name == "qwen_code":
+            raise ImportError("half-initialised provider")
+        return _Auth(name)
+
+    monkeypatch.setattr(credential_tool, "_get_auth", fake_get_auth)
+
+    with caplog.at_level("WARNING", logger="rotator_library"):
+        summary = credential_tool._get_oauth_credentials_summary()
+
+    assert set(resolved_on) == {threading.current_thread()}
+    assert list(summary) == list(credential_tool.OAUTH_PROVIDERS)
+    assert summary["qwen_code"] == [] and summary["iflow"] == []
+    assert summary["gemini_cli"][0]["file_name"] == "gemini_cli_oauth_1.json"
+    assert "half-initialised provider" in caplog.text
+    assert "bad iflow file" in caplog.text
+    # A partial scan is not cached
+    assert credential_tool._OAUTH_CACHE["key"] is None
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import litellm
+import pytest
+
+from rotator_library.client.rotating_client import RotatingClient
+
+
+class _NoLock:
+    """Stand-in condition that fails if the unlimited path touches it."""
+
+    async def __aenter__(self):
+        raise AssertionError("admission lock taken while unlimited")
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _client(max_inflight=None) -> RotatingClient:
+    client = object.__new__(RotatingClient)
+    client._admit_counter = 0
+    client._admit_max = max_inflight
+    client._admit_cond = asyncio.Condition()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_unlimited_gate_skips_the_lock_but_keeps_count():
+    client = _client()
+    client._admit_cond = _NoLock()
+
+    await client._admit(time.time() + 1)
+    await client._admit(time.time() + 1)
+    assert client._admit_counter == 2
+
+    await client._release()
+    await client._release()
+    assert client._admit_counter == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_set_later_counts_requests_admitted_while_unlimited():
+    client = _client()
+    await client._admit(time.time() + 1)
+    await client._admit(time.time() + 1)
+
+    await client.set_max_inflight(2)
+    with pytest.raises(litellm.Timeout):
+        await client._admit(time.time() + 0.05)
+
+    waiter = asyncio.create_task(client._admit(time.time() + 1))
+    await asyncio.sleep(0)
+    await client._release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert client._admit_counter == 2
+
+    # Removing the limit wakes queued waiters
+    waiter = asyncio.create_task(client._admit(time.time() + 1))
+    await asyncio.sleep(0)
+    await client.set_max_inflight(None)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert client._admit_counter == 3
+
+
+@pytest.mark.asyncio
+async def test_model_discovery_bypasses_a_full_gate():
+    client = _client(max_inflight=1)
+    client._admit_counter = 1
+    client.all_credentials = {"openai": []}
+    client._model_list_cache = {}
+    client._inflight_model_fetches = {}
+
+    assert await asyncio.wait_for(client.get_available_models("openai"), timeout=1) == []
+    assert client._admit_counter == 1
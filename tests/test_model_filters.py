@@ -0,0 +1,72 @@
+import fnmatch
+
+import pytest
+
+from rotator_library.client.models import ModelResolver, _compile_filter
+
+
+def _resolver(ignore=None, whitelist=None) -> ModelResolver:
+    return ModelResolver({}, ignore_models=ignore, whitelist_models=whitelist)
+
+
+def test_compile_filter_splits_exact_names_from_globs():
+    exact, patterns, regex = _compile_filter(["gpt-4", "gpt-4o*", "*-preview", "o[13]"])
+
+    assert exact == frozenset({"gpt-4"})
+    assert patterns == ("gpt-4o*", "*-preview", "o[13]")
+    assert regex is not None
+    assert _compile_filter(["gpt-4"])[2] is None
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        ("openai/gpt-4", True),
+        ("gpt-4", True),
+        ("openai/gpt-4-turbo", False),
+        ("openai/gpt-4o", True),
+        ("openai/gpt-4o-mini", True),
+        ("openai/o1-preview", True),
+        ("openai/o1", True),
+        ("openai/o2", False),
+        ("openai/gpt-3.5", False),
+    ],
+)
+def test_blacklist_exact_names_and_globs(model, expected):
+    entries = ["gpt-4", "gpt-4o*", "*-preview", "o[13]"]
+    resolver = _resolver(ignore={"openai": entries})
+
+    assert resolver._is_blacklisted(model, "openai") is expected
+    # Same answer as checking every entry with fnmatch on both forms
+    name = model.split("/", 1)[1] if "/" in model else model
+    assert expected is any(
+        fnmatch.fnmatch(name, p) or fnmatch.fnmatch(model, p) for p in entries
+    )
+
+
+def test_filter_entries_can_match_the_provider_prefixed_string():
+    resolver = _resolver(ignore={"openai": ["openai/gpt-4", "openai/o*"]})
+
+    assert resolver._is_blacklisted("openai/gpt-4", "openai")
+    assert resolver._is_blacklisted("openai/o3", "openai")
+    assert not resolver._is_blacklisted("openai/gpt-4o", "openai")
+
+
+def test_match_all_and_provider_scoping():
+    resolver = _resolver(ignore={"gemini": ["*"]})
+
+    assert resolver._is_blacklisted("gemini/anything", "openai")
+    assert resolver._is_blacklisted("bare-name", "gemini")
+    assert not resolver._is_blacklisted("openai/gpt-4", "openai")
+
+
+def test_whitelist_takes_precedence_over_blacklist():
+    resolver = _resolver(
+        ignore={"openai": ["*"]},
+        whitelist={"openai": ["gpt-4o", "o4-*"]},
+    )
+
+    assert resolver.is_model_allowed("openai/gpt-4o", "openai")
+    assert resolver.is_model_allowed("openai/o4-mini", "openai")
+    assert not resolver.is_model_allowed("openai/gpt-4o-mini", "openai")
+    assert resolver.is_model_allowed("gemini/gemini-2.5-pro", "gemini")
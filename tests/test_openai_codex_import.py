@@ -3,6 +3,8 @@ import os
 import time
 from pathlib import Path
 
+import pytest
+
 from rotator_library.credential_manager import CredentialManager
 
 
@@ -215,3 +217,118 @@ def test_codex_source_files_never_modified_during_import(tmp_path: Path):
 
     assert auth_json.read_text() == auth_before
     assert accounts_json.read_text() == accounts_before
+
+
+def test_jwt_payloads_are_decoded_per_import_batch(tmp_path: Path, monkeypatch):
+    from rotator_library import credential_manager
+
+    decoded = []
+    real_batch = credential_manager.decode_jwt_payloads_batch
+    real_single = credential_manager.decode_jwt_unverified
+
+    def batch(tokens):
+        decoded.extend(tokens)
+        return real_batch(tokens)
+
+    def single(token):
+        decoded.append(token)
+        return real_single(token)
+
+    monkeypatch.setattr(credential_manager, "decode_jwt_payloads_batch", batch)
+    monkeypatch.setattr(credential_manager, "decode_jwt_unverified", single)
+
+    accounts_json = tmp_path / ".codex-accounts.json"
+    _write_codex_accounts_json(accounts_json)
+    missing_auth = tmp_path / ".codex" / "auth.json"
+
+    for run in (1, 2):
+        manager = CredentialManager(env_vars={}, oauth_dir=tmp_path / f"oauth_{run}")
+        imported = manager._import_openai_codex_cli_credentials(
+            auth_json_path=missing_auth,
+            accounts_json_path=accounts_json,
+        )
+        assert len(imported) == 2
+
+    # access == idToken per account: each distinct token decoded once per
+    # import, and nothing carried over into the second import
+    assert len(decoded) == 4
+    assert len(set(decoded)) == 2
+
+
+def _isolate_codex_sources(tmp_path: Path, monkeypatch):
+    from rotator_library import credential_manager
+
+    auth_json = tmp_path / "home" / ".codex" / "auth.json"
+    accounts_json = tmp_path / "home" / ".codex-accounts.json"
+    monkeypatch.setattr(credential_manager, "_DEFAULT_CODEX_AUTH_JSON", auth_json)
+    monkeypatch.setattr(credential_manager, "_DEFAULT_CODEX_ACCOUNTS_JSON", accounts_json)
+    monkeypatch.setitem(credential_manager._DISCOVERY_CACHE, "entry", None)
+    return auth_json, accounts_json
+
+
+def test_discovery_cache_reused_while_inputs_unchanged(tmp_path: Path, monkeypatch):
+    _isolate_codex_sources(tmp_path, monkeypatch)
+    manager = CredentialManager(env_vars={}, oauth_dir=tmp_path / "oauth_creds")
+    scans = []
+    real_scan = manager._scan_local_credentials
+    monkeypatch.setattr(
+        manager,
+        "_scan_local_credentials",
+        lambda providers: scans.append(providers) or real_scan(providers),
+    )
+
+    first = manager.discover_and_prepare()
+    first.setdefault("openai_codex", []).append("mutated")
+    second = manager.discover_and_prepare()
+
+    assert len(scans) == 1
+    assert "openai_codex" not in second
+
+
+def test_discovery_cache_invalidated_by_codex_login(tmp_path: Path, monkeypatch):
+    auth_json, _ = _isolate_codex_sources(tmp_path, monkeypatch)
+    manager = CredentialManager(env_vars={}, oauth_dir=tmp_path / "oauth_creds")
+
+    assert "openai_codex" not in manager.discover_and_prepare()
+
+    _write_codex_auth_json(auth_json)
+
+    assert len(manager.discover_and_prepare()["openai_codex"]) == 1
+
+
+def test_discovery_cache_invalidated_by_env_and_override_files(tmp_path: Path, monkeypatch):
+    _isolate_codex_sources(tmp_path, monkeypatch)
+    override = tmp_path / "gemini.json"
+    env_vars = {"GEMINI_CLI_OAUTH_1": str(override)}
+    manager = CredentialManager(env_vars=env_vars, oauth_dir=tmp_path / "oauth_creds")
+
+    # Override path set but the file does not exist yet
+    assert "gemini_cli" not in manager.discover_and_prepare()
+
+    override.write_text(json.dumps({"access_token": "at", "refresh_token": "rt"}))
+    assert len(manager.discover_and_prepare()["gemini_cli"]) == 1
+
+    env_vars["IFLOW_1_ACCESS_TOKEN"] = "token"
+    env_vars["IFLOW_1_REFRESH_TOKEN"] = "refresh"
+    assert manager.discover_and_prepare()["iflow"] == ["env://iflow/1"]
+
+
+def test_discovery_cache_shared_across_managers_per_directory(tmp_path: Path, monkeypatch):
+    auth_json, _ = _isolate_codex_sources(tmp_path, monkeypatch)
+    _write_codex_auth_json(auth_json)
+    oauth_dir = tmp_path / "oauth_creds"
+
+    first = CredentialManager(env_vars={}, oauth_dir=oauth_dir).discover_and_prepare()
+
+    second_manager = CredentialManager(env_vars={}, oauth_dir=oauth_dir)
+    monkeypatch.setattr(
+        second_manager,
+        "_scan_local_credentials",
+        lambda providers: pytest.fail("cached discovery should not rescan"),
+    )
+    assert second_manager.discover_and_prepare() == first
+
+    # A different credential directory is a different cache entry
+    other = CredentialManager(env_vars={}, oauth_dir=tmp_path / "other_creds")
+    other_config = other.discover_and_prepare()
+    assert other_config["openai_codex"] != first["openai_codex"]
@@ -0,0 +1,97 @@
+from proxy_app.streaming import SSE_DONE_EVENT, SSEParser, StreamAggregator
+
+
+def test_sse_parser_buffers_events_split_across_chunks():
+    parser = SSEParser()
+
+    assert parser.feed('data: {"a"') == []
+    assert parser.feed(": 1}\n") == []
+    assert parser.feed('\ndata: {"b": 2}\n\ndata: {"c"') == ['{"a": 1}', '{"b": 2}']
+    assert parser.feed(": 3}\n\n") == ['{"c": 3}']
+
+
+def test_sse_parser_handles_crlf_including_split_line_endings():
+    parser = SSEParser()
+
+    assert parser.feed('data: {"a": 1}\r\n\r\ndata: {"b": 2}\r') == ['{"a": 1}']
+    assert parser.feed("\n\r") == []
+    assert parser.feed("\n") == ['{"b": 2}']
+
+
+def test_sse_parser_joins_multiline_data_and_skips_non_data_fields():
+    parser = SSEParser()
+
+    payloads = parser.feed("event: message\nid: 7\ndata: line1\ndata:line2\n\n: ping\n\n")
+    assert payloads == ["line1\nline2"]
+
+
+def test_sse_parser_skips_done_sentinel():
+    parser = SSEParser()
+
+    assert parser.feed(SSE_DONE_EVENT) == []
+    assert parser.feed('data: {"a": 1}\n\n') == ['{"a": 1}']
+
+
+def _chunk(delta, finish_reason=None, **extra):
+    return {
+        "id": "chatcmpl-1",
+        "created": 1700000000,
+        "model": "openai/gpt-4o",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        **extra,
+    }
+
+
+def test_stream_aggregator_merges_tool_call_deltas_by_index():
+    aggregator = StreamAggregator()
+    aggregator.update(_chunk({"role": "assistant", "content": None}))
+    aggregator.update(
+        _chunk(
+            {
+                "tool_calls": [
+                    {"index": 0, "id": "call_a", "function": {"name": "get_", "arguments": ""}},
+                    {"index": 1, "id": "call_b", "function": {"name": "lookup", "arguments": '{"q"'}},
+                ]
+            }
+        )
+    )
+    aggregator.update(
+        _chunk({"tool_calls": [{"index": 0, "function": {"name": "weather", "arguments": '{"city":'}}]})
+    )
+    aggregator.update(
+        _chunk({"tool_calls": [{"index": 1, "function": {"arguments": ': "x"}'}}]})
+    )
+    aggregator.update(
+        _chunk({"tool_calls": [{"index": 0, "function": {"arguments": ' "Oslo"}'}}]}, finish_reason="stop")
+    )
+
+    response = aggregator.finalize()
+    choice = response["choices"][0]
+    assert choice["finish_reason"] == "tool_calls"
+    assert choice["message"]["content"] is None
+    assert choice["message"]["tool_calls"] == [
+        {"type": "function", "id": "call_a", "function": {"name": "get_weather", "arguments": '{"city": "Oslo"}'}},
+        {"type": "function", "id": "call_b", "function": {"name": "lookup", "arguments": '{"q": "x"}'}},
+    ]
+    assert aggregator.chunk_count == 5
+
+
+def test_stream_aggregator_joins_content_and_keeps_header_and_usage():
+    aggregator = StreamAggregator()
+    aggregator.update(_chunk({"role": "assistant", "content": "Hel"}))
+    aggregator.update(_chunk({"content": "lo", "reasoning_content": "th"}))
+    aggregator.update(_chunk({"reasoning_content": "ink"}, finish_reason="stop"))
+    usage = {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+    aggregator.update({"id": "other", "choices": [], "usage": usage})
+
+    response = aggregator.finalize()
+    assert response["id"] == "chatcmpl-1"
+    assert response["model"] == "openai/gpt-4o"
+    assert response["object"] == "chat.completion"
+    assert response["usage"] == usage
+    message = response["choices"][0]["message"]
+    assert message["content"] == "Hello"
+    assert message["reasoning_content"] == "think"
+    assert message["tool_calls"] is None
+    assert message["function_call"] is None
+    assert response["choices"][0]["finish_reason"] == "stop"
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+import respx
+
+from rotator_library.utils.shared_http import get_http_client, shared_http_client
+
+
+def _read_timeouts(route) -> list:
+    return [call.request.extensions["timeout"]["read"] for call in route.calls]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_per_call_timeout_applies_to_shared_client():
+    route = respx.post("https://auth.example/token").mock(
+        return_value=httpx.Response(200, json={})
+    )
+
+    async with shared_http_client(timeout=30.0) as shared:
+        async with get_http_client() as client:
+            await client.post("https://auth.example/token")
+        async with get_http_client(timeout=12.0) as client:
+            await client.post("https://auth.example/token")
+            # An explicit per-request timeout still wins
+            await client.post("https://auth.example/token", timeout=1.0)
+            assert client.is_closed is shared.is_closed
+        # The shared client itself keeps its own default
+        await shared.post("https://auth.example/token")
+
+    assert _read_timeouts(route) == [5.0, 12.0, 1.0, 30.0]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_private_client_uses_the_same_timeouts():
+    route = respx.get("https://auth.example/userinfo").mock(
+        return_value=httpx.Response(200, json={})
+    )
+
+    async with get_http_client() as client:
+        await client.get("https://auth.example/userinfo")
+    async with get_http_client(timeout=30.0) as client:
+        await client.get("https://auth.example/userinfo")
+
+    assert _read_timeouts(route) == [5.0, 30.0]
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from proxy_app import startup
+from rotator_library import credential_manager, model_info_service
+
+
+class _FakeService:
+    def __init__(self):
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _fail_discovery(monkeypatch):
+    async def boom(self):
+        await asyncio.sleep(0)
+        raise RuntimeError("discovery failed")
+
+    monkeypatch.setattr(
+        credential_manager.CredentialManager, "adiscover_and_prepare", boom
+    )
+    monkeypatch.setattr(
+        credential_manager.CredentialManager, "__init__", lambda self, env_vars: None
+    )
+
+
+@pytest.mark.asyncio
+async def test_lifespan_failure_cancels_pending_model_info_task(tmp_path, monkeypatch):
+    _fail_discovery(monkeypatch)
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_init(cache_file):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(model_info_service, "init_model_info_service", slow_init)
+
+    with pytest.raises(RuntimeError, match="discovery failed"):
+        async with startup.lifespan(object(), data_dir=tmp_path):
+            pass
+
+    assert started.is_set()
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_failure_stops_already_started_model_info_service(tmp_path, monkeypatch):
+    _fail_discovery(monkeypatch)
+    service = _FakeService()
+
+    async def fast_init(cache_file):
+        return service
+
+    async def slow_discovery(self):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("discovery failed")
+
+    monkeypatch.setattr(model_info_service, "init_model_info_service", fast_init)
+    monkeypatch.setattr(
+        credential_manager.CredentialManager, "adiscover_and_prepare", slow_discovery
+    )
+
+    with pytest.raises(RuntimeError, match="discovery failed"):
+        async with startup.lifespan(object(), data_dir=tmp_path):
+            pass
+
+    assert service.stopped
@@ -0,0 +1,69 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from proxy_app import startup
+
+
+@pytest.fixture(autouse=True)
+def _clear_metadata_cache():
+    startup._METADATA_CACHE.clear()
+    yield
+    startup._METADATA_CACHE.clear()
+
+
+def _write_credential(path: Path, email: str) -> None:
+    path.write_text(json.dumps({"_proxy_metadata": {"email": email}}))
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_reading_and_keeps_only_the_email(tmp_path: Path, monkeypatch):
+    cred = tmp_path / "cred.json"
+    _write_credential(cred, "a@example.com")
+    reads = []
+    real_read = startup._read_json_file
+
+    async def counting_read(path):
+        reads.append(path)
+        return await real_read(path)
+
+    monkeypatch.setattr(startup, "_read_json_file", counting_read)
+
+    assert await startup._read_credential_email(str(cred)) == "a@example.com"
+    assert await startup._read_credential_email(str(cred)) == "a@example.com"
+
+    assert len(reads) == 1
+    assert list(startup._METADATA_CACHE.values()) == ["a@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_rewrite_within_same_mtime_is_detected_by_size(tmp_path: Path):
+    cred = tmp_path / "cred.json"
+    _write_credential(cred, "a@example.com")
+    stat = cred.stat()
+
+    email = await startup._read_credential_email(str(cred))
+    assert email == "a@example.com"
+
+    # Same mtime, different content length
+    _write_credential(cred, "longer-address@example.com")
+    os.utime(cred, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    email = await startup._read_credential_email(str(cred))
+    assert email == "longer-address@example.com"
+
+
+def test_invalid_oauth_init_concurrency_falls_back_to_default(monkeypatch, caplog):
+    monkeypatch.setenv("OAUTH_INIT_CONCURRENCY", "eight")
+    with caplog.at_level("WARNING"):
+        assert startup._oauth_init_concurrency() == startup.OAUTH_INIT_CONCURRENCY
+    assert "Invalid OAUTH_INIT_CONCURRENCY" in caplog.text
+
+    monkeypatch.setenv("OAUTH_INIT_CONCURRENCY", "0")
+    assert startup._oauth_init_concurrency() == 1
+    monkeypatch.setenv("OAUTH_INIT_CONCURRENCY", "3")
+    assert startup._oauth_init_concurrency() == 3
+    monkeypatch.delenv("OAUTH_INIT_CONCURRENCY")
+    assert startup._oauth_init_concurrency() == 8
@@ -0,0 +1,39 @@
+import pytest
+
+from rotator_library.client.rotating_client import RotatingClient, _estimate_tokens
+
+
+def test_estimate_tokens_from_text():
+    assert _estimate_tokens("a" * 40, None) == 10
+    assert _estimate_tokens(None, None) == 0
+
+
+def test_estimate_tokens_from_string_content():
+    messages = [
+        {"role": "system", "content": "a" * 20},
+        {"role": "user", "content": "b" * 21},
+    ]
+    assert _estimate_tokens(None, messages) == 10
+
+
+def test_estimate_tokens_counts_only_text_parts_of_multimodal_content():
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "a" * 16},
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64,xx"}},
+                {"type": "text", "text": "b" * 8},
+            ],
+        },
+        {"role": "assistant", "content": None},
+        "not-a-message",
+    ]
+    assert _estimate_tokens(None, messages) == 6
+
+
+def test_token_count_rejects_unknown_mode():
+    client = object.__new__(RotatingClient)
+    with pytest.raises(ValueError, match="Unknown token count mode"):
+        client.token_count(mode="bogus", model="openai/gpt-4o", text="hi")
+    assert client.token_count(mode="estimate", model="openai/gpt-4o", text="a" * 8) == 2